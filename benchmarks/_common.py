@@ -0,0 +1,20 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import timeit
+from typing import Callable
+
+
+def bench(label: str, func: Callable[[], object], number: int = 10_000, repeat: int = 5) -> float:
+    """Print and return the best time per call of the ``func`` in nanoseconds."""
+
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    ns_per_call = best / number * 1e9
+    print(f"{label:<48s} {ns_per_call:>14,.1f} ns/call")
+
+    return ns_per_call
+
+
+def print_header(title: str) -> None:
+    print(f"\n## {title}")
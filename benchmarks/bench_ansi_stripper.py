@@ -0,0 +1,51 @@
+"""
+Throughput of AnsiEscapeStripper/AnsiEscapeStrippedReader for a colored CI log
+vs. one-shot replace_ansi_escape over the whole log.
+
+Usage:
+    python -m benchmarks.bench_ansi_stripper
+"""
+
+import io
+import time
+
+from pathvalidate import AnsiEscapeStrippedReader, AnsiEscapeStripper, replace_ansi_escape
+
+from ._common import print_header
+
+
+_LINE = "\x1b[32m[ OK ]\x1b[0m tests/test_sample.py::test_case \x1b[1mPASSED\x1b[0m 42%\n"
+_LOG = (_LINE * (64 * 1024 * 1024 // len(_LINE))).encode("utf-8")
+_CHUNK_SIZE = 64 * 1024
+
+
+def report(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48s} {len(_LOG) / elapsed / 1024**2:>14,.1f} MiB/s")
+
+
+def main() -> None:
+    print_header(f"{len(_LOG) / 1024**2:.0f} MiB log, {_CHUNK_SIZE // 1024:d} KiB chunks")
+
+    report("replace_ansi_escape (one-shot)", lambda: replace_ansi_escape(_LOG.decode("utf-8")))
+
+    def run_stripper() -> None:
+        stripper = AnsiEscapeStripper()
+        chunks = (_LOG[i : i + _CHUNK_SIZE] for i in range(0, len(_LOG), _CHUNK_SIZE))
+        for _ in stripper.iter_stripped(chunks):
+            pass
+
+    report("AnsiEscapeStripper", run_stripper)
+
+    def run_reader() -> None:
+        with AnsiEscapeStrippedReader(io.BytesIO(_LOG)) as reader:
+            for _ in reader:
+                pass
+
+    report("AnsiEscapeStrippedReader, line by line", run_reader)
+
+
+if __name__ == "__main__":
+    main()
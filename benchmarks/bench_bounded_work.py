@@ -0,0 +1,54 @@
+"""
+Per-call cost of the validators/sanitizers for hostile oversized inputs,
+with and without the bounded-work mode.
+In the bounded-work mode, the cost must not grow with the size of an input:
+compare the results of the 1 MB and the 10 MB inputs.
+
+Usage:
+    python -m benchmarks.bench_bounded_work
+"""
+
+from collections.abc import Callable
+
+from pathvalidate import FileNameSanitizer, FileNameValidator, FilePathSanitizer, FilePathValidator
+
+from ._common import bench, print_header
+
+
+def _make_inputs(size: int) -> dict[str, str]:
+    return {
+        "ASCII": "a" * size,
+        "separators": "a/" * (size // 2),
+        "invalid chars": "\0" * size,
+        "whitespaces": " " * size,
+    }
+
+
+def main() -> None:
+    engines: dict[str, Callable[[bool], Callable[[str], object]]] = {
+        "FileNameValidator.check": lambda bounded: (
+            FileNameValidator(platform="universal", bounded_work=bounded).check
+        ),
+        "FilePathValidator.check": lambda bounded: (
+            FilePathValidator(platform="universal", bounded_work=bounded).check
+        ),
+        "FileNameSanitizer.sanitize": lambda bounded: (
+            FileNameSanitizer(platform="universal", bounded_work=bounded).sanitize
+        ),
+        "FilePathSanitizer.sanitize": lambda bounded: (
+            FilePathSanitizer(platform="universal", bounded_work=bounded).sanitize
+        ),
+    }
+
+    for size in (1_000_000, 10_000_000):
+        for input_name, value in _make_inputs(size).items():
+            print_header(f"{input_name}: {size:,d} characters")
+            for engine_name, make_engine in engines.items():
+                for bounded in (False, True):
+                    func = make_engine(bounded)
+                    label = f"{engine_name} ({'bounded' if bounded else 'default'})"
+                    bench(label, lambda func=func, value=value: func(value), number=1)
+
+
+if __name__ == "__main__":
+    main()
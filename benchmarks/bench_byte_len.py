@@ -0,0 +1,28 @@
+"""
+Per-call cost of FileNameValidator.check and FileNameSanitizer.sanitize for oversized
+names in UTF-8: the byte length check gives up as soon as a name is known to be too long,
+instead of encoding the whole name.
+
+Usage:
+    python -m benchmarks.bench_byte_len
+"""
+
+from pathvalidate import FileNameSanitizer, FileNameValidator
+
+from ._common import bench, print_header
+
+
+def main() -> None:
+    validator = FileNameValidator(platform="linux", fs_encoding="utf-8")
+    sanitizer = FileNameSanitizer(platform="linux", fs_encoding="utf-8")
+
+    for size in (1_000, 1_000_000, 10_000_000):
+        for label, name in (("ASCII", "a" * size), ("non-ASCII", "あ" * size)):
+            print_header(f"{label}: {size:,d} characters")
+            bench("check", lambda name=name: validator.check(name), number=10)
+            bench("encode (reference)", lambda name=name: name.encode("utf-8"), number=10)
+            bench("sanitize", lambda name=name: sanitizer.sanitize(name), number=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-call cost of the replacement of invalid characters: regular expression vs. translation tables.
+
+Usage:
+    python -m benchmarks.bench_char_replacer
+"""
+
+from functools import partial
+
+from pathvalidate import sanitize_filename
+from pathvalidate._base import BaseFile
+from pathvalidate._replacer import CharReplacer
+
+from ._common import bench, print_header
+
+
+_VALUES = {
+    "short": "report.txt",
+    "short, invalid chars": "re:po?rt.txt",
+    "long": "a" * 200 + ".txt",
+    "long, invalid chars": "ab:cd?" * 40,
+    "non-ASCII": "新しいフォルダー" * 5 + ".txt",
+    "non-ASCII, invalid chars": "新しい:フォルダー?" * 5,
+}
+
+
+def main() -> None:
+    replacer = CharReplacer(BaseFile._INVALID_WIN_FILENAME_CHARS)
+    regexp = replacer.regexp
+
+    for replacement_text in ("", "_"):
+        for label, value in _VALUES.items():
+            print_header(f"{label} ({len(value):d} chars), replacement_text={replacement_text!r}")
+            before = bench("re.sub", partial(regexp.sub, replacement_text, value), 50_000)
+            after = bench(
+                "CharReplacer.sub", partial(replacer.sub, replacement_text, value), 50_000
+            )
+            print(f"speedup: {before / after:.1f}x")
+
+    print_header("sanitize_filename")
+    for label, value in _VALUES.items():
+        bench(label, lambda value=value: sanitize_filename(value, "_", platform="universal"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Per-name cost of FileNameValidator.check for already-clean names, which are accepted by
+the fast acceptance check, and for invalid names, which go through the detailed checks.
+
+Usage:
+    python -m benchmarks.bench_fast_path
+"""
+
+from pathvalidate import FileNameValidator
+
+from ._common import bench, print_header
+
+
+def main() -> None:
+    num_names = 10_000
+    clean_names = [f"report_{i:05d}.txt" for i in range(num_names)]
+    invalid_names = [f"report/{i:05d}?.txt " for i in range(num_names)]
+
+    for platform in ("linux", "windows", "universal"):
+        validator = FileNameValidator(platform=platform, fast_path_stats=True)
+
+        def check_all(names: list[str], validator: FileNameValidator = validator) -> None:
+            check = validator.check
+            for name in names:
+                check(name)
+
+        print_header(f"{platform}: {num_names:d} names")
+        bench("clean names", lambda: check_all(clean_names), number=1)
+        bench("invalid names", lambda: check_all(invalid_names), number=1)
+        print(f"fast path: {validator.fast_path_info()}")
+
+
+if __name__ == "__main__":
+    main()
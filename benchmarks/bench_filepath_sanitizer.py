@@ -0,0 +1,67 @@
+"""
+Per-path cost of FilePathSanitizer.sanitize by the depth of the path.
+
+Usage:
+    python -m benchmarks.bench_filepath_sanitizer
+"""
+
+import os.path
+
+from pathvalidate import FileNameValidator, FilePathSanitizer, FilePathValidator
+from pathvalidate._common import truncate_str
+
+from ._common import bench, print_header
+
+
+def _make_multipass_sanitize(platform: str):  # type: ignore
+    # how a path was sanitized before the passes were fused:
+    # a filename-level substitution, a truncation and a full check per component,
+    # then a full check of the joined path
+    sanitizer = FilePathSanitizer(platform=platform)
+    path_validator = FilePathValidator(platform=platform)
+    fname_validator = FileNameValidator(platform=platform)
+    path_regexp = sanitizer._get_sanitize_regexp()
+    fname_regexp = sanitizer._FilePathSanitizer__fname_sanitizer._sanitize_regexp  # type: ignore
+    encoding = sanitizer._fs_encoding
+
+    def sanitize(value: str) -> str:
+        path = os.path.normpath(path_regexp.sub("", value))
+        entries = []
+        for entry in path.replace("\\", "/").split("/"):
+            entry = truncate_str(fname_regexp.sub("", entry), encoding, 255)
+            fname_validator.check(entry)
+            entries.append(entry)
+
+        sanitized_path = "/".join(entries)
+        path_validator.check(sanitized_path)
+
+        return sanitized_path
+
+    return sanitize
+
+
+def main() -> None:
+    for platform in ("linux", "universal"):
+        sanitizer = FilePathSanitizer(platform=platform)
+        multipass_sanitize = _make_multipass_sanitize(platform)
+
+        for depth in (1, 5, 20, 100):
+            path = "/".join(f"dir{i:d}" for i in range(depth - 1)) + "/sample.txt"
+            number = max(20_000 // depth, 200)
+
+            print_header(f"{platform}: {depth:d} components ({len(path):d} chars)")
+            before = bench(
+                "multi-pass per component",
+                lambda multipass_sanitize=multipass_sanitize, path=path: multipass_sanitize(path),
+                number,
+            )
+            after = bench(
+                "FilePathSanitizer.sanitize",
+                lambda sanitizer=sanitizer, path=path: sanitizer.sanitize(path),
+                number,
+            )
+            print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
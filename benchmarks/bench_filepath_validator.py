@@ -0,0 +1,60 @@
+"""
+Per-path cost of FilePathValidator.validate by the number of components of the path.
+
+Usage:
+    python -m benchmarks.bench_filepath_validator
+"""
+
+from pathvalidate import FileNameValidator, FilePathValidator
+from pathvalidate._filepath import _get_invalid_path_regexp
+
+from ._common import bench, print_header
+
+
+def _make_revalidate(validator: FilePathValidator):  # type: ignore
+    # how a path was validated before the single scan:
+    # a full filename check per component and another scan of the whole path
+    fname_validator = FileNameValidator(platform=validator.platform, max_len=validator.max_len)
+    path_regexp = _get_invalid_path_regexp(validator._is_windows(include_universal=True))
+    encoding = validator._fs_encoding
+
+    def revalidate(value: str) -> None:
+        len(value.encode(encoding))
+        validator._check_reserved_keywords(value)
+
+        value = value.replace("\\", "/")
+        for entry in value.split("/"):
+            if entry and entry not in (".", ".."):
+                fname_validator.validate(entry)
+
+        path_regexp.search(value)
+
+    return revalidate
+
+
+def main() -> None:
+    for platform in ("linux", "universal"):
+        validator = FilePathValidator(platform=platform)
+        revalidate = _make_revalidate(validator)
+
+        for depth in (5, 20, 100):
+            # short components: 100 components must fit the 260 bytes limit of Windows
+            path = "/".join(chr(ord("a") + i % 26) for i in range(depth - 1)) + "/sample.txt"
+            number = max(20_000 // depth, 200)
+
+            print_header(f"{platform}: {depth:d} components ({len(path):d} chars)")
+            before = bench(
+                "per-component revalidation",
+                lambda revalidate=revalidate, path=path: revalidate(path),
+                number,
+            )
+            after = bench(
+                "FilePathValidator.validate",
+                lambda validator=validator, path=path: validator.validate(path),
+                number,
+            )
+            print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Per-call cost of the boolean checks vs. the raising validators
+for clean texts and for texts with an invalid character at the start of a long text.
+
+Usage:
+    python -m benchmarks.bench_has_symbol
+"""
+
+from pathvalidate import (
+    ValidationError,
+    has_symbol,
+    is_valid_ltsv_label,
+    validate_ltsv_label,
+    validate_symbol,
+)
+
+from ._common import bench, print_header
+
+
+_VALUES = {
+    "clean": "columnName1",
+    "clean, long": "a" * 1_000,
+    "invalid char first, long": "!" + "a!" * 500,
+}
+
+
+def is_valid(validate, value: str) -> bool:
+    try:
+        validate(value)
+    except ValidationError:
+        return False
+
+    return True
+
+
+def main() -> None:
+    for label, value in _VALUES.items():
+        print_header(f"{label} ({len(value):d} chars)")
+        bench("validate_symbol", lambda value=value: is_valid(validate_symbol, value))
+        bench("has_symbol", lambda value=value: has_symbol(value))
+        bench("validate_ltsv_label", lambda value=value: is_valid(validate_ltsv_label, value))
+        bench("is_valid_ltsv_label", lambda value=value: is_valid_ltsv_label(value))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Lines per second of LTSVReader for an access log with 30 labels per line,
+vs. splitting the lines and calling sanitize_ltsv_label for every label.
+
+Usage:
+    python -m benchmarks.bench_ltsv
+"""
+
+import time
+
+from pathvalidate import LTSVReader, sanitize_ltsv_label
+
+from ._common import print_header
+
+
+_LABELS = [f"label{i:02d}" for i in range(28)] + ["host", "req time"]
+_LINE = "\t".join(f"{label}:value{i:d}" for i, label in enumerate(_LABELS)) + "\n"
+_NUM_LINES = 100_000
+_DATA = (_LINE * _NUM_LINES).encode("utf-8")
+
+
+def parse_naive(data: bytes) -> None:
+    for line in data.decode("utf-8").splitlines():
+        record = {}
+        for field in line.split("\t"):
+            label, _, value = field.partition(":")
+            record[sanitize_ltsv_label(label)] = value
+
+
+def parse_reader(data: bytes) -> None:
+    for _ in LTSVReader(data):
+        pass
+
+
+def report(label: str, func) -> None:
+    start = time.perf_counter()
+    func(_DATA)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48s} {_NUM_LINES / elapsed:>14,.0f} lines/s")
+
+
+def main() -> None:
+    print_header(f"{_NUM_LINES:,d} lines, {len(_LABELS):d} labels per line")
+    report("sanitize_ltsv_label per field", parse_naive)
+    report("LTSVReader", parse_reader)
+
+
+if __name__ == "__main__":
+    main()
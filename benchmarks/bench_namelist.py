@@ -0,0 +1,84 @@
+"""
+Entries per second of NameListValidator/NameListSanitizer for a memory-mapped list of
+file paths, vs. decoding and validating every entry.
+
+Usage:
+    python -m benchmarks.bench_namelist [--entries 1000000]
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from pathvalidate import FilePathSanitizer, FilePathValidator, NameListSanitizer, NameListValidator
+
+from ._common import print_header
+
+
+def make_list(num_entries: int) -> bytes:
+    entries = []
+    for i in range(num_entries):
+        if i % 1000 == 0:
+            entries.append(f"src/data/ファイル?{i:d}.txt")  # needs the validator
+        else:
+            entries.append(f"src/module_{i % 97:d}/file_{i:d}.py")
+
+    return ("\0".join(entries) + "\0").encode("utf-8")
+
+
+def validate_naive(path: str, validator: FilePathValidator) -> list[int]:
+    offsets = []
+    offset = 0
+    with open(path, "rb") as f:
+        for entry in f.read().split(b"\0")[:-1]:
+            if validator.check(entry.decode("utf-8")) is not None:
+                offsets.append(offset)
+            offset += len(entry) + 1
+
+    return offsets
+
+
+def report(label: str, num_entries: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<48s} {num_entries / elapsed:>14,.0f} entries/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    options = parser.parse_args()
+
+    validator = FilePathValidator(platform="windows")
+    list_validator = NameListValidator(validator, delimiter="\0")
+    list_sanitizer = NameListSanitizer(FilePathSanitizer(platform="linux"), delimiter="\0")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "manifest.bin")
+        with open(path, "wb") as f:
+            f.write(make_list(options.entries))
+
+        print_header(f"{options.entries:,d} entries, {os.path.getsize(path) / 1024**2:.1f} MiB")
+        assert list(list_validator.find_invalid(path)) == validate_naive(path, validator)
+
+        report(
+            "decode and check every entry", options.entries, lambda: validate_naive(path, validator)
+        )
+        report(
+            "NameListValidator.find_invalid",
+            options.entries,
+            lambda: list_validator.find_invalid(path),
+        )
+        report(
+            "NameListSanitizer.sanitize_to",
+            options.entries,
+            lambda: list_sanitizer.sanitize_to(path, io.BytesIO()),
+        )
+        print(list_validator.fast_path_info())
+
+
+if __name__ == "__main__":
+    main()
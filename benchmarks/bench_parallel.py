@@ -0,0 +1,49 @@
+"""
+Throughput of sanitize_parallel compared to a single process.
+
+Usage:
+    python -m benchmarks.bench_parallel [NUM_PATHS]
+"""
+
+import os
+import sys
+import time
+
+from pathvalidate import FilePathSanitizer
+from pathvalidate.parallel import sanitize_parallel
+
+from ._common import print_header
+
+
+def _make_paths(num_paths: int) -> list[str]:
+    return [f"archive/{i % 97:02d}/{i % 13}/fi:le*{i}?.tar.gz" for i in range(num_paths)]
+
+
+def main() -> None:
+    num_paths = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    paths = _make_paths(num_paths)
+    sanitizer = FilePathSanitizer(platform="windows")
+
+    print_header(f"sanitize {num_paths:,d} paths")
+
+    start = time.perf_counter()
+    expected = [sanitizer.sanitize(path) for path in paths]
+    serial = time.perf_counter() - start
+    print(f"{'serial':<24s} {num_paths / serial:>14,.0f} paths/s")
+
+    max_workers = 1
+    while max_workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        results = list(sanitize_parallel(paths, sanitizer, max_workers=max_workers))
+        elapsed = time.perf_counter() - start
+        assert results == expected
+
+        print(
+            f"{f'{max_workers} worker(s)':<24s} {num_paths / elapsed:>14,.0f} paths/s"
+            f" ({serial / elapsed:.1f}x)"
+        )
+        max_workers *= 2
+
+
+if __name__ == "__main__":
+    main()
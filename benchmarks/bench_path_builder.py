@@ -0,0 +1,46 @@
+"""
+Cost of building a path component by component, validating every level.
+
+Usage:
+    python -m benchmarks.bench_path_builder
+"""
+
+from pathvalidate import PathBuilder, validate_filepath
+
+from ._common import bench, print_header
+
+
+def _build_with_validate_filepath(depth: int) -> str:
+    # validate the whole path at each level: quadratic in the depth
+    path = "root"
+    for i in range(depth):
+        path = f"{path}/d{i:d}"
+        validate_filepath(path, platform="linux")
+
+    return path
+
+
+def _build_with_path_builder(depth: int) -> str:
+    path = PathBuilder("root", platform="linux")
+    for i in range(depth):
+        path = path / f"d{i:d}"
+
+    return str(path)
+
+
+def main() -> None:
+    for depth in (10, 50, 200):
+        number = max(2_000 // depth, 5)
+
+        print_header(f"build a path of {depth:d} components")
+        before = bench(
+            "validate_filepath per level",
+            lambda depth=depth: _build_with_validate_filepath(depth),
+            number,
+        )
+        after = bench("PathBuilder", lambda depth=depth: _build_with_path_builder(depth), number)
+        print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Per-path cost of FilePathValidator.validate with/without the directory prefix cache,
+for paths that share a small number of directory prefixes.
+
+Usage:
+    python -m benchmarks.bench_prefix_cache
+"""
+
+import itertools
+
+from pathvalidate import FilePathValidator
+
+from ._common import bench, print_header
+
+
+def _make_paths(num_paths: int) -> list[str]:
+    prefixes = [
+        f"tenant{tenant:d}/2024/{month:02d}/{day:02d}"
+        for tenant, month, day in itertools.product(range(4), range(1, 3), range(1, 29))
+    ]
+
+    return [f"{prefixes[i % len(prefixes)]}/file_{i:d}.txt" for i in range(num_paths)]
+
+
+def main() -> None:
+    paths = _make_paths(10_000)
+
+    for platform in ("linux", "universal"):
+        validator = FilePathValidator(platform=platform)
+        cached_validator = FilePathValidator(platform=platform, prefix_cache_size=1024)
+
+        def validate_all(validator: FilePathValidator) -> None:
+            for path in paths:
+                validator.validate(path)
+
+        print_header(f"{platform}: {len(paths):d} paths, 224 directory prefixes")
+        before = bench(
+            "without prefix cache", lambda validator=validator: validate_all(validator), number=1
+        )
+        after = bench(
+            "with prefix cache",
+            lambda validator=cached_validator: validate_all(validator),
+            number=1,
+        )
+        print(f"speedup: {before / after:.1f}x")
+        print(f"cache: {cached_validator.prefix_cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Per-name cost of the reserved name lookup.
+
+Usage:
+    python -m benchmarks.bench_reserved_keywords
+"""
+
+from pathvalidate import FileNameValidator, FilePathValidator
+
+from ._common import bench, print_header
+
+
+def _rebuild_reserved_keywords(validator: FileNameValidator) -> tuple[str, ...]:
+    # how the reserved name table was built on every access before it was precomputed
+    return tuple(
+        sorted(
+            set(
+                validator._additional_reserved_names
+                + FileNameValidator._WINDOWS_RESERVED_FILE_NAMES
+                + FileNameValidator._MACOS_RESERVED_FILE_NAMES
+            )
+        )
+    )
+
+
+def main() -> None:
+    validator = FileNameValidator(platform="universal", additional_reserved_names=["abc"])
+
+    for name in ("sample", "COM1"):
+        print_header(f"reserved name lookup: {name!r}")
+        before = bench(
+            "rebuild table per lookup",
+            lambda name=name: name.upper() in _rebuild_reserved_keywords(validator),
+            number=100_000,
+        )
+        after = bench(
+            "precomputed frozenset",
+            lambda name=name: validator._is_reserved_keyword(name),
+            number=100_000,
+        )
+        print(f"saving per lookup: {before - after:,.1f} ns ({before / after:.1f}x)")
+
+    print_header("validate a name (two lookups per name)")
+    bench("FileNameValidator.validate", lambda: validator.validate("sample.txt"))
+    path_validator = FilePathValidator(platform="universal")
+    bench(
+        "FilePathValidator.validate (5 components)",
+        lambda: path_validator.validate("a/b/c/d/sample.txt"),
+    )
+
+
+if __name__ == "__main__":
+    main()
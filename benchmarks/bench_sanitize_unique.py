@@ -0,0 +1,57 @@
+"""
+Cost of FileNameSanitizer.sanitize_unique for a batch of inputs that are sanitized to
+the same filename, compared with probing the numbers from 2 on every collision.
+
+Usage:
+    python -m benchmarks.bench_sanitize_unique
+"""
+
+from pathvalidate import FileNameSanitizer, NameIndex
+
+from ._common import bench, print_header
+
+
+def sanitize_unique_batch(sanitizer: FileNameSanitizer, values: list[str]) -> list[str]:
+    index = NameIndex()
+
+    return [sanitizer.sanitize_unique(value, index) for value in values]
+
+
+def sanitize_unique_naive(sanitizer: FileNameSanitizer, values: list[str]) -> list[str]:
+    issued: set[str] = set()
+    results = []
+
+    for value in values:
+        filename = sanitizer.sanitize(value)
+        num = 1
+        candidate = filename
+        while candidate in issued:
+            num += 1
+            candidate = sanitizer._make_numbered_name(filename, num)
+        issued.add(candidate)
+        results.append(candidate)
+
+    return results
+
+
+def main() -> None:
+    sanitizer = FileNameSanitizer(platform="windows")
+
+    for size in (100, 1_000, 2_000):
+        values = [f"report{':?*'[i % 3]}.txt" for i in range(size)]
+
+        print_header(f"{size:,d} inputs sanitized to the same filename")
+        bench(
+            "sanitize_unique",
+            lambda values=values: sanitize_unique_batch(sanitizer, values),
+            number=1,
+        )
+        bench(
+            "naive probing from 2",
+            lambda values=values: sanitize_unique_naive(sanitizer, values),
+            number=1,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Claims per second of SQLiteNameIndex with a large number of registered names:
+a claim is a few primary key lookups, so the rate must not drop as the database grows.
+
+Usage:
+    python -m benchmarks.bench_sqlite_index [--rows 10000000]
+"""
+
+import argparse
+import itertools
+import os
+import tempfile
+import time
+
+from pathvalidate import FileNameSanitizer, SQLiteNameIndex
+
+from ._common import print_header
+
+
+_SEED_CHUNK_SIZE = 100_000
+
+
+def seed(index: SQLiteNameIndex, rows: int) -> None:
+    for start in range(0, rows, _SEED_CHUNK_SIZE):
+        stop = min(start + _SEED_CHUNK_SIZE, rows)
+        index.add_many(f"file_{i:09d}.dat" for i in range(start, stop))
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<48s} {count / elapsed:>14,.0f} claims/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--claims", type=int, default=20_000)
+    options = parser.parse_args()
+
+    sanitizer = FileNameSanitizer(platform="windows")
+    counter = itertools.count()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database = os.path.join(tmp_dir, "names.sqlite3")
+
+        with SQLiteNameIndex(database, casefold=True) as index:
+            start = time.perf_counter()
+            seed(index, options.rows)
+            print_header(f"{options.rows:,d} rows (seeded in {time.perf_counter() - start:.1f} s)")
+
+            def run(label: str, make_value, batch_size: int, count: int) -> None:
+                start = time.perf_counter()
+                for _ in range(0, count, batch_size):
+                    with index.batch():
+                        for _ in range(batch_size):
+                            sanitizer.sanitize_unique(make_value(), index)
+                report(label, count, time.perf_counter() - start)
+
+            def new_value() -> str:
+                return f"new:{next(counter):09d}.dat"
+
+            run("new names, a transaction per claim", new_value, 1, options.claims // 10)
+            run("new names, 1,000 claims per transaction", new_value, 1_000, options.claims)
+            run(
+                "colliding names, 1,000 claims per transaction",
+                lambda: "file?000000000.dat",
+                1_000,
+                options.claims,
+            )
+
+
+if __name__ == "__main__":
+    main()
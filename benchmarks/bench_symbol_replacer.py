@@ -0,0 +1,64 @@
+"""
+Per-call cost of replace_symbol with exclude_symbols and is_replace_consecutive_chars:
+compiling the regular expressions per call vs. the cached SymbolReplacer.
+
+Usage:
+    python -m benchmarks.bench_symbol_replacer
+"""
+
+import re
+
+from pathvalidate import SymbolReplacer, ascii_symbols, replace_symbol, unprintable_ascii_chars
+
+from ._common import bench, print_header
+
+
+_EXCLUDE_SYMBOLS = ["_", "-"]
+_VALUES = {
+    "CSV column name": "Total Sales (USD) / Q3",
+    "CSV column name, clean": "total_sales_q3",
+    "long, many symbols": "a#b$c%d&e" * 30,
+    "non-ASCII": "売上高（税込）/ 第3四半期",
+}
+
+
+def replace_symbol_uncached(text: str) -> str:
+    # compiles the patterns on every call
+    regexp = re.compile(
+        "[{}]".format(
+            re.escape("".join(set(ascii_symbols + unprintable_ascii_chars) - set(_EXCLUDE_SYMBOLS)))
+        ),
+        re.UNICODE,
+    )
+    new_text = regexp.sub("_", text)
+    new_text = re.sub(f"{re.escape('_')}+", "_", new_text)
+
+    return new_text.strip("_")
+
+
+def main() -> None:
+    replacer = SymbolReplacer(
+        "_", exclude_symbols=_EXCLUDE_SYMBOLS, is_replace_consecutive_chars=True, is_strip=True
+    )
+
+    for label, value in _VALUES.items():
+        assert replacer.replace(value) == replace_symbol_uncached(value)
+
+        print_header(f"{label} ({len(value):d} chars)")
+        before = bench("compile per call", lambda value=value: replace_symbol_uncached(value))
+        bench(
+            "replace_symbol",
+            lambda value=value: replace_symbol(
+                value,
+                "_",
+                exclude_symbols=_EXCLUDE_SYMBOLS,
+                is_replace_consecutive_chars=True,
+                is_strip=True,
+            ),
+        )
+        after = bench("SymbolReplacer.replace", lambda value=value: replacer.replace(value))
+        print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Throughput scaling of a FilePathSanitizer shared by 1 to N threads.
+
+On a free-threaded (no-GIL) build of CPython, the throughput should scale with the number of
+threads. A drop in the scaling indicates contention on a shared state.
+
+Usage:
+    python -m benchmarks.bench_threads [MAX_THREADS]
+"""
+
+import os
+import sys
+import threading
+import time
+
+from pathvalidate import FilePathSanitizer
+
+from ._common import print_header
+
+
+NUM_PATHS_PER_THREAD = 20_000
+
+
+def _run(sanitizer: FilePathSanitizer, paths: list[str], num_threads: int) -> float:
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for path in paths:
+            sanitizer.sanitize(path)
+
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+
+    return num_threads * len(paths) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    sanitizer = FilePathSanitizer(platform="windows")
+    paths = [f"tenant/{i % 7}/2026/10/18/fi:le*{i}?.txt" for i in range(NUM_PATHS_PER_THREAD)]
+
+    print_header(f"shared FilePathSanitizer (GIL enabled: {is_gil_enabled})")
+
+    base_throughput = 0.0
+    num_threads = 1
+    while num_threads <= max_threads:
+        throughput = _run(sanitizer, paths, num_threads)
+        if num_threads == 1:
+            base_throughput = throughput
+
+        print(
+            f"{f'{num_threads} thread(s)':<24s} {throughput:>14,.0f} paths/s"
+            f" (scaling: {throughput / base_throughput:.2f}x)"
+        )
+        num_threads *= 2
+
+
+if __name__ == "__main__":
+    main()
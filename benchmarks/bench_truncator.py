@@ -0,0 +1,33 @@
+"""
+Per-call cost of FileNameTruncator.truncate for names of different lengths:
+apart from the hash tag, the cost must not grow with the length of a name.
+
+Usage:
+    python -m benchmarks.bench_truncator
+"""
+
+from pathvalidate import FileNameTruncator
+
+from ._common import bench, print_header
+
+
+def main() -> None:
+    truncator = FileNameTruncator()
+    hash_truncator = FileNameTruncator(hash_len=8)
+
+    for size in (300, 10_000, 1_000_000):
+        for label, name in (
+            ("ASCII", "a" * size + ".tar.gz"),
+            ("emoji ZWJ sequences", "\U0001f468‍\U0001f469‍\U0001f467" * (size // 5) + ".png"),
+        ):
+            print_header(f"{label}: {len(name):,d} characters")
+            bench("truncate", lambda name=name: truncator.truncate(name, 255), number=1_000)
+            bench(
+                "truncate with hash tag",
+                lambda name=name: hash_truncator.truncate(name, 255),
+                number=1_000,
+            )
+
+
+if __name__ == "__main__":
+    main()
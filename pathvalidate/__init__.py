@@ -3,9 +3,13 @@
 """
 
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
+from ._ansi import AnsiEscapeStrippedReader, AnsiEscapeStripper
 from ._base import AbstractSanitizer, AbstractValidator
+from ._builder import PathBuilder
+from ._cache import CacheInfo, engine_cache
 from ._common import (
     ascii_symbols,
+    has_unprintable_char,
     normalize_platform,
     replace_ansi_escape,
     replace_unprintable_char,
@@ -13,13 +17,14 @@ from ._common import (
     validate_pathtype,
     validate_unprintable_char,
 )
-from ._const import Platform
+from ._const import LengthUnit, Platform
 from ._filename import (
     FileNameSanitizer,
     FileNameValidator,
     is_valid_filename,
     sanitize_filename,
     validate_filename,
+    validate_filenames,
 )
 from ._filepath import (
     FilePathSanitizer,
@@ -27,9 +32,21 @@ from ._filepath import (
     is_valid_filepath,
     sanitize_filepath,
     validate_filepath,
+    validate_filepaths,
 )
-from ._ltsv import sanitize_ltsv_label, validate_ltsv_label
-from ._symbol import replace_symbol, validate_symbol
+from ._index import AbstractNameIndex, NameIndex
+from ._ltsv import (
+    LTSVReader,
+    LTSVWriter,
+    is_valid_ltsv_label,
+    sanitize_ltsv_label,
+    validate_ltsv_label,
+)
+from ._namelist import NameListSanitizer, NameListValidator
+from ._result import CheckResult, FastPathInfo, SanitizeResult
+from ._sqlite_index import SQLiteNameIndex
+from ._symbol import SymbolReplacer, has_symbol, replace_symbol, validate_symbol
+from ._truncator import FileNameTruncator
 from .error import (
     ErrorReason,
     InvalidCharError,
@@ -47,30 +64,53 @@ __all__ = (
     "__email__",
     "__license__",
     "__version__",
+    "AnsiEscapeStrippedReader",
+    "AnsiEscapeStripper",
     "AbstractSanitizer",
     "AbstractValidator",
-    "Platform",
+    "PathBuilder",
+    "CacheInfo",
+    "engine_cache",
     "ascii_symbols",
+    "has_unprintable_char",
     "normalize_platform",
     "replace_ansi_escape",
     "replace_unprintable_char",
     "unprintable_ascii_chars",
     "validate_pathtype",
     "validate_unprintable_char",
+    "LengthUnit",
+    "Platform",
     "FileNameSanitizer",
     "FileNameValidator",
     "is_valid_filename",
     "sanitize_filename",
     "validate_filename",
+    "validate_filenames",
     "FilePathSanitizer",
     "FilePathValidator",
     "is_valid_filepath",
     "sanitize_filepath",
     "validate_filepath",
+    "validate_filepaths",
+    "AbstractNameIndex",
+    "NameIndex",
+    "LTSVReader",
+    "LTSVWriter",
+    "is_valid_ltsv_label",
     "sanitize_ltsv_label",
     "validate_ltsv_label",
+    "NameListSanitizer",
+    "NameListValidator",
+    "CheckResult",
+    "FastPathInfo",
+    "SanitizeResult",
+    "SQLiteNameIndex",
+    "SymbolReplacer",
+    "has_symbol",
     "replace_symbol",
     "validate_symbol",
+    "FileNameTruncator",
     "ErrorReason",
     "InvalidCharError",
     "InvalidReservedNameError",
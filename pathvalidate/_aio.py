@@ -0,0 +1,33 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from concurrent.futures import Executor
+from typing import Callable, Final, Optional, TypeVar, Union
+
+
+_T = TypeVar("_T")
+
+# number of items processed from a synchronous iterable before yielding to the event loop
+YIELD_INTERVAL: Final = 256
+
+
+async def iterate_values(values: Union[Iterable[_T], AsyncIterable[_T]]) -> AsyncIterator[_T]:
+    if isinstance(values, AsyncIterable):
+        async for value in values:
+            yield value
+
+        return
+
+    for i, value in enumerate(values, start=1):
+        yield value
+
+        if i % YIELD_INTERVAL == 0:
+            # let other tasks run while a long synchronous iterable is processed
+            await asyncio.sleep(0)
+
+
+async def run_blocking(executor: Optional[Executor], func: Callable[..., _T], *args: object) -> _T:
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
@@ -0,0 +1,270 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import codecs
+import io
+from collections.abc import Iterable, Iterator
+from typing import IO, Any, Final, Optional, Union
+
+from ._common import find_ansi_escape_prefix, replace_ansi_escape, replace_unprintable_char
+
+
+DEFAULT_CHUNK_SIZE: Final = 64 * 1024
+
+# longer than the escape sequences that terminals emit in practice
+DEFAULT_MAX_ESCAPE_LEN: Final = 1024
+
+
+class AnsiEscapeStripper:
+    """
+    Streaming counterpart of :py:func:`replace_ansi_escape`: replace the ANSI escape sequences
+    in a text that is fed in chunks, such as a log file that is read piece by piece.
+
+    An escape sequence that is split across chunks is held back until the rest of it arrives,
+    so that the concatenation of the outputs is identical to the result of
+    :py:func:`replace_ansi_escape` for the concatenation of the inputs.
+    Apart from such an incomplete sequence, no input is retained between chunks.
+    An incomplete sequence is held back up to ``max_escape_len`` characters:
+    a longer one is processed as text, so that the memory usage is bounded
+    whatever the input is.
+
+    Args:
+        replacement_text:
+            Replacement text for the escape sequences (and the unprintable characters).
+        strip_unprintable:
+            If |True|, also replace the unprintable characters, as
+            :py:func:`replace_unprintable_char` does after :py:func:`replace_ansi_escape`.
+        encoding:
+            Encoding to decode the ``bytes`` chunks with.
+            A multi-byte character that is split across chunks is decoded incrementally.
+        errors:
+            Error handler of the decoding, such as ``"strict"`` or ``"replace"``.
+        max_escape_len:
+            Maximum number of characters of an incomplete escape sequence to hold back.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import AnsiEscapeStripper
+
+            stripper = AnsiEscapeStripper()
+            for chunk in stripper.iter_stripped(response.iter_content(8192)):
+                output.write(chunk)
+    """
+
+    def __init__(
+        self,
+        replacement_text: str = "",
+        strip_unprintable: bool = False,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        max_escape_len: int = DEFAULT_MAX_ESCAPE_LEN,
+    ) -> None:
+        if max_escape_len < 1:
+            raise ValueError("max_escape_len must be greater than zero")
+
+        self.__replacement_text = replacement_text
+        self.__strip_unprintable = strip_unprintable
+        self.__decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self.__max_escape_len = max_escape_len
+
+        # incomplete escape sequence at the end of the input so far
+        self.__pending = ""
+
+    def feed(self, chunk: Union[str, bytes]) -> str:
+        """Process the next ``chunk`` of the input.
+
+        Args:
+            chunk: Next part of the input.
+
+        Returns:
+            str: The processed text up to the incomplete escape sequence at the end of the input
+            so far, if any.
+        """
+
+        return self.__process(self.__decode(chunk, final=False), final=False)
+
+    def flush(self) -> str:
+        """Finish the input.
+
+        Returns:
+            str: The processed rest of the input held back by :py:meth:`feed`.
+
+        Raises:
+            UnicodeDecodeError:
+                If the input ends with an incomplete multi-byte character
+                and the ``errors`` is ``"strict"``.
+        """
+
+        return self.__process(self.__decode(b"", final=True), final=True)
+
+    def iter_stripped(self, chunks: Iterable[Union[str, bytes]]) -> Iterator[str]:
+        """Process the ``chunks`` and :py:meth:`flush` at the end.
+
+        Args:
+            chunks: Parts of the input.
+
+        Returns:
+            Iterator[str]: The processed non-empty texts.
+        """
+
+        for chunk in chunks:
+            text = self.feed(chunk)
+            if text:
+                yield text
+
+        text = self.flush()
+        if text:
+            yield text
+
+    def __decode(self, chunk: Union[str, bytes], final: bool) -> str:
+        if isinstance(chunk, str):
+            if self.__decoder.getstate()[0]:
+                raise ValueError("a str chunk follows an incomplete multi-byte character")
+
+            return chunk
+
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            return self.__decoder.decode(chunk, final=final)
+
+        raise TypeError(f"chunk must be a str or a bytes-like object: actual={type(chunk)}")
+
+    def __process(self, text: str, final: bool) -> str:
+        text = self.__pending + text
+
+        if final:
+            end = len(text)
+        else:
+            end = find_ansi_escape_prefix(text)
+            if len(text) - end > self.__max_escape_len:
+                # too long to be worth waiting for the rest of it: process it as text
+                end = len(text)
+
+        self.__pending = text[end:]
+        text = replace_ansi_escape(text[:end], self.__replacement_text)
+
+        if self.__strip_unprintable:
+            text = replace_unprintable_char(text, self.__replacement_text)
+
+        return text
+
+
+class AnsiEscapeStrippedReader(io.TextIOBase):
+    """
+    Read-only text stream that reads a binary or text stream with the ANSI escape sequences
+    replaced by an :py:class:`AnsiEscapeStripper`.
+    Iterating over the stream reads it line by line.
+
+    Args:
+        stream:
+            Binary or text stream to read.
+        chunk_size:
+            Number of bytes (characters for a text stream) to read from the ``stream`` at a time.
+        closefd:
+            If |True|, closing the reader closes the ``stream``.
+        **kwargs:
+            Keyword arguments for :py:class:`AnsiEscapeStripper`.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import AnsiEscapeStrippedReader
+
+            with AnsiEscapeStrippedReader(open("ci.log", "rb"), errors="replace") as reader:
+                for line in reader:
+                    ...
+    """
+
+    def __init__(
+        self,
+        stream: IO[Any],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        closefd: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be greater than zero")
+
+        super().__init__()
+
+        self.__stream = stream
+        self.__chunk_size = chunk_size
+        self.__closefd = closefd
+        self.__stripper = AnsiEscapeStripper(**kwargs)
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        self._checkClosed()  # type: ignore
+
+        if size is None or size < 0:
+            while self.__fill():
+                pass
+            return self.__take(len(self.__buffer))
+
+        while len(self.__buffer) - self.__pos < size and self.__fill():
+            pass
+
+        return self.__take(self.__pos + size)
+
+    def readline(self, size: Optional[int] = -1) -> str:  # type: ignore[override]
+        self._checkClosed()  # type: ignore
+
+        if size is None or size < 0:
+            size = -1
+
+        start = self.__pos
+        while True:
+            end = self.__buffer.find("\n", start)
+            if end >= 0:
+                end += 1
+                break
+
+            # filling the buffer drops the text already read: keep the scanned length
+            scanned_len = len(self.__buffer) - self.__pos
+            if 0 <= size <= scanned_len or not self.__fill():
+                end = len(self.__buffer)
+                break
+
+            start = self.__pos + scanned_len
+
+        if size >= 0:
+            end = min(end, self.__pos + size)
+
+        return self.__take(end)
+
+    def close(self) -> None:
+        if not self.closed and self.__closefd:
+            self.__stream.close()
+
+        super().close()
+
+    def __take(self, end: int) -> str:
+        # return the buffered text up to the end index
+        text = self.__buffer[self.__pos : end]
+        self.__pos += len(text)
+
+        return text
+
+    def __fill(self) -> bool:
+        # read the next chunk into the buffer. return False at the end of the stream
+        if self.__eof:
+            return False
+
+        chunk = self.__stream.read(self.__chunk_size)
+        if chunk:
+            text = self.__stripper.feed(chunk)
+        else:
+            text = self.__stripper.flush()
+            self.__eof = True
+
+        # drop the text already read
+        self.__buffer = self.__buffer[self.__pos :] + text
+        self.__pos = 0
+
+        return True
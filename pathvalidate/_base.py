@@ -6,17 +6,39 @@ import abc
 import os
 import re
 import sys
-from collections.abc import Sequence
-from typing import Final, Optional
-
-from ._common import normalize_platform, unprintable_ascii_chars
-from ._const import DEFAULT_MIN_LEN, Platform
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+from typing import Callable, Final, Optional, Union
+
+from ._aio import iterate_values
+from ._common import (
+    get_str_len,
+    is_null_pathtype,
+    normalize_platform,
+    to_str,
+    truncate_str_by_unit,
+    unprintable_ascii_chars,
+)
+from ._const import DEFAULT_MIN_LEN, LengthUnit, Platform
+from ._result import NULL_NAME_RESULT, CheckResult, SanitizeResult
 from ._types import PathType, PlatformType
-from .error import ReservedNameError, ValidationError
+from .error import ErrorReason, ReservedNameError, ValidationError
 from .handler import NullValueHandler, ReservedNameHandler, ValidationErrorHandler
 
 
+# maximum number of characters of a value that a sanitizer reads in the bounded-work mode,
+# as a multiple of the max_len
+_BOUNDED_WORK_INPUT_RATIO: Final = 4
+
+
 class BaseFile:
+    # Thread safety: instances are configured in __init__ and must not be mutated afterward.
+    # validate/check/sanitize only read the instance attributes, and the module-level
+    # regular expressions and lookup tables are immutable. Thus a validator/sanitizer can be
+    # shared between threads, including on free-threaded (no-GIL) CPython builds.
+    # Keep new per-instance state immutable, or guard it with a lock (see LRUCache).
+    # Caches filled while processing values (such as the translation tables of CharReplacer)
+    # and opt-in statistics (such as fast_path_stats) are guarded by locks as well.
+
     _INVALID_PATH_CHARS: Final[str] = "".join(unprintable_ascii_chars)
     _INVALID_FILENAME_CHARS: Final[str] = _INVALID_PATH_CHARS + "/"
     _INVALID_WIN_PATH_CHARS: Final[str] = _INVALID_PATH_CHARS + ':*?"<>|\t\n\r\x0b\x0c'
@@ -30,12 +52,16 @@ class BaseFile:
 
     @property
     def reserved_keywords(self) -> tuple[str, ...]:
-        return self._additional_reserved_names
+        return self.__reserved_keywords
 
     @property
     def max_len(self) -> int:
         return self._max_len
 
+    @property
+    def length_unit(self) -> LengthUnit:
+        return self.__length_unit
+
     def __init__(
         self,
         max_len: int,
@@ -43,6 +69,7 @@ class BaseFile:
         additional_reserved_names: Optional[Sequence[str]] = None,
         platform_max_len: Optional[int] = None,
         platform: Optional[PlatformType] = None,
+        length_unit: Optional[LengthUnit] = None,
     ) -> None:
         if additional_reserved_names is None:
             additional_reserved_names = tuple()
@@ -65,6 +92,25 @@ class BaseFile:
         else:
             self._fs_encoding = sys.getfilesystemencoding()
 
+        if length_unit is None:
+            length_unit = LengthUnit.BYTES
+        self.__length_unit = length_unit
+
+        # reserved names depend only on the platform and the additional names:
+        # build the lookup table once rather than per validated name
+        self.__reserved_keywords = self._make_reserved_keywords()
+        self._reserved_keyword_set = frozenset(self.__reserved_keywords)
+
+    def _get_len(self, value: str, limit: Optional[int] = None) -> int:
+        # length of the value in the length unit (see get_str_len)
+        return get_str_len(value, self._fs_encoding, self.__length_unit, limit=limit)
+
+    def _truncate(self, value: str, max_len: int) -> str:
+        return truncate_str_by_unit(value, self._fs_encoding, self.__length_unit, max_len)
+
+    def _make_reserved_keywords(self) -> tuple[str, ...]:
+        return self._additional_reserved_names
+
     def _is_posix(self) -> bool:
         return self.platform == Platform.POSIX
 
@@ -111,6 +157,7 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
         additional_reserved_names: Optional[Sequence[str]] = None,
         platform_max_len: Optional[int] = None,
         platform: Optional[PlatformType] = None,
+        length_unit: Optional[LengthUnit] = None,
     ) -> None:
         self._check_reserved = check_reserved
 
@@ -120,6 +167,7 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
             additional_reserved_names=additional_reserved_names,
             platform_max_len=platform_max_len,
             platform=platform,
+            length_unit=length_unit,
         )
 
     @property
@@ -131,16 +179,129 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
     def validate(self, value: PathType) -> None:  # pragma: no cover
         pass
 
-    def is_valid(self, value: PathType) -> bool:
+    def check(self, value: PathType) -> Optional[CheckResult]:
+        """Validate the ``value`` without raising a validation error.
+
+        Args:
+            value: Value to validate.
+
+        Returns:
+            Optional[CheckResult]: |None| if the ``value`` is valid, otherwise the failure.
+
+        Raises:
+            TypeError:
+                If the ``value`` is not a string or a path-like object.
+        """
+
         try:
             self.validate(value)
-        except (TypeError, ValidationError):
+        except ValidationError as e:
+            error = e
+
+            return CheckResult(
+                reason=error.reason,
+                platform=error.platform,
+                span=(0, len(value) if isinstance(value, str) else 0),
+                make_error=lambda: error,
+            )
+
+        return None
+
+    def is_valid(self, value: PathType) -> bool:
+        try:
+            return self.check(value) is None
+        except TypeError:
             return False
 
-        return True
+    def validate_many(
+        self, values: Iterable[PathType]
+    ) -> Iterator[tuple[int, PathType, ErrorReason]]:
+        """Validate the ``values`` and lazily yield the invalid ones.
+
+        Args:
+            values: Values to validate.
+
+        Yields:
+            Tuple[int, PathType, ErrorReason]:
+                Index in the ``values``, the invalid value, and the cause of the failure.
+
+        Raises:
+            TypeError:
+                If a value is not a string or a path-like object.
+        """
+
+        check = self._get_batch_check()
+        for i, value in enumerate(values):
+            result = check(value)
+            if result is not None:
+                yield i, value, result.reason
+
+    async def validate_many_async(
+        self, values: Union[Iterable[PathType], AsyncIterable[PathType]]
+    ) -> AsyncIterator[tuple[int, PathType, ErrorReason]]:
+        """Asynchronous version of :py:meth:`validate_many`.
+
+        The validation runs in the event loop thread, which is yielded to other tasks
+        periodically while a long synchronous iterable is validated.
+
+        Args:
+            values: Values to validate. Either a synchronous or an asynchronous iterable.
+
+        Yields:
+            Tuple[int, PathType, ErrorReason]:
+                Index in the ``values``, the invalid value, and the cause of the failure.
+        """
+
+        check = self._get_batch_check()
+        i = 0
+        async for value in iterate_values(values):
+            result = check(value)
+            if result is not None:
+                yield i, value, result.reason
+
+            i += 1
+
+    def validity_bitmap(self, values: Iterable[PathType]) -> bytearray:
+        """Validate the ``values`` and return the results as a bitmap.
+
+        Args:
+            values: Values to validate.
+
+        Returns:
+            bytearray:
+                Bitmap that the ``i``-th bit (``bitmap[i >> 3] >> (i & 7) & 1``) is set
+                if the ``i``-th value is valid.
+
+        Raises:
+            TypeError:
+                If a value is not a string or a path-like object.
+        """
+
+        check = self._get_batch_check()
+        bitmap = bytearray()
+        byte = 0
+        bit = 0
+
+        for value in values:
+            if check(value) is None:
+                byte |= 1 << bit
+
+            bit += 1
+            if bit == 8:
+                bitmap.append(byte)
+                byte = 0
+                bit = 0
+
+        if bit:
+            bitmap.append(byte)
+
+        return bitmap
+
+    def _get_batch_check(self) -> Callable[[PathType], Optional[CheckResult]]:
+        return self.check
 
     def _is_reserved_keyword(self, value: str) -> bool:
-        return value.upper() in self.reserved_keywords
+        return value.upper() in self._reserved_keyword_set
 
 
 class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
@@ -155,6 +316,8 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
         additional_reserved_names: Optional[Sequence[str]] = None,
         platform_max_len: Optional[int] = None,
         platform: Optional[PlatformType] = None,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
     ) -> None:
         super().__init__(
             max_len=max_len,
@@ -162,6 +325,7 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
             additional_reserved_names=additional_reserved_names,
             platform_max_len=platform_max_len,
             platform=platform,
+            length_unit=length_unit,
         )
 
         if null_value_handler is None:
@@ -173,13 +337,72 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
         self._reserved_name_handler = reserved_name_handler
 
         self._validate_after_sanitize = validate_after_sanitize
+        self._bounded_work = bounded_work
 
         self._validator = validator
 
+    def _bound_input(self, value: PathType) -> PathType:
+        # in the bounded-work mode, the characters of a string beyond a multiple of max_len are
+        # ignored: this limits the work for a hostile value, such as a long run of characters
+        # to remove or of whitespaces. other values fill max_len bytes long before the bound
+        if not self._bounded_work or not isinstance(value, str):
+            return value
+
+        return value[: self.max_len * _BOUNDED_WORK_INPUT_RATIO]
+
     @abc.abstractmethod
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:  # pragma: no cover
         pass
 
+    def sanitize_many(
+        self, values: Iterable[PathType], replacement_text: str = ""
+    ) -> Iterator[SanitizeResult]:
+        """Sanitize the ``values`` and lazily yield the results in the same order.
+
+        Values that need no change are yielded as is (the same objects),
+        and flagged as unchanged.
+
+        Args:
+            values: Values to sanitize.
+            replacement_text: Replacement text for invalid characters.
+
+        Yields:
+            SanitizeResult: Sanitized value and whether the sanitization changed the value.
+        """
+
+        sanitize = self.sanitize
+        for value in values:
+            yield self._make_sanitize_result(value, sanitize(value, replacement_text))
+
+    async def sanitize_many_async(
+        self,
+        values: Union[Iterable[PathType], AsyncIterable[PathType]],
+        replacement_text: str = "",
+    ) -> AsyncIterator[SanitizeResult]:
+        """Asynchronous version of :py:meth:`sanitize_many`.
+
+        The sanitization runs in the event loop thread, which is yielded to other tasks
+        periodically while a long synchronous iterable is sanitized.
+
+        Args:
+            values: Values to sanitize. Either a synchronous or an asynchronous iterable.
+            replacement_text: Replacement text for invalid characters.
+
+        Yields:
+            SanitizeResult: Sanitized value and whether the sanitization changed the value.
+        """
+
+        sanitize = self.sanitize
+        async for value in iterate_values(values):
+            yield self._make_sanitize_result(value, sanitize(value, replacement_text))
+
+    @staticmethod
+    def _make_sanitize_result(value: PathType, sanitized: PathType) -> SanitizeResult:
+        if sanitized is value:
+            return SanitizeResult(value, False)
+
+        return SanitizeResult(sanitized, to_str(sanitized) != to_str(value))
+
 
 class BaseValidator(AbstractValidator):
     __RE_ROOT_NAME: Final = re.compile(r"([^\.]+)")
@@ -198,10 +421,13 @@ class BaseValidator(AbstractValidator):
         additional_reserved_names: Optional[Sequence[str]] = None,
         platform_max_len: Optional[int] = None,
         platform: Optional[PlatformType] = None,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
     ) -> None:
         if min_len <= 0:
             min_len = DEFAULT_MIN_LEN
         self._min_len = max(min_len, 1)
+        self._bounded_work = bounded_work
 
         super().__init__(
             max_len=max_len,
@@ -210,26 +436,72 @@ class BaseValidator(AbstractValidator):
             additional_reserved_names=additional_reserved_names,
             platform_max_len=platform_max_len,
             platform=platform,
+            length_unit=length_unit,
         )
 
         self._validate_max_len()
 
-    def _validate_reserved_keywords(self, name: str) -> None:
+    def check(self, value: PathType) -> Optional[CheckResult]:
+        if self._bounded_work and isinstance(value, str) and len(value) > self.max_len:
+            # too long: _check_nonnull reports it without reading the value
+            return self._check_nonnull(value)
+
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            return NULL_NAME_RESULT
+
+        return self._check_nonnull(value)
+
+    @abc.abstractmethod
+    def _check_nonnull(self, value: PathType) -> Optional[CheckResult]:  # pragma: no cover
+        pass
+
+    def _get_batch_check(self) -> Callable[[PathType], Optional[CheckResult]]:
+        check = self.check
+        check_nonnull = self._check_nonnull
+
+        def batch_check(value: PathType) -> Optional[CheckResult]:
+            # skip the type checks for the common case of non-blank strings.
+            # the first character is enough to tell: check() takes the other strings
+            if type(value) is str and value and not value[0].isspace():
+                return check_nonnull(value)
+
+            return check(value)
+
+        return batch_check
+
+    def validate(self, value: PathType) -> None:
+        result = self.check(value)
+        if result is not None:
+            result.raise_error()
+
+    def _check_reserved_keywords(self, name: str) -> Optional[CheckResult]:
         if not self._check_reserved:
-            return
+            return None
 
         root_name = self.__extract_root_name(name)
         base_name = os.path.basename(name)
 
-        for name in (root_name, base_name):
-            if self._is_reserved_keyword(name):
-                raise ReservedNameError(
-                    f"'{root_name}' is a reserved name",
-                    reusable_name=False,
-                    reserved_name=root_name,
+        for target in (root_name, base_name):
+            if self._is_reserved_keyword(target):
+                if root_name == name:
+                    start = 0
+                else:
+                    start = len(name) - len(base_name)
+
+                return CheckResult(
+                    reason=ErrorReason.RESERVED_NAME,
                     platform=self.platform,
+                    span=(start, start + len(root_name)),
+                    make_error=lambda: ReservedNameError(
+                        f"'{root_name}' is a reserved name",
+                        reusable_name=False,
+                        reserved_name=root_name,
+                        platform=self.platform,
+                    ),
                 )
 
+        return None
+
     def _validate_max_len(self) -> None:
         if self.max_len < 1:
             raise ValueError("max_len must be greater or equal to one")
@@ -0,0 +1,317 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import ntpath
+import posixpath
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final, Optional
+
+from ._common import get_byte_len, to_str
+from ._const import _NTFS_RESERVED_FILE_NAMES, DEFAULT_MIN_LEN
+from ._filename import FileNameSanitizer, FileNameValidator
+from ._filepath import FilePathSanitizer, FilePathValidator
+from ._types import PathType, PlatformType
+from .error import ErrorReason, ValidationError
+
+
+# number of the first components appended to a base that are validated with the whole path
+_ANCHOR_DEPTH: Final = 3
+
+
+class _BuildContext:
+    # configuration shared by all of the nodes that derive from the same root
+
+    def __init__(
+        self,
+        platform: Optional[PlatformType],
+        max_len: int,
+        fs_encoding: Optional[str],
+        check_reserved: bool,
+        additional_reserved_names: Optional[Sequence[str]],
+        sanitize: bool,
+        replacement_text: str,
+    ) -> None:
+        self.path_validator = FilePathValidator(
+            min_len=DEFAULT_MIN_LEN,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            platform=platform,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+        )
+        # same as FilePathValidator: the components are limited by the max_len of the path
+        self.fname_validator = FileNameValidator(
+            max_len=self.path_validator.max_len,
+            fs_encoding=fs_encoding,
+            platform=platform,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+            length_unit=self.path_validator.length_unit,
+        )
+        self.path_sanitizer: Optional[FilePathSanitizer] = None
+        self.fname_sanitizer: Optional[FileNameSanitizer] = None
+        if sanitize:
+            self.path_sanitizer = FilePathSanitizer(
+                max_len=max_len,
+                fs_encoding=fs_encoding,
+                platform=platform,
+                additional_reserved_names=additional_reserved_names,
+            )
+            self.fname_sanitizer = FileNameSanitizer(
+                max_len=self.path_sanitizer.max_len,
+                fs_encoding=fs_encoding,
+                platform=platform,
+                additional_reserved_names=additional_reserved_names,
+                length_unit=self.path_sanitizer.length_unit,
+            )
+
+        self.replacement_text = replacement_text
+        self.drive_byte_len = 0
+        self.platform = self.path_validator.platform
+        self.max_len = self.path_validator.max_len
+        self.fs_encoding = self.path_validator._fs_encoding
+        self.is_windows = self.path_validator._is_windows(include_universal=True)
+        self.separator = "\\" if self.path_validator._is_windows() else "/"
+
+
+class PathBuilder:
+    """
+    Immutable file path that is built incrementally by appending components with ``/``.
+
+    The ``base`` is validated (or sanitized) as a whole once.
+    After that, each appended component is validated (or sanitized) on its own,
+    and the byte length of the path is updated incrementally:
+    appending a component costs O(length of the component), regardless of the length of the path.
+    A built path is valid for :py:func:`~pathvalidate.validate_filepath` with the same arguments.
+
+    Paths are linked to their parents, so paths derived from a common prefix share it:
+    walking a tree structure creates one object per node, not a copy of every prefix.
+
+    Args:
+        base:
+            Path to start from. Defaults to an empty (relative) path.
+        platform:
+            Target platform name of the file path.
+
+            .. include:: platform.txt
+        max_len:
+            Maximum byte length of the file path.
+            If the value is minus, automatically determined by the ``platform``.
+        fs_encoding:
+            Filesystem encoding that is used to calculate the byte length of the path.
+            If |None|, get the encoding from the execution environment.
+        check_reserved:
+            If |True|, check the reserved names of the ``platform``.
+            Ignored when ``sanitize`` is |True|.
+        additional_reserved_names:
+            Additional reserved names to check.
+        sanitize:
+            If |True|, sanitize the ``base`` and the appended components instead of
+            raising validation errors.
+            A component that includes path separators is appended as multiple components,
+            and a component that is empty after the sanitization is skipped.
+        replacement_text:
+            Replacement text for invalid characters when ``sanitize`` is |True|.
+
+    Raises:
+        ValidationError:
+            If the ``base`` is invalid.
+            The ``/`` operator also raises the error for an invalid component, and
+            for a component that makes the path longer than ``max_len`` bytes.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import PathBuilder
+
+            root = PathBuilder("/srv/export", platform="linux")
+            for dirname, filenames in tree.items():
+                directory = root / dirname
+                for filename in filenames:
+                    with open(directory / filename, "w") as f:
+                        ...
+    """
+
+    __slots__ = ("__byte_len", "__context", "__depth", "__name", "__parent", "__str")
+
+    @property
+    def name(self) -> str:
+        """str: The last component of the path. The whole path for a base."""
+        return self.__name
+
+    @property
+    def parent(self) -> Optional["PathBuilder"]:
+        """Optional[PathBuilder]: The path that this path was derived from. |None| for a base."""
+        return self.__parent
+
+    @property
+    def byte_len(self) -> int:
+        """int: Byte length of the path in the filesystem encoding, including the drive."""
+        return self.__byte_len
+
+    @property
+    def max_len(self) -> int:
+        """int: Maximum byte length of the path, excluding the drive."""
+        return self.__context.max_len
+
+    def __init__(
+        self,
+        base: PathType = "",
+        platform: Optional[PlatformType] = None,
+        max_len: int = -1,
+        fs_encoding: Optional[str] = None,
+        check_reserved: bool = True,
+        additional_reserved_names: Optional[Sequence[str]] = None,
+        sanitize: bool = False,
+        replacement_text: str = "",
+    ) -> None:
+        context = _BuildContext(
+            platform=platform,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+            sanitize=sanitize,
+            replacement_text=replacement_text,
+        )
+
+        base_str = to_str(base)
+        if base_str:
+            if context.path_sanitizer is not None:
+                base_str = str(context.path_sanitizer.sanitize(base_str, replacement_text))
+            else:
+                context.path_validator.validate(base_str)
+
+        # same as FilePathValidator: the drive does not count toward the max_len
+        split_drive = ntpath.splitdrive if context.is_windows else posixpath.splitdrive
+        drive, _tail = split_drive(base_str)
+        context.drive_byte_len = len(drive.encode(context.fs_encoding))
+
+        self.__context = context
+        self.__parent: Optional[PathBuilder] = None
+        self.__name = base_str
+        self.__byte_len = get_byte_len(base_str, context.fs_encoding)
+        self.__str: Optional[str] = base_str
+        self.__depth = 0
+
+    def __truediv__(self, component: PathType) -> "PathBuilder":
+        context = self.__context
+        name = to_str(component)
+
+        if context.fname_sanitizer is not None:
+            if "/" in name or "\\" in name:
+                # same as FilePathSanitizer: separators split the component
+                return self.joinpath(*name.replace("\\", "/").split("/"))
+
+            if name in _NTFS_RESERVED_FILE_NAMES:
+                # same as FilePathSanitizer
+                name = f"{name}_"
+            else:
+                name = str(context.fname_sanitizer.sanitize(name, context.replacement_text))
+            if not name:
+                return self
+        elif "\\" in name:
+            # same as FilePathValidator: backslashes separate the components of the name
+            for entry in name.split("\\"):
+                if entry and entry not in (".", ".."):
+                    context.fname_validator.validate(entry)
+        else:
+            context.fname_validator.validate(name)
+
+        byte_len = self.__byte_len + get_byte_len(name, context.fs_encoding)
+        if self.__needs_separator():
+            byte_len += len(context.separator.encode(context.fs_encoding))
+
+        tail_byte_len = byte_len - context.drive_byte_len
+        if tail_byte_len > context.max_len:
+            raise ValidationError(
+                [
+                    (
+                        f"file path is too long: expected<={context.max_len:d} bytes, "
+                        f"actual={tail_byte_len:d} bytes"
+                    ),
+                ],
+                reason=ErrorReason.INVALID_LENGTH,
+                platform=context.platform,
+                fs_encoding=context.fs_encoding,
+                byte_count=tail_byte_len,
+            )
+
+        child = PathBuilder.__new__(PathBuilder)
+        child.__context = context
+        child.__parent = self
+        child.__name = name
+        child.__byte_len = byte_len
+        child.__str = None
+        child.__depth = self.__depth + 1
+
+        if context.fname_sanitizer is None and child.__depth <= _ANCHOR_DEPTH:
+            # some rules depend on the beginning of the path rather than on a component,
+            # such as drives/UNC shares of absolute paths and NTFS reserved names
+            context.path_validator.validate(str(child))
+
+        return child
+
+    def joinpath(self, *components: PathType) -> "PathBuilder":
+        """Return the path with the ``components`` appended one by one.
+
+        Args:
+            components: Components to append.
+
+        Returns:
+            PathBuilder: The path with the ``components`` appended.
+        """
+
+        path = self
+        for component in components:
+            path = path / component
+
+        return path
+
+    def to_path(self) -> Path:
+        """Return the path as a :py:class:`pathlib.Path`."""
+        return Path(str(self))
+
+    def __str__(self) -> str:
+        if self.__str is None:
+            # build from the nearest ancestor whose string is already made,
+            # and keep it: later calls for this path and its descendants reuse it
+            names: list[str] = []
+            node: Optional[PathBuilder] = self
+            while node is not None and node.__str is None:
+                names.append(node.__name)
+                node = node.__parent
+
+            assert node is not None
+            separator = self.__context.separator
+            tail = separator.join(reversed(names))
+            if node.__needs_separator():
+                self.__str = f"{node.__str}{separator}{tail}"
+            else:
+                self.__str = f"{node.__str}{tail}"
+
+        return self.__str
+
+    def __fspath__(self) -> str:
+        return str(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r}, platform={self.__context.platform.value!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathBuilder):
+            return NotImplemented
+
+        return self.__context.platform == other.__context.platform and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash((self.__context.platform, str(self)))
+
+    def __needs_separator(self) -> bool:
+        # whether a separator goes between the path and an appended component
+        if self.__parent is not None:
+            return True
+
+        return self.__name != "" and self.__name[-1] not in ("/", "\\")
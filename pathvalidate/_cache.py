@@ -0,0 +1,130 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, Final, Generic, NamedTuple, TypeVar
+
+
+_T = TypeVar("_T")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of a cache.
+    """
+
+    #: Number of lookups that found a cached entry.
+    hits: int
+
+    #: Number of lookups that did not find a cached entry.
+    misses: int
+
+    #: Maximum number of entries that the cache holds.
+    maxsize: int
+
+    #: Current number of entries in the cache.
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """float: Ratio of hits to the total number of lookups."""
+
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+
+        return self.hits / total
+
+
+class LRUCache(Generic[_T]):
+    """
+    Thread-safe bounded cache that discards the least recently used entry first.
+
+    Args:
+        maxsize:
+            Maximum number of entries. The value must be greater or equal to one.
+    """
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater or equal to one")
+
+        self.__maxsize = maxsize
+        self.__entries: OrderedDict[Hashable, _T] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a lock cannot be pickled: a copy of the cache starts empty
+        return (self.__class__, (self.__maxsize,))
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Return the entry for the ``key``, creating it with the ``factory`` on a miss.
+
+        Entries whose ``key`` is not hashable are created every time and never cached.
+
+        Args:
+            key: Key of the entry.
+            factory: Function called without arguments to create a missing entry.
+
+        Returns:
+            The cached or newly created entry.
+        """
+
+        try:
+            with self.__lock:
+                value = self.__entries[key]
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return value
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable key
+            return factory()
+
+        value = factory()
+
+        with self.__lock:
+            self.__misses += 1
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache.
+
+        Returns:
+            CacheInfo: Hit/miss counts and the size of the cache.
+        """
+
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, self.__maxsize, len(self.__entries))
+
+    def clear(self) -> None:
+        """Discard all of the entries and reset the statistics."""
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+#: Cache of the validators/sanitizers used by the functional API such as
+#: :py:func:`~pathvalidate.validate_filename` and :py:func:`~pathvalidate.sanitize_filepath`,
+#: and of the symbol replacers used by :py:func:`~pathvalidate.replace_symbol`.
+engine_cache: Final[LRUCache[Any]] = LRUCache(maxsize=256)
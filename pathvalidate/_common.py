@@ -2,15 +2,18 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import codecs
+import functools
 import ntpath
 import platform
 import re
 import string
 import sys
+from collections.abc import Iterable
 from pathlib import PurePath
 from typing import Any, Final, Optional
 
-from ._const import Platform
+from ._const import LengthUnit, Platform
 from ._types import PathType, PlatformType
 
 
@@ -22,14 +25,30 @@ def validate_pathtype(
 ) -> None:
     from .error import ErrorReason, ValidationError
 
+    if is_null_pathtype(text, allow_whitespaces=allow_whitespaces):
+        raise ValidationError(reason=ErrorReason.NULL_NAME)
+
+
+def is_null_pathtype(text: Any, allow_whitespaces: bool = False) -> bool:
+    """Non-raising counterpart of :py:func:`validate_pathtype`.
+    Return |True| if the ``text`` is a null name, and raise |TypeError| if it is not a path type.
+    """
+
+    if isinstance(text, str):
+        # same as the checks below, without making a stripped copy of the text
+        if not text:
+            return True
+
+        return not allow_whitespaces and text.isspace()
+
     if _is_not_null_string(text) or isinstance(text, PurePath):
-        return
+        return False
 
     if allow_whitespaces and _re_whitespaces.search(str(text)):
-        return
+        return False
 
     if is_null_string(text):
-        raise ValidationError(reason=ErrorReason.NULL_NAME)
+        return True
 
     raise TypeError(f"text must be a string: actual={type(text)}")
 
@@ -41,6 +60,13 @@ def to_str(name: PathType) -> str:
     return name
 
 
+def to_hashable(values: Optional[Iterable[Any]]) -> Optional[tuple[Any, ...]]:
+    if values is None:
+        return None
+
+    return tuple(values)
+
+
 def is_nt_abspath(value: str) -> bool:
     ver_info = sys.version_info[:2]
     if ver_info <= (3, 10):
@@ -100,11 +126,24 @@ __RE_UNPRINTABLE_CHARS: Final = re.compile(
 __RE_ANSI_ESCAPE: Final = re.compile(
     r"(?:\x1B[@-Z\\-_]|[\x80-\x9A\x9C-\x9F]|(?:\x1B\[|\x9B)[0-?]*[ -/]*[@-~])"
 )
+# proper prefixes of the ANSI escape sequences: the introducer of a sequence,
+# followed by the parameter/intermediate bytes of a control sequence without its final byte
+__RE_ANSI_ESCAPE_PREFIX: Final = re.compile(r"\x1B|(?:\x1B\[|\x9B)[0-?]*[ -/]*")
+
+
+def has_unprintable_char(text: str) -> bool:
+    try:
+        return __RE_UNPRINTABLE_CHARS.search(to_str(text)) is not None
+    except TypeError:
+        raise TypeError("text must be a string")
 
 
 def validate_unprintable_char(text: str) -> None:
     from .error import InvalidCharError
 
+    if not has_unprintable_char(text):
+        return
+
     match_list = __RE_UNPRINTABLE_CHARS.findall(to_str(text))
     if match_list:
         raise InvalidCharError(f"unprintable character found: {match_list}")
@@ -124,6 +163,22 @@ def replace_ansi_escape(text: str, replacement_text: str = "") -> str:
         raise TypeError("text must be a string")
 
 
+def find_ansi_escape_prefix(text: str) -> int:
+    """Return the index of the incomplete ANSI escape sequence at the end of the ``text``,
+    or the length of the ``text`` if the ``text`` does not end with one.
+
+    ``replace_ansi_escape`` returns the same result for the ``text`` up to the index
+    whatever follows the ``text``.
+    """
+
+    # an incomplete sequence contains no other introducer
+    start = max(text.rfind("\x1b"), text.rfind("\x9b"))
+    if start < 0 or __RE_ANSI_ESCAPE_PREFIX.fullmatch(text, start) is None:
+        return len(text)
+
+    return start
+
+
 def normalize_platform(name: Optional[PlatformType]) -> Platform:
     if isinstance(name, Platform):
         return name
@@ -156,8 +211,152 @@ def findall_to_str(match: list[Any]) -> str:
     return ", ".join(uniq_list)
 
 
+@functools.cache
+def is_utf8_encoding(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+# number of characters that are encoded at a time to count the bytes of a long text
+_BYTE_COUNT_CHUNK_SIZE: Final = 64 * 1024
+
+
+def get_byte_len(text: str, encoding: str, limit: Optional[int] = None) -> int:
+    """Return the byte length of the ``text`` in the ``encoding``.
+
+    For UTF-8, the length of an ASCII text is its number of characters, and a text longer than
+    the ``limit`` is known to be too long without encoding it: every character takes at least
+    one byte. Other texts are encoded a chunk at a time until the count passes the ``limit``.
+    Thus the work and the memory are proportional to the ``limit``,
+    not to the length of the ``text``.
+
+    Args:
+        text: Text to measure.
+        encoding: Encoding of the byte length.
+        limit:
+            If not |None|, the result is exact only up to the ``limit``:
+            any result greater than the ``limit`` means that the text is longer than the limit.
+
+    Returns:
+        int: The byte length, or a lower bound of it greater than the ``limit``.
+    """
+
+    if not is_utf8_encoding(encoding):
+        return len(text.encode(encoding))
+
+    if limit is not None and len(text) > limit:
+        return len(text)
+
+    if text.isascii():
+        return len(text)
+
+    if limit is not None and len(text) > limit // 4:
+        return _get_utf8_len_within(text, limit)
+
+    if len(text) <= _BYTE_COUNT_CHUNK_SIZE:
+        return len(text.encode(encoding))
+
+    # exact length of a long text: encode a chunk at a time to keep the memory usage bounded
+    return sum(
+        len(text[i : i + _BYTE_COUNT_CHUNK_SIZE].encode(encoding))
+        for i in range(0, len(text), _BYTE_COUNT_CHUNK_SIZE)
+    )
+
+
+def _get_utf8_len_within(text: str, limit: int) -> int:
+    # a chunk of a quarter of the remaining bytes fits in them (a character takes at most
+    # four bytes): the count passes the limit by at most three bytes, and the encoded chunks
+    # are not larger than the limit. a text that fits encodes as a single chunk
+    text_len = len(text)
+    byte_ct = 0
+    pos = 0
+
+    while pos < text_len:
+        remaining = limit - byte_ct
+        if text_len - pos > remaining:
+            # every remaining character takes at least one byte
+            return byte_ct + text_len - pos
+
+        end = pos + max(remaining // 4, 1)
+        byte_ct += len(text[pos:end].encode("utf-8"))
+        pos = end
+
+    return byte_ct
+
+
+_RE_ASTRAL_CHAR: Final = re.compile("[\U00010000-\U0010ffff]")
+
+
+def get_utf16_len(text: str, limit: Optional[int] = None) -> int:
+    """Return the number of UTF-16 code units of the ``text`` without encoding it:
+    the number of characters plus the number of the characters out of the BMP,
+    which take a surrogate pair.
+
+    Args:
+        text: Text to measure.
+        limit: Same as :py:func:`get_byte_len`.
+
+    Returns:
+        int: The number of code units, or a lower bound of it greater than the ``limit``.
+    """
+
+    if limit is not None and len(text) > limit:
+        return len(text)
+
+    if text.isascii() or max(text) < "\U00010000":
+        return len(text)
+
+    return len(text) + sum(1 for _match in _RE_ASTRAL_CHAR.finditer(text))
+
+
+def get_str_len(text: str, encoding: str, unit: LengthUnit, limit: Optional[int] = None) -> int:
+    """Return the length of the ``text`` in the ``unit``.
+    Same as :py:func:`get_byte_len` for the ``limit``.
+    """
+
+    if unit is LengthUnit.BYTES:
+        return get_byte_len(text, encoding, limit=limit)
+
+    if unit is LengthUnit.UTF16_CODE_UNITS:
+        return get_utf16_len(text, limit=limit)
+
+    return len(text)
+
+
+def truncate_str_by_unit(text: str, encoding: str, unit: LengthUnit, max_len: int) -> str:
+    """Return the longest prefix of the ``text`` whose length in the ``unit`` is at most
+    the ``max_len``.
+    """
+
+    if unit is LengthUnit.BYTES:
+        return truncate_str(text, encoding, max_len)
+
+    # every character takes at least one unit
+    text = text[:max_len]
+    if unit is LengthUnit.CODE_POINTS:
+        return text
+
+    unit_ct = get_utf16_len(text)
+    end = len(text)
+    while unit_ct > max_len:
+        end -= 1
+        unit_ct -= 2 if text[end] >= "\U00010000" else 1
+
+    return text[:end]
+
+
 def truncate_str(text: str, encoding: str, max_bytes: int) -> str:
+    if is_utf8_encoding(encoding):
+        if text.isascii():
+            return text[:max_bytes]
+
+        # the first max_bytes characters take at least max_bytes bytes:
+        # the rest of the text is cut off anyway
+        text = text[:max_bytes]
+
     str_bytes = text.encode(encoding)
+    if len(str_bytes) <= max_bytes:
+        return text
+
     str_bytes = str_bytes[:max_bytes]
     # last char might be malformed, ignore it
     return str_bytes.decode(encoding, "ignore")
@@ -39,3 +39,20 @@ class Platform(enum.Enum):
     LINUX = "Linux"
     WINDOWS = "Windows"
     MACOS = "macOS"
+
+
+@enum.unique
+class LengthUnit(enum.Enum):
+    """
+    Unit of the length limits (``min_len``/``max_len``) of file names and file paths.
+    """
+
+    #: Bytes in the filesystem encoding (``fs_encoding``).
+    BYTES = "bytes"
+
+    #: UTF-16 code units: the unit of the name length limits of NTFS and Windows APIs.
+    #: A character out of the basic multilingual plane (such as an emoji) takes two units.
+    UTF16_CODE_UNITS = "UTF-16 code units"
+
+    #: Unicode code points: the number of characters of a Python string.
+    CODE_POINTS = "code points"
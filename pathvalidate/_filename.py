@@ -2,29 +2,65 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import hashlib
 import itertools
+import os
 import posixpath
 import re
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor
 from pathlib import Path, PurePath
 from re import Pattern
-from typing import Final, Optional
+from typing import Final, Optional, Union
 
+from ._aio import run_blocking
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, is_nt_abspath, to_str, truncate_str, validate_pathtype
-from ._const import DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
+from ._cache import engine_cache
+from ._common import (
+    findall_to_str,
+    is_nt_abspath,
+    is_null_pathtype,
+    normalize_platform,
+    to_hashable,
+    to_str,
+)
+from ._const import DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, LengthUnit, Platform
+from ._index import AbstractNameIndex
+from ._replacer import CharReplacer
+from ._result import NULL_NAME_RESULT, CheckResult, FastPathInfo, _FastPathCounter
+from ._truncator import FileNameTruncator
 from ._types import PathType, PlatformType
-from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ValidationError
+from .error import ErrorReason, InvalidCharError, ValidationError
 from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
 _DEFAULT_MAX_FILENAME_LEN: Final = 255
-_RE_INVALID_FILENAME: Final = re.compile(
-    f"[{re.escape(BaseFile._INVALID_FILENAME_CHARS):s}]", re.UNICODE
+_INVALID_FILENAME_REPLACER: Final = CharReplacer(BaseFile._INVALID_FILENAME_CHARS)
+_INVALID_WIN_FILENAME_REPLACER: Final = CharReplacer(BaseFile._INVALID_WIN_FILENAME_CHARS)
+_RE_INVALID_FILENAME: Final = _INVALID_FILENAME_REPLACER.regexp
+_RE_INVALID_WIN_FILENAME: Final = _INVALID_WIN_FILENAME_REPLACER.regexp
+
+# characters that os.path.basename() splits a name at: reserved names are looked up by basename
+_BASENAME_SEPARATORS: Final = "\\/:" if os.name == "nt" else "/"
+
+
+def _make_accept_regexp(invalid_chars: str, check_win_edges: bool) -> Pattern[str]:
+    # a full match means that a name has no invalid characters and no edges that are invalid for
+    # the platform. group(1) is the root name of BaseValidator._check_reserved_keywords().
+    # "." / ".." and names that start with "..." have their own root names: not accepted
+    chars = re.escape(invalid_chars + _BASENAME_SEPARATORS)
+    if check_win_edges:
+        return re.compile(rf"(?!\.{{1,2}}\Z|\.\.\.| )([^{chars}.]*)[^{chars}]*(?<![ .])")
+
+    return re.compile(rf"(?!\.{{1,2}}\Z|\.\.\.)([^{chars}.]*)[^{chars}]*")
+
+
+_RE_ACCEPT_FILENAME: Final = _make_accept_regexp(
+    BaseFile._INVALID_FILENAME_CHARS, check_win_edges=False
 )
-_RE_INVALID_WIN_FILENAME: Final = re.compile(
-    f"[{re.escape(BaseFile._INVALID_WIN_FILENAME_CHARS):s}]", re.UNICODE
+_RE_ACCEPT_WIN_FILENAME: Final = _make_accept_regexp(
+    BaseFile._INVALID_WIN_FILENAME_CHARS, check_win_edges=True
 )
 
 
@@ -39,17 +75,26 @@ class FileNameSanitizer(AbstractSanitizer):
         additional_reserved_names: Optional[Sequence[str]] = None,
         validate_after_sanitize: bool = False,
         validator: Optional[AbstractValidator] = None,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
+        truncator: Optional[FileNameTruncator] = None,
     ) -> None:
+        # the validator that the sanitizer made itself: it can skip the checks of the rules
+        # that a sanitized string is already known to satisfy
+        self.__own_validator: Optional[FileNameValidator] = None
+
         if validator:
             fname_validator = validator
         else:
-            fname_validator = FileNameValidator(
+            fname_validator = self.__own_validator = FileNameValidator(
                 min_len=DEFAULT_MIN_LEN,
                 max_len=max_len,
                 fs_encoding=fs_encoding,
                 check_reserved=True,
                 additional_reserved_names=additional_reserved_names,
                 platform=platform,
+                bounded_work=bounded_work,
+                length_unit=length_unit,
             )
 
         super().__init__(
@@ -61,66 +106,263 @@ class FileNameSanitizer(AbstractSanitizer):
             platform=platform,
             validate_after_sanitize=validate_after_sanitize,
             validator=fname_validator,
+            bounded_work=bounded_work,
+            length_unit=length_unit,
         )
 
-        self._sanitize_regexp = self._get_sanitize_regexp()
+        self._char_replacer = self._get_char_replacer()
+        self._sanitize_regexp = self._char_replacer.regexp
+        self.__truncator = truncator
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
-                    raise
-
-                return self._null_value_handler(e)  # type: ignore
-            raise
-
-        sanitized_filename = self._sanitize_regexp.sub(replacement_text, str(value))
-        sanitized_filename = truncate_str(sanitized_filename, self._fs_encoding, self.max_len)
-
-        try:
-            self._validator.validate(sanitized_filename)
-        except ValidationError as e:
-            if e.reason == ErrorReason.RESERVED_NAME:
-                replacement_word = self._reserved_name_handler(e)
-                if e.reserved_name != replacement_word:
-                    sanitized_filename = re.sub(
-                        re.escape(e.reserved_name), replacement_word, sanitized_filename
-                    )
-            elif e.reason == ErrorReason.INVALID_CHARACTER and self._is_windows(
-                include_universal=True
-            ):
-                # Do not start a file or directory name with a space
-                sanitized_filename = sanitized_filename.lstrip(" ")
-
-                # Do not end a file or directory name with a space or a period
-                sanitized_filename = sanitized_filename.rstrip(" ")
-                if sanitized_filename not in (".", ".."):
-                    sanitized_filename = sanitized_filename.rstrip(" .")
-            elif e.reason == ErrorReason.NULL_NAME:
-                sanitized_filename = self._null_value_handler(e)
+        value = self._bound_input(value)
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            if isinstance(value, PurePath):
+                NULL_NAME_RESULT.raise_error()
+
+            return self._null_value_handler(NULL_NAME_RESULT.make_error())  # type: ignore
+
+        unicode_filename = str(value)
+        sanitized_filename = self._sanitize_nonnull(
+            self._replace_invalid_chars(unicode_filename, replacement_text),
+            is_char_clean=self._is_clean_replacement(replacement_text),
+        )
+
+        if sanitized_filename == unicode_filename and isinstance(value, (str, Path)):
+            # unchanged: return the original object rather than a copy of it
+            return value
+
+        if isinstance(value, PurePath):
+            return Path(sanitized_filename)  # type: ignore
+
+        return sanitized_filename  # type: ignore
+
+    def sanitize_unique(
+        self,
+        value: PathType,
+        index: AbstractNameIndex,
+        replacement_text: str = "",
+        hash_len: int = 0,
+    ) -> str:
+        """Sanitize the ``value`` to a filename that is not registered in the ``index`` yet,
+        and register it.
+
+        Distinct values that are sanitized to the same filename, such as ``"a:b"`` and
+        ``"a?b"``, get distinct filenames: a number is added to the later ones,
+        such as ``"name (2).ext"``.
+
+        Args:
+            value: Filename to sanitize.
+            index:
+                Names already issued in the destination:
+                a :py:class:`NameIndex` or a :py:class:`SQLiteNameIndex`.
+            replacement_text: Replacement text for invalid characters.
+            hash_len:
+                If greater than zero, a colliding filename first gets a tag of the SHA-256 digest
+                of the ``value`` with the number of hexadecimal digits instead of a number,
+                such as ``"name~1a2b3c.ext"``.
+                The tags do not depend on the order of the values.
+                Numbers are added only if the tagged filename collides as well.
+
+        Returns:
+            str: A sanitized filename that was not registered in the ``index``.
+            An empty string is not registered.
+
+        Raises:
+            ValueError:
+                If the ``max_len`` is too short to add a number to the filename.
+        """
+
+        sanitized_filename = str(self.sanitize(value, replacement_text))
+        if not sanitized_filename:
+            return sanitized_filename
+
+        if hash_len > 0 and sanitized_filename in index:
+            digest = hashlib.sha256(to_str(value).encode("utf-8", "surrogatepass")).hexdigest()
+            tag = f"~{digest[:hash_len]}"
+            # a tag that does not fit in the max_len falls back to the numbers
+            if self._can_tag(tag):
+                tagged_filename = self._make_tagged_name(sanitized_filename, tag)
+                if index.add(tagged_filename):
+                    return tagged_filename
+
+        return index.claim(
+            sanitized_filename, lambda num: self._make_numbered_name(sanitized_filename, num)
+        )
+
+    async def sanitize_unique_async(
+        self,
+        value: PathType,
+        directory: Union[str, "os.PathLike[str]"],
+        replacement_text: str = "",
+        executor: Optional[Executor] = None,
+    ) -> str:
+        """Sanitize the ``value`` to a filename that does not exist in the ``directory``.
+
+        The sanitization runs in the event loop thread, while the lookups of the existing
+        files in the ``directory`` run in the ``executor``.
+        If the sanitized filename exists, a number is added to the name,
+        such as ``"name (2).ext"``.
+
+        Note that this method does not create the file:
+        create it in an exclusive mode (``"x"``) to detect a file created in the meantime.
+
+        Args:
+            value: Filename to sanitize.
+            directory: Directory where the filename is going to be created.
+            replacement_text: Replacement text for invalid characters.
+            executor:
+                Executor to run the lookups of the existing files.
+                If |None|, the default executor of the event loop.
+
+        Returns:
+            str: A sanitized filename that does not exist in the ``directory``.
+
+        Raises:
+            ValueError:
+                If the ``max_len`` is too short to add a number to the filename.
+        """
+
+        sanitized_filename = str(self.sanitize(value, replacement_text))
+        if not sanitized_filename:
+            return sanitized_filename
+
+        return await run_blocking(
+            executor, self._find_unused_name, os.fspath(directory), sanitized_filename
+        )
+
+    def _find_unused_name(self, directory: str, filename: str) -> str:
+        candidate = filename
+        num = 1
+
+        while os.path.lexists(os.path.join(directory, candidate)):
+            num += 1
+            candidate = self._make_numbered_name(filename, num)
+
+        return candidate
+
+    def _make_numbered_name(self, filename: str, num: int) -> str:
+        return self._make_tagged_name(filename, f" ({num:d})")
+
+    def _can_tag(self, tag: str) -> bool:
+        # whether a tag fits in the max_len with a character of the stem
+        return self._get_len(tag) < self.max_len
+
+    def _make_tagged_name(self, filename: str, tag: str) -> str:
+        # add the tag between the stem and the extension, within the max_len
+        if not self._can_tag(tag):
+            raise ValueError(
+                f"max_len is too short to add a tag to a filename: max_len={self.max_len}, "
+                f"tag={tag!r}"
+            )
+
+        stem, ext = posixpath.splitext(filename)
+        suffix = f"{tag}{ext}"
+        max_stem_len = self.max_len - self._get_len(suffix)
+        if max_stem_len >= 1 or not stem:
+            return self._truncate(stem, max(max_stem_len, 0)) + suffix
+
+        # the extension leaves no room for the stem: keep a character of the stem
+        # (a name does not start with the tag) and truncate the extension instead.
+        # a truncated extension does not end with a period or a space (invalid on Windows)
+        stem = self._truncate(stem, 1)
+        max_ext_len = self.max_len - self._get_len(stem) - self._get_len(tag)
+        ext = self._truncate(ext, max_ext_len).rstrip(". ")
+
+        return f"{stem}{tag}{ext}"
+
+    def _replace_invalid_chars(self, unicode_filename: str, replacement_text: str) -> str:
+        max_len = self.max_len
+        if len(unicode_filename) <= max_len or self.__truncator is not None:
+            # a truncator reads the end of a name (the extension) as well
+            return self._char_replacer.sub(replacement_text, unicode_filename)
+
+        # the result is truncated to max_len bytes, and every character takes at least one byte:
+        # replace a chunk at a time until max_len characters are made, and leave the rest unread
+        chunks: list[str] = []
+        made_len = 0
+        for start in range(0, len(unicode_filename), max_len):
+            chunk = self._char_replacer.sub(
+                replacement_text, unicode_filename[start : start + max_len]
+            )
+            chunks.append(chunk)
+            made_len += len(chunk)
+            if made_len >= max_len:
+                break
+
+        return "".join(chunks)
+
+    def _is_clean_replacement(self, replacement_text: str) -> bool:
+        # no invalid character remains after the substitution if the replacement has none
+        return not replacement_text or self._sanitize_regexp.search(replacement_text) is None
+
+    def _sanitize_nonnull(self, sanitized_filename: str, is_char_clean: bool) -> str:
+        """Truncate, check and repair a filename whose invalid characters are already replaced.
+
+        Args:
+            sanitized_filename: Filename after the replacement of the invalid characters.
+            is_char_clean:
+                |True| if the ``sanitized_filename`` is known to include no invalid characters.
+        """
+
+        byte_ct = self._get_len(sanitized_filename, limit=self.max_len)
+        if byte_ct > self.max_len:
+            if self.__truncator is None:
+                sanitized_filename = self._truncate(sanitized_filename, self.max_len)
+            else:
+                sanitized_filename = self.__truncator.truncate(
+                    sanitized_filename, self.max_len, self._fs_encoding, self.length_unit
+                )
+            byte_ct = self._get_len(sanitized_filename)
+
+        if is_char_clean and self.__own_validator is not None:
+            result = self.__own_validator._check_sanitized(sanitized_filename, byte_ct)
+        else:
+            result = self._validator.check(sanitized_filename)
+
+        if result is not None:
+            sanitized_filename = self.__repair(sanitized_filename, result)
 
         if self._validate_after_sanitize:
-            try:
-                self._validator.validate(sanitized_filename)
-            except ValidationError as e:
+            result = self._validator.check(sanitized_filename)
+            if result is not None:
                 raise ValidationError(
-                    description=str(e),
+                    description=str(result.make_error()),
                     reason=ErrorReason.INVALID_AFTER_SANITIZE,
                     platform=self.platform,
                 )
 
-        if isinstance(value, PurePath):
-            return Path(sanitized_filename)  # type: ignore
-
-        return sanitized_filename  # type: ignore
+        return sanitized_filename
+
+    def __repair(self, sanitized_filename: str, result: CheckResult) -> str:
+        if result.reason == ErrorReason.RESERVED_NAME:
+            e = result.make_error()
+            replacement_word = self._reserved_name_handler(e)
+            if e.reserved_name != replacement_word:
+                return re.sub(re.escape(e.reserved_name), replacement_word, sanitized_filename)
+        elif result.reason == ErrorReason.INVALID_CHARACTER and self._is_windows(
+            include_universal=True
+        ):
+            # Do not start a file or directory name with a space
+            sanitized_filename = sanitized_filename.lstrip(" ")
+
+            # Do not end a file or directory name with a space or a period
+            sanitized_filename = sanitized_filename.rstrip(" ")
+            if sanitized_filename not in (".", ".."):
+                sanitized_filename = sanitized_filename.rstrip(" .")
+        elif result.reason == ErrorReason.NULL_NAME:
+            return self._null_value_handler(result.make_error())
+
+        return sanitized_filename
 
     def _get_sanitize_regexp(self) -> Pattern[str]:
+        return self._get_char_replacer().regexp
+
+    def _get_char_replacer(self) -> CharReplacer:
         if self._is_windows(include_universal=True):
-            return _RE_INVALID_WIN_FILENAME
+            return _INVALID_WIN_FILENAME_REPLACER
 
-        return _RE_INVALID_FILENAME
+        return _INVALID_FILENAME_REPLACER
 
 
 class FileNameValidator(BaseValidator):
@@ -137,9 +379,8 @@ class FileNameValidator(BaseValidator):
     )
     _MACOS_RESERVED_FILE_NAMES: Final = (":",)
 
-    @property
-    def reserved_keywords(self) -> tuple[str, ...]:
-        common_keywords = super().reserved_keywords
+    def _make_reserved_keywords(self) -> tuple[str, ...]:
+        common_keywords = super()._make_reserved_keywords()
 
         if self._is_universal():
             word_set = set(
@@ -164,6 +405,9 @@ class FileNameValidator(BaseValidator):
         platform: Optional[PlatformType] = None,
         check_reserved: bool = True,
         additional_reserved_names: Optional[Sequence[str]] = None,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
+        fast_path_stats: bool = False,
     ) -> None:
         super().__init__(
             min_len=min_len,
@@ -172,107 +416,267 @@ class FileNameValidator(BaseValidator):
             check_reserved=check_reserved,
             additional_reserved_names=additional_reserved_names,
             platform=platform,
+            bounded_work=bounded_work,
+            length_unit=length_unit,
         )
 
-    def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
+        if self._is_windows(include_universal=True):
+            self.__accept_regexp = _RE_ACCEPT_WIN_FILENAME
+        else:
+            self.__accept_regexp = _RE_ACCEPT_FILENAME
 
-        unicode_filename = to_str(value)
-        byte_ct = len(unicode_filename.encode(self._fs_encoding))
+        # statistics of the fast acceptance check: opt-in, so that the checks of the instances
+        # shared by threads (such as those of engine_cache) do not write to them
+        self.__fast_path_counter: Optional[_FastPathCounter] = None
+        if fast_path_stats:
+            self.__fast_path_counter = _FastPathCounter()
 
-        self.validate_abspath(unicode_filename)
+    def fast_path_info(self) -> Optional[FastPathInfo]:
+        """Return the statistics of the fast acceptance check.
 
-        err_kwargs = {
-            ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
-            ErrorAttrKey.PLATFORM: self.platform,
-            ErrorAttrKey.FS_ENCODING: self._fs_encoding,
-            ErrorAttrKey.BYTE_COUNT: byte_ct,
-            ErrorAttrKey.VALUE: unicode_filename,
-        }
-        if byte_ct > self.max_len:
-            raise ValidationError(
-                [
-                    f"filename is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
-            )
-        if byte_ct < self.min_len:
-            raise ValidationError(
-                [
-                    f"filename is too short: expected>={self.min_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
-            )
+        Each checked name is first matched against a single precompiled regular expression of
+        the platform that combines the character and the edge rules,
+        followed by the length and the reserved name lookups.
+        Names that pass are accepted immediately, and only the others go through the
+        detailed checks that locate the error.
 
-        self._validate_reserved_keywords(unicode_filename)
-        self.__validate_universal_filename(unicode_filename)
+        The statistics are enabled by ``fast_path_stats=True`` at the creation of the validator.
 
-        if self._is_windows(include_universal=True):
-            self.__validate_win_filename(unicode_filename)
+        Returns:
+            Optional[FastPathInfo]:
+                Numbers of the names accepted by the fast check and of the others.
+                |None| if the statistics are disabled.
+        """
+
+        if self.__fast_path_counter is None:
+            return None
+
+        return self.__fast_path_counter.to_info()
 
     def validate_abspath(self, value: str) -> None:
-        err = ValidationError(
-            description=f"found an absolute path ({value!r}), expected a filename",
-            platform=self.platform,
-            reason=ErrorReason.FOUND_ABS_PATH,
-        )
+        result = self._check_abspath(value)
+        if result is not None:
+            result.raise_error()
+
+    def _check_nonnull(self, value: PathType) -> Optional[CheckResult]:
+        unicode_filename = to_str(value)
+        if self._bounded_work and len(unicode_filename) > self.max_len:
+            # too long regardless of the other rules: every character takes at least one byte
+            return self.__make_length_result(
+                unicode_filename, len(unicode_filename), is_too_long=True
+            )
+
+        byte_ct = self._get_len(unicode_filename, limit=self.max_len)
+
+        is_accepted = self.__is_accepted(unicode_filename, byte_ct)
+        if self.__fast_path_counter is not None:
+            self.__fast_path_counter.add(fast=int(is_accepted), slow=int(not is_accepted))
+        if is_accepted:
+            return None
+
+        result = self._check_abspath(unicode_filename)
+        if result is not None:
+            return result
+
+        result = self.__check_length(unicode_filename, byte_ct)
+        if result is not None:
+            return result
+
+        result = self._check_reserved_keywords(unicode_filename)
+        if result is not None:
+            return result
+
+        result = self.__check_universal_filename(unicode_filename)
+        if result is not None:
+            return result
 
         if self._is_windows(include_universal=True):
-            if is_nt_abspath(value):
-                raise err
+            return self.__check_win_filename(unicode_filename)
 
-        if posixpath.isabs(value):
-            raise err
+        return None
 
-    def __validate_universal_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_FILENAME.findall(unicode_filename)
-        if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match),
+    def _check_sanitized(self, unicode_filename: str, byte_ct: int) -> Optional[CheckResult]:
+        """Equivalent to :py:meth:`check` for a string that is known to include
+        neither invalid characters nor path separators, and whose byte length is ``byte_ct``.
+        """
+
+        is_windows = self._is_windows(include_universal=True)
+
+        # same as is_null_pathtype() for a string
+        if not unicode_filename or (is_windows and unicode_filename.isspace()):
+            return NULL_NAME_RESULT
+
+        is_accepted = self.__is_accepted(unicode_filename, byte_ct)
+        if self.__fast_path_counter is not None:
+            self.__fast_path_counter.add(fast=int(is_accepted), slow=int(not is_accepted))
+        if is_accepted:
+            return None
+
+        result = self.__check_length(unicode_filename, byte_ct)
+        if result is not None:
+            return result
+
+        result = self._check_reserved_keywords(unicode_filename)
+        if result is not None:
+            return result
+
+        if is_windows:
+            return self.__check_win_edges(unicode_filename)
+
+        return None
+
+    def __is_accepted(self, unicode_filename: str, byte_ct: int) -> bool:
+        # True if the name is known to be valid without the detailed checks.
+        # False does not mean invalid: the name needs the detailed checks
+        if not (self.min_len <= byte_ct <= self.max_len):
+            return False
+
+        match = self.__accept_regexp.fullmatch(unicode_filename)
+        if match is None:
+            return False
+
+        return not (
+            self._check_reserved
+            and (
+                self._is_reserved_keyword(match.group(1))
+                or self._is_reserved_keyword(unicode_filename)
+            )
+        )
+
+    def __check_length(self, unicode_filename: str, byte_ct: int) -> Optional[CheckResult]:
+        if byte_ct > self.max_len:
+            return self.__make_length_result(unicode_filename, byte_ct, is_too_long=True)
+        if byte_ct < self.min_len:
+            return self.__make_length_result(unicode_filename, byte_ct, is_too_long=False)
+
+        return None
+
+    def _check_abspath(self, value: str) -> Optional[CheckResult]:
+        if (self._is_windows(include_universal=True) and is_nt_abspath(value)) or posixpath.isabs(
+            value
+        ):
+            return CheckResult(
+                reason=ErrorReason.FOUND_ABS_PATH,
+                platform=self.platform,
+                span=(0, len(value)),
+                make_error=lambda: ValidationError(
+                    description=f"found an absolute path ({value!r}), expected a filename",
+                    platform=self.platform,
+                    reason=ErrorReason.FOUND_ABS_PATH,
                 ),
-                platform=Platform.UNIVERSAL,
+            )
+
+        return None
+
+    def __make_length_result(
+        self, unicode_filename: str, byte_ct: int, is_too_long: bool
+    ) -> CheckResult:
+        def make_error() -> ValidationError:
+            unit = self.length_unit.value
+            if is_too_long and self._bounded_work:
+                # do not read the rest of the value: report the lower bound
+                actual_byte_ct = byte_ct
+                msg = (
+                    f"filename is too long: expected<={self.max_len:d} {unit}, "
+                    f"actual>={actual_byte_ct:d} {unit}"
+                )
+            elif is_too_long:
+                # byte_ct might be a lower bound (see get_str_len)
+                actual_byte_ct = self._get_len(unicode_filename)
+                msg = (
+                    f"filename is too long: expected<={self.max_len:d} {unit}, "
+                    f"actual={actual_byte_ct:d} {unit}"
+                )
+            else:
+                actual_byte_ct = byte_ct
+                msg = (
+                    f"filename is too short: expected>={self.min_len:d} {unit}, "
+                    f"actual={actual_byte_ct:d} {unit}"
+                )
+
+            return ValidationError(
+                [msg],
+                reason=ErrorReason.INVALID_LENGTH,
+                platform=self.platform,
+                fs_encoding=self._fs_encoding,
+                byte_count=actual_byte_ct,
                 value=unicode_filename,
             )
 
-    def __validate_win_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_WIN_FILENAME.findall(unicode_filename)
-        if match:
-            raise InvalidCharError(
+        return CheckResult(
+            reason=ErrorReason.INVALID_LENGTH,
+            platform=self.platform,
+            span=(0, len(unicode_filename)),
+            make_error=make_error,
+        )
+
+    @staticmethod
+    def __check_invalid_char(
+        regexp: Pattern[str], unicode_filename: str, platform: Platform
+    ) -> Optional[CheckResult]:
+        match = regexp.search(unicode_filename)
+        if match is None:
+            return None
+
+        return CheckResult(
+            reason=ErrorReason.INVALID_CHARACTER,
+            platform=platform,
+            span=match.span(),
+            make_error=lambda: InvalidCharError(
                 INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match),
+                    invalid=findall_to_str(regexp.findall(unicode_filename)),
                 ),
-                platform=Platform.WINDOWS,
+                platform=platform,
                 value=unicode_filename,
-            )
+            ),
+        )
 
-        if unicode_filename in (".", ".."):
-            return
+    def __check_universal_filename(self, unicode_filename: str) -> Optional[CheckResult]:
+        return self.__check_invalid_char(_RE_INVALID_FILENAME, unicode_filename, Platform.UNIVERSAL)
 
-        KB2829981_err_tmpl = "{}. Refer: https://learn.microsoft.com/en-us/troubleshoot/windows-client/shell-experience/file-folder-name-whitespace-characters"  # noqa: E501
-        err_kwargs = {
-            ErrorAttrKey.PLATFORM: Platform.WINDOWS,
-            ErrorAttrKey.VALUE: unicode_filename,
-        }
+    def __check_win_filename(self, unicode_filename: str) -> Optional[CheckResult]:
+        result = self.__check_invalid_char(
+            _RE_INVALID_WIN_FILENAME, unicode_filename, Platform.WINDOWS
+        )
+        if result is not None:
+            return result
+
+        return self.__check_win_edges(unicode_filename)
+
+    def __check_win_edges(self, unicode_filename: str) -> Optional[CheckResult]:
+        if unicode_filename in (".", ".."):
+            return None
 
         if unicode_filename[-1] in (" ", "."):
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[-1])),
-                description=KB2829981_err_tmpl.format(
-                    "Do not end a file or directory name with a space or a period"
-                ),
-                **err_kwargs,
+            return self.__make_win_edge_result(
+                unicode_filename,
+                len(unicode_filename) - 1,
+                "Do not end a file or directory name with a space or a period",
             )
 
         if unicode_filename[0] in (" "):
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[0])),
-                description=KB2829981_err_tmpl.format(
-                    "Do not start a file or directory name with a space"
-                ),
-                **err_kwargs,
+            return self.__make_win_edge_result(
+                unicode_filename, 0, "Do not start a file or directory name with a space"
             )
 
+        return None
+
+    @staticmethod
+    def __make_win_edge_result(unicode_filename: str, index: int, msg: str) -> CheckResult:
+        KB2829981_err_tmpl = "{}. Refer: https://learn.microsoft.com/en-us/troubleshoot/windows-client/shell-experience/file-folder-name-whitespace-characters"  # noqa: E501
+
+        return CheckResult(
+            reason=ErrorReason.INVALID_CHARACTER,
+            platform=Platform.WINDOWS,
+            span=(index, index + 1),
+            make_error=lambda: InvalidCharError(
+                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[index])),
+                description=KB2829981_err_tmpl.format(msg),
+                platform=Platform.WINDOWS,
+                value=unicode_filename,
+            ),
+        )
+
 
 def validate_filename(
     filename: PathType,
@@ -334,7 +738,7 @@ def validate_filename(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FileNameValidator(
+    _get_validator(
         platform=platform,
         min_len=min_len,
         max_len=max_len,
@@ -344,6 +748,48 @@ def validate_filename(
     ).validate(filename)
 
 
+def validate_filenames(
+    filenames: Iterable[PathType],
+    platform: Optional[PlatformType] = None,
+    min_len: int = DEFAULT_MIN_LEN,
+    max_len: int = _DEFAULT_MAX_FILENAME_LEN,
+    fs_encoding: Optional[str] = None,
+    check_reserved: bool = True,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+) -> Iterator[tuple[int, PathType, ErrorReason]]:
+    """Verifying whether each of the ``filenames`` is a valid file name or not.
+    Validation errors are not raised: invalid file names are lazily yielded instead.
+
+    Args:
+        filenames:
+            Filenames to validate.
+        platform:
+            Target platform name of the filenames.
+
+            .. include:: platform.txt
+
+    Yields:
+        Tuple[int, PathType, ErrorReason]:
+            Index in the ``filenames``, the invalid filename, and the cause of the failure.
+
+    Raises:
+        TypeError:
+            If a filename is not a string or a path-like object.
+
+    See Also:
+        :py:func:`.validate_filename()` for the other arguments.
+    """
+
+    return _get_validator(
+        platform=platform,
+        min_len=min_len,
+        max_len=max_len,
+        fs_encoding=fs_encoding,
+        check_reserved=check_reserved,
+        additional_reserved_names=additional_reserved_names,
+    ).validate_many(filenames)
+
+
 def is_valid_filename(
     filename: PathType,
     platform: Optional[PlatformType] = None,
@@ -368,7 +814,7 @@ def is_valid_filename(
         :py:func:`.validate_filename()`
     """
 
-    return FileNameValidator(
+    return _get_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -467,7 +913,7 @@ def sanitize_filename(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FileNameSanitizer(
+    return _get_sanitizer(
         platform=platform,
         max_len=-1 if max_len is None else max_len,
         fs_encoding=fs_encoding,
@@ -476,3 +922,68 @@ def sanitize_filename(
         additional_reserved_names=additional_reserved_names,
         validate_after_sanitize=validate_after_sanitize,
     ).sanitize(filename, replacement_text)
+
+
+def _get_validator(
+    platform: Optional[PlatformType],
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Sequence[str]],
+) -> FileNameValidator:
+    platform = normalize_platform(platform)
+
+    return engine_cache.get_or_create(
+        (
+            FileNameValidator,
+            platform,
+            min_len,
+            max_len,
+            fs_encoding,
+            check_reserved,
+            to_hashable(additional_reserved_names),
+        ),
+        lambda: FileNameValidator(
+            platform=platform,
+            min_len=min_len,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+        ),
+    )
+
+
+def _get_sanitizer(
+    platform: Optional[PlatformType],
+    max_len: int,
+    fs_encoding: Optional[str],
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Sequence[str]],
+    validate_after_sanitize: bool,
+) -> FileNameSanitizer:
+    platform = normalize_platform(platform)
+
+    return engine_cache.get_or_create(
+        (
+            FileNameSanitizer,
+            platform,
+            max_len,
+            fs_encoding,
+            null_value_handler,
+            reserved_name_handler,
+            to_hashable(additional_reserved_names),
+            validate_after_sanitize,
+        ),
+        lambda: FileNameSanitizer(
+            platform=platform,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            null_value_handler=null_value_handler,
+            reserved_name_handler=reserved_name_handler,
+            additional_reserved_names=additional_reserved_names,
+            validate_after_sanitize=validate_after_sanitize,
+        ),
+    )
@@ -2,29 +2,62 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import functools
 import ntpath
 import os.path
 import posixpath
 import re
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path, PurePath
 from re import Pattern
 from typing import Final, Optional
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, is_nt_abspath, to_str, validate_pathtype
-from ._const import _NTFS_RESERVED_FILE_NAMES, DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
+from ._cache import CacheInfo, LRUCache, engine_cache
+from ._common import (
+    findall_to_str,
+    is_nt_abspath,
+    is_null_pathtype,
+    normalize_platform,
+    to_hashable,
+    to_str,
+)
+from ._const import (
+    _NTFS_RESERVED_FILE_NAMES,
+    DEFAULT_MIN_LEN,
+    INVALID_CHAR_ERR_MSG_TMPL,
+    LengthUnit,
+    Platform,
+)
 from ._filename import FileNameSanitizer, FileNameValidator
+from ._replacer import CharReplacer
+from ._result import NULL_NAME_RESULT, CheckResult
+from ._truncator import FileNameTruncator
 from ._types import PathType, PlatformType
-from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ReservedNameError, ValidationError
+from .error import ErrorReason, InvalidCharError, ReservedNameError, ValidationError
 from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
-_RE_INVALID_PATH: Final = re.compile(f"[{re.escape(BaseFile._INVALID_PATH_CHARS):s}]", re.UNICODE)
-_RE_INVALID_WIN_PATH: Final = re.compile(
-    f"[{re.escape(BaseFile._INVALID_WIN_PATH_CHARS):s}]", re.UNICODE
-)
+_INVALID_PATH_REPLACER: Final = CharReplacer(BaseFile._INVALID_PATH_CHARS)
+_INVALID_WIN_PATH_REPLACER: Final = CharReplacer(BaseFile._INVALID_WIN_PATH_CHARS)
+_RE_INVALID_PATH: Final = _INVALID_PATH_REPLACER.regexp
+_RE_INVALID_WIN_PATH: Final = _INVALID_WIN_PATH_REPLACER.regexp
+
+# maximum number of characters of a drive that the bounded-work mode parses:
+# longer than the longest UNC drive that Windows accepts ("\\\\?\\UNC\\" + 255 + "\\" + 80)
+_BOUNDED_WORK_MAX_DRIVE_LEN: Final = 512
+
+
+def _get_invalid_path_replacer(is_windows: bool) -> CharReplacer:
+    if is_windows:
+        return _INVALID_WIN_PATH_REPLACER
+
+    return _INVALID_PATH_REPLACER
+
+
+def _get_invalid_path_regexp(is_windows: bool) -> Pattern[str]:
+    return _get_invalid_path_replacer(is_windows).regexp
 
 
 class FilePathSanitizer(AbstractSanitizer):
@@ -39,7 +72,12 @@ class FilePathSanitizer(AbstractSanitizer):
         normalize: bool = True,
         validate_after_sanitize: bool = False,
         validator: Optional[AbstractValidator] = None,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
+        truncator: Optional[FileNameTruncator] = None,
     ) -> None:
+        self.__has_own_validator = not validator
+
         if validator:
             fpath_validator = validator
         else:
@@ -50,6 +88,8 @@ class FilePathSanitizer(AbstractSanitizer):
                 check_reserved=True,
                 additional_reserved_names=additional_reserved_names,
                 platform=platform,
+                bounded_work=bounded_work,
+                length_unit=length_unit,
             )
         super().__init__(
             max_len=max_len,
@@ -60,9 +100,12 @@ class FilePathSanitizer(AbstractSanitizer):
             additional_reserved_names=additional_reserved_names,
             platform=platform,
             validate_after_sanitize=validate_after_sanitize,
+            bounded_work=bounded_work,
+            length_unit=length_unit,
         )
 
-        self._sanitize_regexp = self._get_sanitize_regexp()
+        self._char_replacer = _get_invalid_path_replacer(self._is_windows(include_universal=True))
+        self._sanitize_regexp = self._char_replacer.regexp
         self.__fname_sanitizer = FileNameSanitizer(
             max_len=self.max_len,
             fs_encoding=fs_encoding,
@@ -71,6 +114,9 @@ class FilePathSanitizer(AbstractSanitizer):
             additional_reserved_names=additional_reserved_names,
             platform=self.platform,
             validate_after_sanitize=validate_after_sanitize,
+            bounded_work=bounded_work,
+            length_unit=length_unit,
+            truncator=truncator,
         )
         self.__normalize = normalize
 
@@ -80,23 +126,29 @@ class FilePathSanitizer(AbstractSanitizer):
             self.__split_drive = posixpath.splitdrive
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
-                    raise
+        value = self._bound_input(value)
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            if isinstance(value, PurePath):
+                NULL_NAME_RESULT.raise_error()
 
-                return self._null_value_handler(e)  # type: ignore
-            raise
+            return self._null_value_handler(NULL_NAME_RESULT.make_error())  # type: ignore
 
         unicode_filepath = to_str(value)
         drive, unicode_filepath = self.__split_drive(unicode_filepath)
-        unicode_filepath = self._sanitize_regexp.sub(replacement_text, unicode_filepath)
+        unicode_filepath = self._char_replacer.sub(replacement_text, unicode_filepath)
         if self.__normalize and unicode_filepath:
             unicode_filepath = os.path.normpath(unicode_filepath)
         sanitized_path = unicode_filepath
 
+        fname_sanitizer = self.__fname_sanitizer
+        # the path-level substitution has already replaced every invalid character of
+        # the components except the separators: the filename-level substitution
+        # and the character checks can be skipped unless the replacement reintroduces them
+        is_char_clean = fname_sanitizer._is_clean_replacement(replacement_text)
+        is_windows = self._is_windows(include_universal=True)
+        fname_regexp = fname_sanitizer._sanitize_regexp
+        needs_full_check = not (self.__has_own_validator and is_char_clean)
+
         sanitized_entries: list[str] = []
         if drive:
             sanitized_entries.append(drive)
@@ -105,36 +157,55 @@ class FilePathSanitizer(AbstractSanitizer):
                 sanitized_entries.append(f"{entry}_")
                 continue
 
-            sanitized_entry = str(
-                self.__fname_sanitizer.sanitize(entry, replacement_text=replacement_text)
-            )
+            if is_char_clean and entry and not (is_windows and entry.isspace()):
+                sanitized_entry = fname_sanitizer._sanitize_nonnull(entry, is_char_clean=True)
+            else:
+                sanitized_entry = str(
+                    fname_sanitizer.sanitize(entry, replacement_text=replacement_text)
+                )
             if not sanitized_entry:
                 if not sanitized_entries:
                     sanitized_entries.append("")
                 continue
 
+            if is_windows and (
+                sanitized_entry.isspace()
+                or (
+                    sanitized_entry is not entry
+                    and fname_regexp.search(sanitized_entry) is not None
+                )
+            ):
+                # a handler may have made a blank component or a new drive/separator
+                needs_full_check = True
+
             sanitized_entries.append(sanitized_entry)
 
         sanitized_path = self.__get_path_separator().join(sanitized_entries)
-        try:
-            self._validator.validate(sanitized_path)
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                sanitized_path = self._null_value_handler(e)
+        if not needs_full_check:
+            # the only failure that matters here is a null path: components without
+            # invalid characters cannot make the validator report a null name
+            if is_null_pathtype(sanitized_path, allow_whitespaces=not is_windows):
+                sanitized_path = self._null_value_handler(NULL_NAME_RESULT.make_error())
+        else:
+            result = self._validator.check(sanitized_path)
+            if result is not None and result.reason == ErrorReason.NULL_NAME:
+                sanitized_path = self._null_value_handler(result.make_error())
 
         if self._validate_after_sanitize:
             self._validator.validate(sanitized_path)
 
+        if sanitized_path == to_str(value):
+            # unchanged: return the original object rather than a copy of it
+            if isinstance(value, (str, Path)):
+                return value
+
         if isinstance(value, PurePath):
             return Path(sanitized_path)  # type: ignore
 
         return sanitized_path  # type: ignore
 
     def _get_sanitize_regexp(self) -> Pattern[str]:
-        if self._is_windows(include_universal=True):
-            return _RE_INVALID_WIN_PATH
-
-        return _RE_INVALID_PATH
+        return _get_invalid_path_regexp(self._is_windows(include_universal=True))
 
     def __get_path_separator(self) -> str:
         if self._is_windows():
@@ -150,9 +221,8 @@ class FilePathValidator(BaseValidator):
     )
     _MACOS_RESERVED_FILE_PATHS: Final = ("/", ":")
 
-    @property
-    def reserved_keywords(self) -> tuple[str, ...]:
-        common_keywords = super().reserved_keywords
+    def _make_reserved_keywords(self) -> tuple[str, ...]:
+        common_keywords = super()._make_reserved_keywords()
 
         if any([self._is_universal(), self._is_posix(), self._is_macos()]):
             return common_keywords + self._MACOS_RESERVED_FILE_PATHS
@@ -170,6 +240,9 @@ class FilePathValidator(BaseValidator):
         platform: Optional[PlatformType] = None,
         check_reserved: bool = True,
         additional_reserved_names: Optional[Sequence[str]] = None,
+        prefix_cache_size: int = 0,
+        bounded_work: bool = False,
+        length_unit: Optional[LengthUnit] = None,
     ) -> None:
         super().__init__(
             min_len=min_len,
@@ -178,8 +251,16 @@ class FilePathValidator(BaseValidator):
             check_reserved=check_reserved,
             additional_reserved_names=additional_reserved_names,
             platform=platform,
+            bounded_work=bounded_work,
+            length_unit=length_unit,
         )
 
+        # results of the checks of directory prefixes and their components:
+        # paths that share a directory prefix only check their last component
+        self.__prefix_cache: Optional[LRUCache[Optional[CheckResult]]] = None
+        if prefix_cache_size > 0:
+            self.__prefix_cache = LRUCache(maxsize=prefix_cache_size)
+
         self.__fname_validator = FileNameValidator(
             min_len=min_len,
             max_len=self.max_len,
@@ -187,6 +268,7 @@ class FilePathValidator(BaseValidator):
             check_reserved=check_reserved,
             additional_reserved_names=additional_reserved_names,
             platform=platform,
+            length_unit=length_unit,
         )
 
         if self._is_windows(include_universal=True):
@@ -194,115 +276,283 @@ class FilePathValidator(BaseValidator):
         else:
             self.__split_drive = posixpath.splitdrive
 
-    def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        self.validate_abspath(value)
-
-        _drive, tail = self.__split_drive(value)
+    def _check_nonnull(self, value: PathType) -> Optional[CheckResult]:
+        if self._bounded_work and len(to_str(value)) > self.max_len:
+            # too long regardless of the other rules if the part after the drive is:
+            # every character takes at least one byte. the drive is split off from the beginning
+            # of the value, so that the rest of the value is not read
+            unicode_value = to_str(value)
+            head = unicode_value[: self.max_len + _BOUNDED_WORK_MAX_DRIVE_LEN]
+            drive, _tail = self.__split_drive(head)
+            tail_len = len(unicode_value) - len(drive)
+            if tail_len > self.max_len:
+                return self.__make_length_result(unicode_value, tail_len, is_too_long=True)
+
+        result = self._check_abspath(value)
+        if result is not None:
+            return result
+
+        drive, tail = self.__split_drive(value)
         if not tail:
-            return
+            return None
 
         unicode_filepath = to_str(tail)
-        byte_ct = len(unicode_filepath.encode(self._fs_encoding))
-        err_kwargs = {
-            ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
-            ErrorAttrKey.PLATFORM: self.platform,
-            ErrorAttrKey.FS_ENCODING: self._fs_encoding,
-            ErrorAttrKey.BYTE_COUNT: byte_ct,
-            ErrorAttrKey.VALUE: unicode_filepath,
-        }
+        byte_ct = self._get_len(unicode_filepath, limit=self.max_len)
 
         if byte_ct > self.max_len:
-            raise ValidationError(
-                [
-                    f"file path is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
-            )
+            return self.__make_length_result(unicode_filepath, byte_ct, is_too_long=True)
         if byte_ct < self.min_len:
-            raise ValidationError(
-                [
-                    "file path is too short: expected>={:d} bytes, actual={:d} bytes".format(
-                        self.min_len, byte_ct
-                    )
-                ],
-                **err_kwargs,
-            )
+            return self.__make_length_result(unicode_filepath, byte_ct, is_too_long=False)
+
+        offset = len(to_str(drive))
+        result = self._check_reserved_keywords(unicode_filepath)
+        if result is not None:
+            return result.shift(offset)
 
-        self._validate_reserved_keywords(unicode_filepath)
         unicode_filepath = unicode_filepath.replace("\\", "/")
+        is_windows = self._is_windows(include_universal=True)
+
+        # a single scan of the whole path for invalid characters: if it finds none,
+        # the characters of the components do not need to be checked one by one
+        if _get_invalid_path_regexp(is_windows).search(unicode_filepath) is None:
+            if self.__prefix_cache is None:
+                result = self.__check_clean_entries(unicode_filepath, offset)
+            else:
+                result = self.__check_clean_entries_cached(unicode_filepath, offset)
+            if result is None and is_windows:
+                result = self.__check_ntfs_reserved(unicode_filepath, offset)
+
+            return result
+
+        entry_offset = offset
         for entry in unicode_filepath.split("/"):
-            if not entry or entry in (".", ".."):
-                continue
+            if entry and entry not in (".", ".."):
+                result = self.__fname_validator.check(entry)
+                if result is not None:
+                    return result.shift(entry_offset)
 
-            self.__fname_validator.validate(entry)
+            entry_offset += len(entry) + 1
 
-        if self._is_windows(include_universal=True):
-            self.__validate_win_filepath(unicode_filepath)
+        if is_windows:
+            result = self.__check_win_filepath(unicode_filepath)
         else:
-            self.__validate_unix_filepath(unicode_filepath)
+            result = self.__check_unix_filepath(unicode_filepath)
+
+        if result is not None:
+            return result.shift(offset)
+
+        return None
+
+    def prefix_cache_info(self) -> Optional[CacheInfo]:
+        """Return the statistics of the cache of the directory prefixes.
+
+        The cache is enabled by a ``prefix_cache_size`` greater than zero at the creation
+        of the validator: it holds at most ``prefix_cache_size`` check results of
+        directory prefixes (such as ``"tenant/2024/10"``) and of their components.
+
+        Returns:
+            Optional[CacheInfo]: |None| if the cache is disabled.
+        """
+
+        if self.__prefix_cache is None:
+            return None
+
+        return self.__prefix_cache.cache_info()
+
+    def __check_clean_entries_cached(
+        self, unicode_filepath: str, offset: int
+    ) -> Optional[CheckResult]:
+        assert self.__prefix_cache is not None
+
+        sep_index = unicode_filepath.rfind("/")
+        if sep_index < 0:
+            return self.__check_clean_entries(unicode_filepath, offset)
+
+        prefix = unicode_filepath[:sep_index]
+        result = self.__prefix_cache.get_or_create(
+            prefix, functools.partial(self.__check_prefix, prefix)
+        )
+        if result is not None:
+            return result.shift(offset)
+
+        # file names are rarely shared between paths: the last component is not cached
+        return self.__check_clean_entries(unicode_filepath[sep_index + 1 :], offset + sep_index + 1)
+
+    def __check_prefix(self, prefix: str) -> Optional[CheckResult]:
+        assert self.__prefix_cache is not None
+
+        entry_offset = 0
+        for entry in prefix.split("/"):
+            result = self.__prefix_cache.get_or_create(
+                entry, functools.partial(self.__check_clean_entries, entry, 0)
+            )
+            if result is not None:
+                return result.shift(entry_offset)
+
+            entry_offset += len(entry) + 1
+
+        return None
+
+    def __check_clean_entries(self, unicode_filepath: str, offset: int) -> Optional[CheckResult]:
+        fname_validator = self.__fname_validator
+        min_len = self.min_len
+        entry_offset = offset
+
+        for entry in unicode_filepath.split("/"):
+            if entry and entry not in (".", ".."):
+                # the byte length of a component is at least its number of characters and
+                # at most the byte length of the whole path: encode only short components
+                byte_ct = len(entry)
+                if byte_ct < min_len:
+                    byte_ct = self._get_len(entry)
+
+                result = fname_validator._check_sanitized(entry, byte_ct)
+                if result is not None:
+                    return result.shift(entry_offset)
+
+            entry_offset += len(entry) + 1
+
+        return None
 
     def validate_abspath(self, value: PathType) -> None:
+        result = self._check_abspath(value)
+        if result is not None:
+            result.raise_error()
+
+    def _check_abspath(self, value: PathType) -> Optional[CheckResult]:
         is_posix_abs = posixpath.isabs(value)
         is_nt_abs = is_nt_abspath(to_str(value))
 
         if any([self._is_windows() and is_nt_abs, self._is_posix() and is_posix_abs]):
-            return
-
-        if self._is_universal() and any([is_nt_abs, is_posix_abs]):
-            ValidationError(
-                "platform-independent absolute file path is not supported",
-                platform=self.platform,
-                reason=ErrorReason.MALFORMED_ABS_PATH,
-            )
-
-        err_object = ValidationError(
-            description=(
-                f"an invalid absolute file path ({value!r}) for the platform ({self.platform.value})."
-                + " to avoid the error, specify an appropriate platform corresponding to"
-                + " the path format or 'auto'."
-            ),
-            platform=self.platform,
-            reason=ErrorReason.MALFORMED_ABS_PATH,
-        )
+            return None
 
         if self._is_windows(include_universal=True) and is_posix_abs:
-            raise err_object
+            return self.__make_malformed_abspath_result(value)
 
         if not self._is_windows():
             drive, _tail = ntpath.splitdrive(value)
             if drive and is_nt_abs:
-                raise err_object
+                return self.__make_malformed_abspath_result(value)
+
+        return None
+
+    def __make_malformed_abspath_result(self, value: PathType) -> CheckResult:
+        return CheckResult(
+            reason=ErrorReason.MALFORMED_ABS_PATH,
+            platform=self.platform,
+            span=(0, len(to_str(value))),
+            make_error=lambda: ValidationError(
+                description=(
+                    f"an invalid absolute file path ({value!r}) for the platform ({self.platform.value})."
+                    + " to avoid the error, specify an appropriate platform corresponding to"
+                    + " the path format or 'auto'."
+                ),
+                platform=self.platform,
+                reason=ErrorReason.MALFORMED_ABS_PATH,
+            ),
+        )
+
+    def __make_length_result(
+        self, unicode_filepath: str, byte_ct: int, is_too_long: bool
+    ) -> CheckResult:
+        def make_error() -> ValidationError:
+            unit = self.length_unit.value
+            if is_too_long and self._bounded_work:
+                # do not read the rest of the value: report the lower bound
+                actual_byte_ct = byte_ct
+                msg = (
+                    f"file path is too long: expected<={self.max_len:d} {unit}, "
+                    f"actual>={actual_byte_ct:d} {unit}"
+                )
+            elif is_too_long:
+                # byte_ct might be a lower bound (see get_str_len)
+                actual_byte_ct = self._get_len(unicode_filepath)
+                msg = (
+                    f"file path is too long: expected<={self.max_len:d} {unit}, "
+                    f"actual={actual_byte_ct:d} {unit}"
+                )
+            else:
+                actual_byte_ct = byte_ct
+                msg = (
+                    f"file path is too short: expected>={self.min_len:d} {unit}, "
+                    f"actual={actual_byte_ct:d} {unit}"
+                )
 
-    def __validate_unix_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_PATH.findall(unicode_filepath)
-        if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=findall_to_str(match)),
+            return ValidationError(
+                [msg],
+                reason=ErrorReason.INVALID_LENGTH,
+                platform=self.platform,
+                fs_encoding=self._fs_encoding,
+                byte_count=actual_byte_ct,
                 value=unicode_filepath,
             )
 
-    def __validate_win_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_WIN_PATH.findall(unicode_filepath)
-        if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=findall_to_str(match)),
-                platform=Platform.WINDOWS,
+        return CheckResult(
+            reason=ErrorReason.INVALID_LENGTH,
+            platform=self.platform,
+            span=(0, len(unicode_filepath)),
+            make_error=make_error,
+        )
+
+    def __check_unix_filepath(self, unicode_filepath: str) -> Optional[CheckResult]:
+        match = _RE_INVALID_PATH.search(unicode_filepath)
+        if match is None:
+            return None
+
+        return CheckResult(
+            reason=ErrorReason.INVALID_CHARACTER,
+            platform=None,
+            span=match.span(),
+            make_error=lambda: InvalidCharError(
+                INVALID_CHAR_ERR_MSG_TMPL.format(
+                    invalid=findall_to_str(_RE_INVALID_PATH.findall(unicode_filepath))
+                ),
                 value=unicode_filepath,
+            ),
+        )
+
+    def __check_win_filepath(self, unicode_filepath: str) -> Optional[CheckResult]:
+        match = _RE_INVALID_WIN_PATH.search(unicode_filepath)
+        if match is not None:
+            return CheckResult(
+                reason=ErrorReason.INVALID_CHARACTER,
+                platform=Platform.WINDOWS,
+                span=match.span(),
+                make_error=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(
+                        invalid=findall_to_str(_RE_INVALID_WIN_PATH.findall(unicode_filepath))
+                    ),
+                    platform=Platform.WINDOWS,
+                    value=unicode_filepath,
+                ),
             )
 
-        _drive, value = self.__split_drive(unicode_filepath)
+        return self.__check_ntfs_reserved(unicode_filepath, 0)
+
+    def __check_ntfs_reserved(self, unicode_filepath: str, offset: int) -> Optional[CheckResult]:
+        drive, value = self.__split_drive(unicode_filepath)
         if value:
             match_reserved = self._RE_NTFS_RESERVED.search(value)
             if match_reserved:
                 reserved_name = match_reserved.group()
-                raise ReservedNameError(
-                    f"'{reserved_name}' is a reserved name",
-                    reusable_name=False,
-                    reserved_name=reserved_name,
+                start, end = match_reserved.span()
+                start += offset + len(drive)
+                end += offset + len(drive)
+
+                return CheckResult(
+                    reason=ErrorReason.RESERVED_NAME,
                     platform=self.platform,
+                    span=(start, end),
+                    make_error=lambda: ReservedNameError(
+                        f"'{reserved_name}' is a reserved name",
+                        reusable_name=False,
+                        reserved_name=reserved_name,
+                        platform=self.platform,
+                    ),
                 )
 
+        return None
+
 
 def validate_filepath(
     file_path: PathType,
@@ -361,7 +611,7 @@ def validate_filepath(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FilePathValidator(
+    _get_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -371,6 +621,48 @@ def validate_filepath(
     ).validate(file_path)
 
 
+def validate_filepaths(
+    file_paths: Iterable[PathType],
+    platform: Optional[PlatformType] = None,
+    min_len: int = DEFAULT_MIN_LEN,
+    max_len: Optional[int] = None,
+    fs_encoding: Optional[str] = None,
+    check_reserved: bool = True,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+) -> Iterator[tuple[int, PathType, ErrorReason]]:
+    """Verifying whether each of the ``file_paths`` is a valid file path or not.
+    Validation errors are not raised: invalid file paths are lazily yielded instead.
+
+    Args:
+        file_paths:
+            File paths to validate.
+        platform:
+            Target platform name of the file paths.
+
+            .. include:: platform.txt
+
+    Yields:
+        Tuple[int, PathType, ErrorReason]:
+            Index in the ``file_paths``, the invalid file path, and the cause of the failure.
+
+    Raises:
+        TypeError:
+            If a file path is not a string or a path-like object.
+
+    See Also:
+        :py:func:`.validate_filepath()` for the other arguments.
+    """
+
+    return _get_validator(
+        platform=platform,
+        min_len=min_len,
+        max_len=-1 if max_len is None else max_len,
+        fs_encoding=fs_encoding,
+        check_reserved=check_reserved,
+        additional_reserved_names=additional_reserved_names,
+    ).validate_many(file_paths)
+
+
 def is_valid_filepath(
     file_path: PathType,
     platform: Optional[PlatformType] = None,
@@ -395,7 +687,7 @@ def is_valid_filepath(
         :py:func:`.validate_filepath()`
     """
 
-    return FilePathValidator(
+    return _get_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -504,7 +796,7 @@ def sanitize_filepath(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FilePathSanitizer(
+    return _get_sanitizer(
         platform=platform,
         max_len=-1 if max_len is None else max_len,
         fs_encoding=fs_encoding,
@@ -514,3 +806,71 @@ def sanitize_filepath(
         additional_reserved_names=additional_reserved_names,
         validate_after_sanitize=validate_after_sanitize,
     ).sanitize(file_path, replacement_text)
+
+
+def _get_validator(
+    platform: Optional[PlatformType],
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Sequence[str]],
+) -> FilePathValidator:
+    platform = normalize_platform(platform)
+
+    return engine_cache.get_or_create(
+        (
+            FilePathValidator,
+            platform,
+            min_len,
+            max_len,
+            fs_encoding,
+            check_reserved,
+            to_hashable(additional_reserved_names),
+        ),
+        lambda: FilePathValidator(
+            platform=platform,
+            min_len=min_len,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+        ),
+    )
+
+
+def _get_sanitizer(
+    platform: Optional[PlatformType],
+    max_len: int,
+    fs_encoding: Optional[str],
+    normalize: bool,
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Sequence[str]],
+    validate_after_sanitize: bool,
+) -> FilePathSanitizer:
+    platform = normalize_platform(platform)
+
+    return engine_cache.get_or_create(
+        (
+            FilePathSanitizer,
+            platform,
+            max_len,
+            fs_encoding,
+            normalize,
+            null_value_handler,
+            reserved_name_handler,
+            to_hashable(additional_reserved_names),
+            validate_after_sanitize,
+        ),
+        lambda: FilePathSanitizer(
+            platform=platform,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            normalize=normalize,
+            null_value_handler=null_value_handler,
+            reserved_name_handler=reserved_name_handler,
+            additional_reserved_names=additional_reserved_names,
+            validate_after_sanitize=validate_after_sanitize,
+        ),
+    )
@@ -0,0 +1,140 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import abc
+import threading
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+
+class AbstractNameIndex(metaclass=abc.ABCMeta):
+    """
+    Interface of the sets of the names already issued in a destination,
+    which :py:meth:`FileNameSanitizer.sanitize_unique` registers sanitized names in.
+    """
+
+    @property
+    @abc.abstractmethod
+    def casefold(self) -> bool:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def __len__(self) -> int:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def __contains__(self, name: object) -> bool:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def add(self, name: str) -> bool:  # pragma: no cover
+        """Register the ``name``.
+
+        Args:
+            name: Name to register.
+
+        Returns:
+            bool: |False| if the ``name`` is already registered.
+        """
+
+    @abc.abstractmethod
+    def claim(self, name: str, make_candidate: Callable[[int], str]) -> str:  # pragma: no cover
+        """Register the ``name``, or the first alternative name that is not registered yet.
+
+        Args:
+            name: Name to register.
+            make_candidate:
+                Function that makes an alternative of the ``name`` from a number,
+                which starts from ``2``.
+
+        Returns:
+            str: The registered name.
+        """
+
+    def _make_key(self, name: str) -> str:
+        if self.casefold:
+            return name.casefold()
+
+        return name
+
+
+class NameIndex(AbstractNameIndex):
+    """
+    Thread-safe in-memory set of the names already issued in a destination, such as a directory.
+    Pass an instance to :py:meth:`FileNameSanitizer.sanitize_unique` to make sanitized names
+    that do not collide with each other.
+
+    Each name remembers the last number added to it on collisions, so that a name that
+    collides many times does not probe the same numbers again:
+    a claim is O(1) amortized, regardless of the number of the collisions.
+
+    Args:
+        casefold:
+            If |True|, names that only differ in case collide, as on the case-insensitive
+            filesystems of Windows and macOS.
+        names:
+            Names that already exist in the destination.
+    """
+
+    @property
+    def casefold(self) -> bool:
+        return self.__casefold
+
+    def __init__(self, casefold: bool = False, names: Optional[Iterable[str]] = None) -> None:
+        self.__casefold = casefold
+        self.__lock = threading.Lock()
+
+        self.__keys: set[str] = set()
+
+        # key of a name -> the last number added to the name on collisions
+        self.__last_nums: dict[str, int] = {}
+
+        if names is not None:
+            for name in names:
+                self.add(name)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a lock cannot be pickled
+        return (self.__class__, (self.__casefold, tuple(self.__keys)))
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        return self._make_key(name) in self.__keys
+
+    def add(self, name: str) -> bool:
+        key = self._make_key(name)
+
+        with self.__lock:
+            if key in self.__keys:
+                return False
+
+            self.__keys.add(key)
+
+        return True
+
+    def claim(self, name: str, make_candidate: Callable[[int], str]) -> str:
+        key = self._make_key(name)
+
+        with self.__lock:
+            if key not in self.__keys:
+                self.__keys.add(key)
+                return name
+
+            num = self.__last_nums.get(key, 1)
+            while True:
+                num += 1
+                candidate = make_candidate(num)
+                candidate_key = self._make_key(candidate)
+                if candidate_key not in self.__keys:
+                    break
+
+            self.__last_nums[key] = num
+            self.__keys.add(candidate_key)
+
+        return candidate
@@ -2,14 +2,39 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import mmap
 import re
-from typing import Final
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO, Any, Final, Union
 
-from ._common import to_str, validate_pathtype
+from ._common import is_null_pathtype, to_str, validate_pathtype
 from .error import InvalidCharError
 
 
 __RE_INVALID_LTSV_LABEL: Final = re.compile("[^0-9A-Za-z_.-]", re.UNICODE)
+_RE_INVALID_LTSV_VALUE: Final = re.compile("[\t\r\n]")
+
+DEFAULT_LABEL_MEMO_SIZE: Final = 1024
+
+
+def is_valid_ltsv_label(label: str) -> bool:
+    """
+    Check whether ``label`` is a valid
+    `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__ label or not.
+    Unlike :py:func:`validate_ltsv_label`, stops at the first invalid character.
+
+    :param label: Label to check.
+    :return: |True| if the ``label`` is a valid LTSV format label.
+    :rtype: bool
+    """
+
+    try:
+        if is_null_pathtype(label):
+            return False
+
+        return __RE_INVALID_LTSV_LABEL.search(to_str(label)) is None
+    except TypeError:
+        return False
 
 
 def validate_ltsv_label(label: str) -> None:
@@ -24,6 +49,9 @@ def validate_ltsv_label(label: str) -> None:
 
     validate_pathtype(label, allow_whitespaces=False)
 
+    if __RE_INVALID_LTSV_LABEL.search(to_str(label)) is None:
+        return
+
     match_list = __RE_INVALID_LTSV_LABEL.findall(to_str(label))
     if match_list:
         raise InvalidCharError(f"invalid character found for a LTSV format label: {match_list}")
@@ -42,3 +70,242 @@ def sanitize_ltsv_label(label: str, replacement_text: str = "") -> str:
     validate_pathtype(label, allow_whitespaces=False)
 
     return __RE_INVALID_LTSV_LABEL.sub(replacement_text, to_str(label))
+
+
+class _LabelMemo:
+    # bounded memo of label -> validated (and sanitized) label.
+    # once full, new labels are checked on every occurrence, and the memo keeps the labels
+    # seen first: the labels of a log are a small set that repeats on every line
+
+    def __init__(self, sanitize: bool, replacement_text: str, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError("memo_size must be greater or equal to zero")
+
+        self.sanitize = sanitize
+        self.replacement_text = replacement_text
+        self.maxsize = maxsize
+        self.labels: dict[str, str] = {}
+
+    def resolve(self, label: str) -> str:
+        if self.sanitize:
+            new_label = sanitize_ltsv_label(label, self.replacement_text)
+        else:
+            new_label = label
+
+        validate_ltsv_label(new_label)
+
+        if len(self.labels) < self.maxsize:
+            self.labels[label] = new_label
+
+        return new_label
+
+    def make_duplicate_label_message(self, labels: Iterable[str]) -> str:
+        # describe the first label of a record that resolves to the same label as another
+        first_labels: dict[str, str] = {}
+        for label in labels:
+            new_label = self.labels[label] if label in self.labels else self.resolve(label)
+            if new_label in first_labels:
+                return (
+                    f"duplicate label {new_label!r}: from {first_labels[new_label]!r} and {label!r}"
+                )
+            first_labels[new_label] = label
+
+        return "no duplicate label"
+
+
+class LTSVReader:
+    """
+    Parse the records of a `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__ stream
+    lazily, one line at a time.
+    Each record is a ``dict`` of the labels and the values of a line.
+
+    Labels are sanitized with :py:func:`sanitize_ltsv_label` (or validated with
+    :py:func:`validate_ltsv_label`) and the results are memoized:
+    labels that appeared before cost a ``dict`` lookup and no regular expression matching.
+
+    Args:
+        source:
+            Input: a text or binary file object (or any iterable of lines),
+            a ``mmap.mmap``, or a ``bytes``/``bytearray``.
+            Binary lines are decoded with the ``encoding``.
+        sanitize:
+            If |True|, sanitize labels. Otherwise, labels are validated as they are.
+        replacement_text:
+            Replacement text for the invalid characters of labels.
+        encoding:
+            Encoding of the binary input.
+        memo_size:
+            Maximum number of labels to memoize.
+
+    Raises:
+        ValidationError:
+            While iterating, if a label is invalid (or is sanitized to an empty string).
+        ValueError:
+            While iterating, if a field has no ``:`` separator,
+            or if two fields of a line have the same label (after the sanitization).
+
+    Example:
+        .. code-block:: python
+
+            import mmap
+
+            from pathvalidate import LTSVReader
+
+            with open("access.log", "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                for record in LTSVReader(m):
+                    print(record["host"], record["status"])
+    """
+
+    @property
+    def line_num(self) -> int:
+        """int: Number of lines read so far."""
+        return self.__line_num
+
+    def __init__(
+        self,
+        source: Union[IO[Any], Iterable[Union[str, bytes]], mmap.mmap, bytes, bytearray],
+        sanitize: bool = True,
+        replacement_text: str = "",
+        encoding: str = "utf-8",
+        memo_size: int = DEFAULT_LABEL_MEMO_SIZE,
+    ) -> None:
+        self.__source = source
+        self.__encoding = encoding
+        self.__memo = _LabelMemo(sanitize, replacement_text, memo_size)
+        self.__line_num = 0
+
+    def __iter__(self) -> Iterator[dict[str, str]]:
+        labels = self.__memo.labels
+        resolve = self.__memo.resolve
+
+        for line in self.__iter_lines():
+            self.__line_num += 1
+
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+
+            record: dict[str, str] = {}
+            fields = line.split("\t")
+            for field in fields:
+                label, sep, value = field.partition(":")
+                if not sep:
+                    raise ValueError(
+                        f"field without a label separator at line {self.__line_num:d}: {field!r}"
+                    )
+
+                try:
+                    record[labels[label]] = value
+                except KeyError:
+                    record[resolve(label)] = value
+
+            if len(record) != len(fields):
+                # a value overwrote another one
+                message = self.__memo.make_duplicate_label_message(
+                    field.partition(":")[0] for field in fields
+                )
+                raise ValueError(f"{message} at line {self.__line_num:d}")
+
+            yield record
+
+    def __iter_lines(self) -> Iterator[str]:
+        source = self.__source
+        encoding = self.__encoding
+
+        if isinstance(source, (bytes, bytearray, mmap.mmap)):
+            # slice lines out of the buffer without moving the position of a mmap
+            pos = 0
+            size = len(source)
+            while pos < size:
+                end = source.find(b"\n", pos)
+                if end < 0:
+                    end = size
+                yield source[pos:end].decode(encoding)
+                pos = end + 1
+            return
+
+        for line in source:
+            if isinstance(line, str):
+                yield line
+            else:
+                yield line.decode(encoding)
+
+
+class LTSVWriter:
+    """
+    Write records to a `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__ text stream.
+    Labels are sanitized (or validated) and memoized as :py:class:`LTSVReader` does.
+
+    Args:
+        stream:
+            Text stream to write to.
+        sanitize:
+            If |True|, sanitize labels. Otherwise, labels are validated as they are.
+        replacement_text:
+            Replacement text for the invalid characters of labels.
+        memo_size:
+            Maximum number of labels to memoize.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        sanitize: bool = True,
+        replacement_text: str = "",
+        memo_size: int = DEFAULT_LABEL_MEMO_SIZE,
+    ) -> None:
+        self.__stream = stream
+        self.__memo = _LabelMemo(sanitize, replacement_text, memo_size)
+
+    def write(self, record: Mapping[str, Any]) -> None:
+        """Write the ``record`` as a line.
+
+        Args:
+            record: Labels and values. Values are converted with ``str``.
+
+        Raises:
+            ValidationError:
+                If a label is invalid (or is sanitized to an empty string),
+                or if a value includes a tab or a newline.
+            ValueError:
+                If two labels of the ``record`` are sanitized to the same label.
+        """
+
+        self.__stream.write(self.__format(record))
+
+    def write_many(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Write the ``records``, one line per record.
+
+        Args:
+            records: Records to write.
+        """
+
+        write = self.__stream.write
+        for record in records:
+            write(self.__format(record))
+
+    def __format(self, record: Mapping[str, Any]) -> str:
+        labels = self.__memo.labels
+        resolve = self.__memo.resolve
+
+        fields = []
+        new_labels: set[str] = set()
+        for label, value in record.items():
+            try:
+                new_label = labels[label]
+            except KeyError:
+                new_label = resolve(label)
+
+            value = str(value)
+            if _RE_INVALID_LTSV_VALUE.search(value):
+                raise InvalidCharError(
+                    f"invalid character found for a LTSV format value: label={new_label}"
+                )
+
+            fields.append(f"{new_label:s}:{value:s}")
+            new_labels.add(new_label)
+
+        if len(new_labels) != len(fields):
+            raise ValueError(self.__memo.make_duplicate_label_message(record))
+
+        return "\t".join(fields) + "\n"
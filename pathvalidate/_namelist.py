@@ -0,0 +1,356 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import mmap
+import os
+import re
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from re import Pattern
+from typing import IO, Final, Optional, Union
+
+from ._base import BaseFile
+from ._const import LengthUnit
+from ._filename import FileNameSanitizer, FileNameValidator
+from ._filepath import FilePathSanitizer, FilePathValidator
+from ._result import FastPathInfo, _FastPathCounter
+
+
+NameListSource = Union[str, "os.PathLike[str]", mmap.mmap, bytes, bytearray]
+
+# ASCII characters that are valid in a file name on every platform, wherever they appear
+_SAFE_NAME_CHARS: Final = rb"A-Za-z0-9_+,=@~\-"
+
+# maximum number of entries that a single match of the fast check skips:
+# bounds the work of a regular expression call without a per-entry Python overhead
+_MAX_ENTRIES_PER_MATCH: Final = 4096
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    return "a/".encode(encoding) == b"a/"
+
+
+def _make_clean_entries_regexp(
+    engine: BaseFile, is_path: bool, min_len: int, delimiter: bytes
+) -> Optional[Pattern[bytes]]:
+    # a match is a run of entries that are valid for the engine for sure.
+    # entries that do not match are not necessarily invalid: they are checked by the engine.
+    # the entries are ASCII: their lengths are the same in every length unit,
+    # and in bytes for the ASCII compatible encodings
+    if engine.length_unit == LengthUnit.BYTES and not _is_ascii_compatible(
+        engine._fs_encoding  # type: ignore[attr-defined]
+    ):
+        return None
+
+    # the rules of the file names (the components of a file path) of the engine
+    fname_validator = FileNameValidator(
+        max_len=engine.max_len,
+        platform=engine.platform,
+        additional_reserved_names=engine._additional_reserved_names,
+        length_unit=engine.length_unit,
+    )
+    reserved_names = set(engine.reserved_keywords) | set(fname_validator.reserved_keywords)
+    reserved_pattern = b"|".join(
+        re.escape(name.encode("ascii"))
+        for name in sorted(reserved_names)
+        if re.fullmatch(rb"[" + _SAFE_NAME_CHARS + rb".]+", name.encode("utf-8"))
+    )
+
+    delim = re.escape(delimiter)
+    safe = b"[" + _SAFE_NAME_CHARS + b"]"
+    name_end = b"(?:" + delim + (b"|/)" if is_path else b")")
+
+    # no period/space at the edges: "." / "..", hidden files and the trailing characters
+    # that Windows strips are left to the engine
+    name = safe + b"(?:[" + _SAFE_NAME_CHARS + b".]*" + safe + b")?"
+    if reserved_pattern:
+        # reserved names are compared with the upper case of the root name (before the first
+        # period) and of the whole name: ASCII case-insensitive matching is the same
+        name = b"(?!(?i:" + reserved_pattern + b")(?:\\.|" + name_end + b"))" + name
+    if is_path:
+        name = (
+            b"(?=[^/" + delim + b"]{%d,%d}" % (min_len, fname_validator.max_len) + name_end + b")"
+        ) + name
+
+    entry = name + b"(?:/" + name + b")*" if is_path else name
+    length = b"(?=[^" + delim + b"]{%d,%d}" % (min_len, engine.max_len) + delim + b")"
+
+    return re.compile(b"(?:" + length + entry + delim + b"){0,%d}+" % _MAX_ENTRIES_PER_MATCH)
+
+
+@contextmanager
+def _map_source(source: NameListSource) -> Iterator[Union[mmap.mmap, bytes, bytearray]]:
+    if isinstance(source, (mmap.mmap, bytes, bytearray)):
+        yield source
+        return
+
+    with open(source, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # an empty file cannot be mapped
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+class _NameListScanner:
+    def __init__(
+        self,
+        engine: BaseFile,
+        is_path: bool,
+        min_len: int,
+        delimiter: str,
+        encoding: str,
+    ) -> None:
+        if len(delimiter) != 1:
+            raise ValueError("delimiter must be a single character")
+        if not _is_ascii_compatible(encoding):
+            raise ValueError(f"encoding must be ASCII compatible: actual={encoding}")
+
+        self.delimiter = delimiter.encode(encoding)
+        self.encoding = encoding
+        self.regexp = _make_clean_entries_regexp(engine, is_path, min_len, self.delimiter)
+
+        # statistics: counted per scan, and added up once at the end of the scan
+        self.counter = _FastPathCounter()
+
+    def scan(self, buf: Union[mmap.mmap, bytes, bytearray]) -> Iterator[tuple[int, int, int]]:
+        # yield (start, end, clean_end): either a run of entries that are valid for sure
+        # (start < clean_end == end), or a single entry that needs the check of the engine
+        # (start == clean_end < end), or an empty entry (start == clean_end == end)
+        delimiter = self.delimiter
+        regexp = self.regexp
+        size = len(buf)
+        pos = 0
+        fast_count = 0
+        slow_count = 0
+
+        try:
+            while pos < size:
+                if regexp is not None:
+                    clean_end = regexp.match(buf, pos).end()  # type: ignore[union-attr]
+                    if clean_end > pos:
+                        fast_count += buf[pos:clean_end].count(delimiter)
+                        yield (pos, clean_end, clean_end)
+                        pos = clean_end
+                        continue
+
+                end = buf.find(delimiter, pos)
+                if end < 0:
+                    end = size
+
+                if end > pos:
+                    slow_count += 1
+
+                yield (pos, end, pos)
+                pos = end + 1
+        finally:
+            self.counter.add(fast=fast_count, slow=slow_count)
+
+
+class NameListValidator:
+    """
+    Validate the entries of a large list of file names or file paths,
+    such as the output of ``find -print0``, with the rules of a
+    :py:class:`FileNameValidator` or :py:class:`FilePathValidator`.
+
+    The list is memory-mapped, and the entries are not loaded as Python strings:
+    a precompiled regular expression on the raw bytes skips the runs of entries that are
+    valid for sure (ASCII names without reserved names, periods at the edges, and so on),
+    and only the other entries are decoded and checked by the validator.
+    Empty entries are skipped.
+
+    Args:
+        validator:
+            Validator of the entries.
+        delimiter:
+            Character that delimits the entries: ``"\\n"`` or ``"\\0"``.
+        encoding:
+            Encoding of the list. Must be ASCII compatible.
+            Entries that cannot be decoded are invalid.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import FilePathValidator, NameListValidator
+
+            validator = NameListValidator(FilePathValidator(platform="windows"), delimiter="\\0")
+            offsets = validator.find_invalid("manifest.bin")
+    """
+
+    def __init__(
+        self,
+        validator: Union[FileNameValidator, FilePathValidator],
+        delimiter: str = "\n",
+        encoding: str = "utf-8",
+    ) -> None:
+        self.__validator = validator
+        self.__scanner = _NameListScanner(
+            validator,
+            is_path=isinstance(validator, FilePathValidator),
+            min_len=validator.min_len,
+            delimiter=delimiter,
+            encoding=encoding,
+        )
+
+    def fast_path_info(self) -> FastPathInfo:
+        """Return the number of the entries accepted on the raw bytes (``fast``)
+        and decoded to be checked by the validator (``slow``).
+
+        Returns:
+            FastPathInfo: Counts of the entries.
+        """
+
+        return self.__scanner.counter.to_info()
+
+    def iter_invalid(self, source: NameListSource) -> Iterator[tuple[int, bytes]]:
+        """Yield the invalid entries of the ``source``.
+
+        Args:
+            source: Path to the list, or the content of the list.
+
+        Returns:
+            Iterator[tuple[int, bytes]]: Offsets (in bytes) and raw bytes of the invalid entries.
+        """
+
+        check = self.__validator.check
+        encoding = self.__scanner.encoding
+
+        with _map_source(source) as buf:
+            for _, end, clean_end in self.__scanner.scan(buf):
+                if end == clean_end:
+                    continue
+
+                entry = buf[clean_end:end]
+                try:
+                    is_valid = check(entry.decode(encoding)) is None
+                except UnicodeDecodeError:
+                    is_valid = False
+
+                if not is_valid:
+                    yield (clean_end, entry)
+
+    def find_invalid(self, source: NameListSource) -> "array[int]":
+        """Return the offsets of the invalid entries of the ``source``.
+
+        Args:
+            source: Path to the list, or the content of the list.
+
+        Returns:
+            array: Offsets (in bytes) of the invalid entries, as an ``array`` of typecode ``"Q"``.
+        """
+
+        return array("Q", (offset for offset, _ in self.iter_invalid(source)))
+
+    def write_invalid(self, source: NameListSource, output: IO[bytes]) -> int:
+        """Write the invalid entries of the ``source``, each followed by the delimiter.
+
+        Args:
+            source: Path to the list, or the content of the list.
+            output: Binary stream to write to.
+
+        Returns:
+            int: Number of the invalid entries.
+        """
+
+        delimiter = self.__scanner.delimiter
+        count = 0
+
+        for _, entry in self.iter_invalid(source):
+            output.write(entry + delimiter)
+            count += 1
+
+        return count
+
+
+class NameListSanitizer:
+    """
+    Sanitize the entries of a large list of file names or file paths with a
+    :py:class:`FileNameSanitizer` or :py:class:`FilePathSanitizer`,
+    in the same manner as :py:class:`NameListValidator` validates them:
+    the runs of entries that are valid for sure are copied as raw bytes,
+    and only the other entries are decoded and sanitized.
+    The output has the same number of entries as the input, except for empty entries.
+
+    Args:
+        sanitizer:
+            Sanitizer of the entries.
+        delimiter:
+            Character that delimits the entries: ``"\\n"`` or ``"\\0"``.
+        encoding:
+            Encoding of the list. Must be ASCII compatible.
+        errors:
+            Error handler to decode the entries with.
+        replacement_text:
+            Replacement text for invalid characters.
+    """
+
+    def __init__(
+        self,
+        sanitizer: Union[FileNameSanitizer, FilePathSanitizer],
+        delimiter: str = "\n",
+        encoding: str = "utf-8",
+        errors: str = "replace",
+        replacement_text: str = "",
+    ) -> None:
+        self.__sanitizer = sanitizer
+        self.__errors = errors
+        self.__replacement_text = replacement_text
+        self.__scanner = _NameListScanner(
+            sanitizer,
+            # the separators of the paths that the sanitizer rewrites (such as "/" to "\\" for
+            # Windows) are left to the sanitizer: the entries are copied as they are
+            is_path=isinstance(sanitizer, FilePathSanitizer) and sanitizer.sanitize("a/b") == "a/b",
+            min_len=1,
+            delimiter=delimiter,
+            encoding=encoding,
+        )
+
+    def fast_path_info(self) -> FastPathInfo:
+        """Return the number of the entries copied as raw bytes (``fast``)
+        and decoded to be sanitized (``slow``).
+
+        Returns:
+            FastPathInfo: Counts of the entries.
+        """
+
+        return self.__scanner.counter.to_info()
+
+    def sanitize_to(self, source: NameListSource, output: IO[bytes]) -> int:
+        """Write the sanitized entries of the ``source``, each followed by the delimiter.
+
+        Args:
+            source: Path to the list, or the content of the list.
+            output: Binary stream to write to.
+
+        Returns:
+            int: Number of the entries that were changed by the sanitization.
+        """
+
+        sanitize = self.__sanitizer.sanitize
+        delimiter = self.__scanner.delimiter
+        encoding = self.__scanner.encoding
+        count = 0
+
+        with _map_source(source) as buf:
+            for start, end, clean_end in self.__scanner.scan(buf):
+                if clean_end > start:
+                    output.write(buf[start:clean_end])
+
+                if end == clean_end:
+                    continue
+
+                entry = buf[clean_end:end]
+                value = entry.decode(encoding, self.__errors)
+                new_entry = str(sanitize(value, self.__replacement_text)).encode(
+                    encoding, "surrogateescape"
+                )
+                if new_entry != entry:
+                    count += 1
+
+                output.write(new_entry + delimiter)
+
+        return count
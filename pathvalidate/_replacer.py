@@ -0,0 +1,86 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import re
+from re import Pattern
+from typing import Final, Optional
+
+from ._cache import LRUCache
+
+
+# maximum number of replacement texts whose translation tables a replacer caches
+_TABLE_CACHE_SIZE: Final = 16
+
+
+class CharReplacer:
+    """
+    Replace every occurrence of a set of ASCII characters with a replacement text.
+
+    The result is the same as ``regexp.sub(replacement_text, value)`` with the character class
+    regular expression of the characters (:py:attr:`regexp`).
+    ASCII strings with a replacement text of zero or one ASCII character are processed by
+    ``bytes.translate`` with a translation table. The table of the empty replacement text is built
+    at initialization, and the tables of the other replacement texts are kept in a bounded
+    thread-safe cache.
+    The other strings fall back to the regular expression: on non-ASCII strings,
+    ``str.translate`` is slower than a regular expression.
+
+    Args:
+        chars: Characters to replace. Must be ASCII characters.
+    """
+
+    @property
+    def regexp(self) -> Pattern[str]:
+        """Pattern[str]: Character class regular expression of the characters."""
+        return self.__regexp
+
+    def __init__(self, chars: str) -> None:
+        if not chars.isascii():
+            raise ValueError("chars must be ASCII characters")
+
+        self.__regexp = re.compile(f"[{re.escape(chars):s}]", re.UNICODE)
+        self.__chars = chars.encode("ascii")
+        self.__delete_tables = (bytes(range(256)), self.__chars)
+
+        # translation tables by replacement text of one character: sub() fills the cache,
+        # which is bounded and guarded by a lock. None for a replacement that needs the regexp
+        self.__tables: LRUCache[Optional[tuple[bytes, bytes]]] = LRUCache(maxsize=_TABLE_CACHE_SIZE)
+
+    def sub(self, replacement_text: str, value: str) -> str:
+        """Replace the characters in the ``value`` with the ``replacement_text``.
+
+        Args:
+            replacement_text: Replacement text. Processed like a ``re.sub`` replacement.
+            value: String to process.
+
+        Returns:
+            str: The ``value`` with the characters replaced.
+        """
+
+        if len(replacement_text) > 1:
+            return self.__regexp.sub(replacement_text, value)
+
+        if not replacement_text:
+            tables: Optional[tuple[bytes, bytes]] = self.__delete_tables
+        else:
+            tables = self.__tables.get_or_create(
+                replacement_text, lambda: self.__make_tables(replacement_text)
+            )
+
+        if tables is None or not value.isascii():
+            return self.__regexp.sub(replacement_text, value)
+
+        table, delete_chars = tables
+
+        return value.encode().translate(table, delete_chars).decode()
+
+    def __make_tables(self, replacement_text: str) -> Optional[tuple[bytes, bytes]]:
+        # a backslash in a replacement is an escape of re.sub: leave it to the regexp
+        if replacement_text == "\\" or not replacement_text.isascii():
+            return None
+
+        return (
+            bytes.maketrans(self.__chars, replacement_text.encode("ascii") * len(self.__chars)),
+            b"",
+        )
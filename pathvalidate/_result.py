@@ -0,0 +1,108 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import threading
+from typing import Any, Callable, Final, NamedTuple, NoReturn, Optional
+
+from ._const import Platform
+from .error import ErrorReason, ValidationError
+
+
+class CheckResult(NamedTuple):
+    """
+    Result of a failed validation that is returned by ``check()`` methods instead of raising.
+    The error message is not built until the result is converted to an exception.
+    """
+
+    #: The cause of the failure.
+    reason: ErrorReason
+
+    #: Platform of the rule that the value violated.
+    platform: Optional[Platform]
+
+    #: Start and end indices of the offending part of the checked value.
+    span: tuple[int, int]
+
+    #: Function that creates the :py:class:`~pathvalidate.ValidationError` of the result.
+    make_error: Callable[[], ValidationError]
+
+    def raise_error(self) -> NoReturn:
+        """Raise the :py:class:`~pathvalidate.ValidationError` corresponding to the result."""
+
+        raise self.make_error()
+
+    def shift(self, offset: int) -> "CheckResult":
+        """Return a copy of the result with the ``span`` shifted by the ``offset``."""
+
+        if offset == 0:
+            return self
+
+        start, end = self.span
+
+        return self._replace(span=(start + offset, end + offset))
+
+
+class SanitizeResult(NamedTuple):
+    """
+    Result of a sanitization that is yielded by ``sanitize_many()`` methods.
+    """
+
+    #: Sanitized value. The input object itself if the sanitization did not change it.
+    value: Any
+
+    #: |True| if the sanitization changed the value.
+    changed: bool
+
+
+class FastPathInfo(NamedTuple):
+    """
+    Statistics of the fast acceptance check of a validator.
+    """
+
+    #: Number of names that were accepted by the fast acceptance check.
+    fast: int
+
+    #: Number of names that fell through to the detailed checks.
+    slow: int
+
+    @property
+    def fast_ratio(self) -> float:
+        """float: Ratio of the fast-path acceptances to the total number of checked names."""
+
+        total = self.fast + self.slow
+        if total == 0:
+            return 0.0
+
+        return self.fast / total
+
+
+class _FastPathCounter:
+    # counts of FastPathInfo, guarded by a lock: shared by the threads that use an engine
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__fast = 0
+        self.__slow = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a lock cannot be pickled: a copy of the counter starts from zero
+        return (self.__class__, ())
+
+    def add(self, fast: int, slow: int) -> None:
+        with self.__lock:
+            self.__fast += fast
+            self.__slow += slow
+
+    def to_info(self) -> FastPathInfo:
+        with self.__lock:
+            return FastPathInfo(fast=self.__fast, slow=self.__slow)
+
+
+def _make_null_name_error() -> ValidationError:
+    return ValidationError(reason=ErrorReason.NULL_NAME)
+
+
+NULL_NAME_RESULT: Final = CheckResult(
+    reason=ErrorReason.NULL_NAME, platform=None, span=(0, 0), make_error=_make_null_name_error
+)
@@ -0,0 +1,282 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, Final, TypeVar, Union
+
+from ._index import AbstractNameIndex
+
+
+_SCHEMA: Final = (
+    (
+        "CREATE TABLE IF NOT EXISTS pathvalidate_meta ("
+        " namespace TEXT NOT NULL PRIMARY KEY, casefold INTEGER NOT NULL"
+        ") WITHOUT ROWID"
+    ),
+    # the primary key is the index of the (case-folded) keys
+    (
+        "CREATE TABLE IF NOT EXISTS pathvalidate_names ("
+        " namespace TEXT NOT NULL, key TEXT NOT NULL, name TEXT NOT NULL,"
+        " PRIMARY KEY (namespace, key)"
+        ") WITHOUT ROWID"
+    ),
+    # the last number added to a name on collisions
+    (
+        "CREATE TABLE IF NOT EXISTS pathvalidate_last_nums ("
+        " namespace TEXT NOT NULL, key TEXT NOT NULL, num INTEGER NOT NULL,"
+        " PRIMARY KEY (namespace, key)"
+        ") WITHOUT ROWID"
+    ),
+)
+_INSERT_NAME: Final = (
+    "INSERT OR IGNORE INTO pathvalidate_names (namespace, key, name) VALUES (?, ?, ?)"
+)
+
+DEFAULT_BUSY_TIMEOUT: Final = 30.0
+
+_SQLiteNameIndexT = TypeVar("_SQLiteNameIndexT", bound="SQLiteNameIndex")
+
+
+class SQLiteNameIndex(AbstractNameIndex):
+    """
+    Set of the names already issued in a destination, persisted in a SQLite database.
+    Use this instead of :py:class:`NameIndex` when sanitized names must stay unique across runs,
+    or across processes that write to the same destination.
+
+    Each claim runs in a ``BEGIN IMMEDIATE`` transaction, so that concurrent processes that use
+    the same database file never issue the same name.
+    Names are looked up with the primary key index of the (case-folded) names,
+    and each name remembers the last number added to it on collisions:
+    a claim costs a few index lookups regardless of the number of the registered names.
+
+    Wrap a loop of claims in :py:meth:`batch` to commit them in a single transaction:
+    committing once per claim is the bottleneck of large batches.
+
+    An instance can be shared by threads. Processes should create their own instance of
+    the same database file (pickled instances reopen the database file).
+
+    Args:
+        database:
+            Path to the database file. The tables are created if they do not exist.
+            ``":memory:"`` for a private in-memory database.
+        casefold:
+            If |True|, names that only differ in case collide, as on the case-insensitive
+            filesystems of Windows and macOS.
+            Must be the same as the first instance of the ``namespace`` in the database.
+        namespace:
+            Name of the set in the database, such as the path of the destination directory.
+            A database file can hold multiple sets.
+        timeout:
+            Seconds to wait for a lock of the database held by another connection.
+
+    Raises:
+        ValueError:
+            If the ``casefold`` differs from the ``namespace`` in the database.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import FileNameSanitizer, SQLiteNameIndex
+
+            sanitizer = FileNameSanitizer(platform="windows")
+
+            with SQLiteNameIndex("names.sqlite3", casefold=True, namespace="uploads") as index:
+                with index.batch():
+                    for value in values:
+                        filename = sanitizer.sanitize_unique(value, index)
+    """
+
+    @property
+    def casefold(self) -> bool:
+        return self.__casefold
+
+    @property
+    def namespace(self) -> str:
+        return self.__namespace
+
+    def __init__(
+        self,
+        database: Union[str, "os.PathLike[str]"],
+        casefold: bool = False,
+        namespace: str = "",
+        timeout: float = DEFAULT_BUSY_TIMEOUT,
+    ) -> None:
+        self.__database = os.fspath(database)
+        self.__casefold = casefold
+        self.__namespace = namespace
+        self.__timeout = timeout
+
+        self.__lock = threading.RLock()
+        self.__in_batch = False
+
+        # transactions are managed explicitly with BEGIN IMMEDIATE
+        self.__conn = sqlite3.connect(
+            self.__database, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+
+        try:
+            self.__setup()
+        except BaseException:
+            self.__conn.close()
+            raise
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # a connection cannot be pickled
+        return (
+            self.__class__,
+            (self.__database, self.__casefold, self.__namespace, self.__timeout),
+        )
+
+    def __enter__(self: _SQLiteNameIndexT) -> _SQLiteNameIndexT:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            (count,) = self.__conn.execute(
+                "SELECT COUNT(*) FROM pathvalidate_names WHERE namespace = ?", (self.__namespace,)
+            ).fetchone()
+
+        return count
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+
+        with self.__lock:
+            row = self.__conn.execute(
+                "SELECT 1 FROM pathvalidate_names WHERE namespace = ? AND key = ?",
+                (self.__namespace, self._make_key(name)),
+            ).fetchone()
+
+        return row is not None
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self.__lock:
+            self.__conn.close()
+
+    @contextmanager
+    def batch(self) -> Iterator["SQLiteNameIndex"]:
+        """Run the claims within the ``with`` block in a single transaction.
+
+        The transaction locks the database for writing until the block exits:
+        other processes wait for the lock up to ``timeout`` seconds,
+        so keep the batches to a few thousand claims.
+        The claims are rolled back if the block raises an exception.
+        Other threads that use the instance wait until the block exits,
+        and nested calls join the outermost transaction.
+        """
+
+        with self.__lock:
+            if self.__in_batch:
+                yield self
+                return
+
+            with self.__transaction():
+                self.__in_batch = True
+                try:
+                    yield self
+                finally:
+                    self.__in_batch = False
+
+    def add(self, name: str) -> bool:
+        with self.__transaction():
+            return self.__insert(name)
+
+    def add_many(self, names: Iterable[str]) -> int:
+        """Register the ``names`` in a single transaction.
+
+        Args:
+            names: Names to register, such as the names of the files in the destination.
+
+        Returns:
+            int: Number of the ``names`` that were not registered.
+        """
+
+        with self.__transaction():
+            before = self.__conn.total_changes
+            self.__conn.executemany(
+                _INSERT_NAME,
+                ((self.__namespace, self._make_key(name), name) for name in names),
+            )
+
+            return self.__conn.total_changes - before
+
+    def claim(self, name: str, make_candidate: Callable[[int], str]) -> str:
+        with self.__transaction():
+            if self.__insert(name):
+                return name
+
+            key = self._make_key(name)
+            row = self.__conn.execute(
+                "SELECT num FROM pathvalidate_last_nums WHERE namespace = ? AND key = ?",
+                (self.__namespace, key),
+            ).fetchone()
+            num = 1 if row is None else row[0]
+
+            while True:
+                num += 1
+                candidate = make_candidate(num)
+                if self.__insert(candidate):
+                    break
+
+            self.__conn.execute(
+                "INSERT OR REPLACE INTO pathvalidate_last_nums (namespace, key, num) VALUES (?, ?, ?)",
+                (self.__namespace, key, num),
+            )
+
+        return candidate
+
+    def __insert(self, name: str) -> bool:
+        cursor = self.__conn.execute(_INSERT_NAME, (self.__namespace, self._make_key(name), name))
+
+        return cursor.rowcount == 1
+
+    @contextmanager
+    def __transaction(self) -> Iterator[None]:
+        with self.__lock:
+            if self.__in_batch:
+                yield
+                return
+
+            self.__conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.__conn.execute("ROLLBACK")
+                raise
+
+            self.__conn.execute("COMMIT")
+
+    def __setup(self) -> None:
+        if self.__database != ":memory:":
+            # readers do not block the writer, and a commit does not wait for a full fsync
+            self.__conn.execute("PRAGMA journal_mode=WAL")
+            self.__conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.__transaction():
+            for statement in _SCHEMA:
+                self.__conn.execute(statement)
+
+            self.__conn.execute(
+                "INSERT OR IGNORE INTO pathvalidate_meta (namespace, casefold) VALUES (?, ?)",
+                (self.__namespace, int(self.__casefold)),
+            )
+            (casefold,) = self.__conn.execute(
+                "SELECT casefold FROM pathvalidate_meta WHERE namespace = ?", (self.__namespace,)
+            ).fetchone()
+
+        if bool(casefold) != self.__casefold:
+            raise ValueError(
+                f"casefold={self.__casefold} differs from the namespace in the database: "
+                f"namespace={self.__namespace!r}, casefold={bool(casefold)}"
+            )
@@ -4,9 +4,11 @@
 
 import re
 from collections.abc import Sequence
-from typing import Final
+from typing import Final, Optional
 
-from ._common import ascii_symbols, to_str, unprintable_ascii_chars
+from ._cache import engine_cache
+from ._common import ascii_symbols, to_hashable, to_str, unprintable_ascii_chars
+from ._replacer import CharReplacer
 from .error import InvalidCharError
 
 
@@ -15,6 +17,25 @@ __RE_SYMBOL: Final = re.compile(
 )
 
 
+def has_symbol(text: str) -> bool:
+    """
+    Return |True| if symbol(s) included in the ``text``.
+    Unlike :py:func:`validate_symbol`, stops at the first symbol.
+
+    Args:
+        text:
+            Input text to check.
+
+    Returns:
+        bool: |True| if symbol(s) included in the ``text``.
+    """
+
+    try:
+        return __RE_SYMBOL.search(to_str(text)) is not None
+    except TypeError:
+        raise TypeError("text must be a string")
+
+
 def validate_symbol(text: str) -> None:
     """
     Verifying whether symbol(s) included in the ``text`` or not.
@@ -28,11 +49,95 @@ def validate_symbol(text: str) -> None:
             If symbol(s) included in the ``text``.
     """
 
+    if not has_symbol(text):
+        return
+
     match_list = __RE_SYMBOL.findall(to_str(text))
     if match_list:
         raise InvalidCharError(f"invalid symbols found: {match_list}")
 
 
+class SymbolReplacer:
+    """
+    Replace the symbols in texts with the same options as :py:func:`replace_symbol`.
+    The options are compiled once when an instance is created:
+    use an instance to process many texts with the same options.
+
+    Symbols are replaced with ``bytes.translate`` translation tables for ASCII texts.
+    If ``is_replace_consecutive_chars`` is |True| and the ``replacement_text`` is a single
+    character, symbols and the runs of the replacement character that they join
+    are collapsed in the same pass for non-ASCII texts.
+
+    Args:
+        replacement_text:
+            Replacement text.
+        exclude_symbols:
+            Symbols that were excluded from the replacement.
+        is_replace_consecutive_chars:
+            If |True|, replace consecutive multiple ``replacement_text`` characters
+            to a single character.
+        is_strip:
+            If |True|, strip ``replacement_text`` from the beginning/end of the replacement text.
+    """
+
+    def __init__(
+        self,
+        replacement_text: str = "",
+        exclude_symbols: Sequence[str] = (),
+        is_replace_consecutive_chars: bool = False,
+        is_strip: bool = False,
+    ) -> None:
+        chars = "".join(sorted(set(ascii_symbols + unprintable_ascii_chars) - set(exclude_symbols)))
+
+        self.__replacement_text = replacement_text
+        self.__is_strip = is_strip and bool(replacement_text)
+        self.__replacer: Optional[CharReplacer] = CharReplacer(chars) if chars else None
+        self.__re_run: Optional[re.Pattern[str]] = None
+        self.__re_consecutive: Optional[re.Pattern[str]] = None
+
+        if is_replace_consecutive_chars and replacement_text:
+            if len(replacement_text) == 1 and replacement_text != "\\":
+                # a run of symbols and replacement characters ends up as a single
+                # replacement character: used for non-ASCII texts, where the translation
+                # tables do not apply
+                self.__re_run = re.compile(
+                    f"[{re.escape(chars + replacement_text):s}]+", re.UNICODE
+                )
+                self.__re_consecutive = re.compile(f"{re.escape(replacement_text):s}{{2,}}")
+            else:
+                self.__re_consecutive = re.compile(f"{re.escape(replacement_text):s}+")
+
+    def replace(self, text: str) -> str:
+        """Replace the symbols in the ``text``.
+
+        Args:
+            text: Input text.
+
+        Returns:
+            A replacement string.
+        """
+
+        text = to_str(text)
+        if not isinstance(text, str):
+            raise TypeError("text must be a string")
+
+        if self.__re_run is not None and not text.isascii():
+            new_text = self.__re_run.sub(self.__replacement_text, text)
+        else:
+            if self.__replacer is not None:
+                new_text = self.__replacer.sub(self.__replacement_text, text)
+            else:
+                new_text = text
+
+            if self.__re_consecutive is not None:
+                new_text = self.__re_consecutive.sub(self.__replacement_text, new_text)
+
+        if self.__is_strip:
+            new_text = new_text.strip(self.__replacement_text)
+
+        return new_text
+
+
 def replace_symbol(
     text: str,
     replacement_text: str = "",
@@ -64,30 +169,18 @@ def replace_symbol(
         :ref:`example-sanitize-symbol`
     """
 
-    if exclude_symbols:
-        regexp = re.compile(
-            "[{}]".format(
-                re.escape(
-                    "".join(set(ascii_symbols + unprintable_ascii_chars) - set(exclude_symbols))
-                )
-            ),
-            re.UNICODE,
-        )
-    else:
-        regexp = __RE_SYMBOL
-
-    try:
-        new_text = regexp.sub(replacement_text, to_str(text))
-    except TypeError:
-        raise TypeError("text must be a string")
-
-    if not replacement_text:
-        return new_text
-
-    if is_replace_consecutive_chars:
-        new_text = re.sub(f"{re.escape(replacement_text)}+", replacement_text, new_text)
-
-    if is_strip:
-        new_text = new_text.strip(replacement_text)
-
-    return new_text
+    return engine_cache.get_or_create(
+        (
+            SymbolReplacer,
+            replacement_text,
+            to_hashable(exclude_symbols),
+            is_replace_consecutive_chars,
+            is_strip,
+        ),
+        lambda: SymbolReplacer(
+            replacement_text=replacement_text,
+            exclude_symbols=exclude_symbols,
+            is_replace_consecutive_chars=is_replace_consecutive_chars,
+            is_strip=is_strip,
+        ),
+    ).replace(text)
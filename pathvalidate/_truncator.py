@@ -0,0 +1,190 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Final, Optional
+
+from ._common import get_str_len, truncate_str_by_unit
+from ._const import LengthUnit
+
+
+_ZWJ: Final = "\N{ZERO WIDTH JOINER}"
+_EXTEND_CATEGORIES: Final = frozenset(("Mn", "Me", "Mc"))
+
+
+def _is_extend(char: str) -> bool:
+    # characters that belong to the grapheme cluster of the preceding character
+    code = ord(char)
+
+    return (
+        unicodedata.category(char) in _EXTEND_CATEGORIES
+        or char == _ZWJ
+        or 0xFE00 <= code <= 0xFE0F  # variation selectors
+        or 0x1F3FB <= code <= 0x1F3FF  # emoji modifiers (skin tones)
+        or 0xE0020 <= code <= 0xE007F  # tags (subdivision flags)
+        or 0xE0100 <= code <= 0xE01EF  # variation selectors supplement
+        or 0x1160 <= code <= 0x11FF  # Hangul jamo vowels/trailing consonants
+    )
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return "\U0001f1e6" <= char <= "\U0001f1ff"
+
+
+def find_grapheme_boundary(text: str, index: int) -> int:
+    """Return the largest grapheme cluster boundary of the ``text`` that is at most ``index``.
+
+    The boundaries follow a subset of the extended grapheme cluster rules of UAX #29
+    that is enough for file names: combining marks, variation selectors, emoji modifiers,
+    emoji ZWJ sequences, flags (regional indicator pairs), and Hangul jamo sequences.
+    Only the characters around the ``index`` are read.
+    """
+
+    while 0 < index < len(text):
+        char = text[index]
+        prev_char = text[index - 1]
+
+        if _is_extend(char) or prev_char == _ZWJ:
+            index -= 1
+            continue
+
+        if _is_regional_indicator(char) and _is_regional_indicator(prev_char):
+            # regional indicators pair up from the start of their run
+            run_start = index - 1
+            while run_start > 0 and _is_regional_indicator(text[run_start - 1]):
+                run_start -= 1
+            if (index - run_start) % 2 == 1:
+                index -= 1
+
+        break
+
+    return index
+
+
+class FileNameTruncator:
+    """
+    Truncate file names that are too long while keeping them readable:
+
+    - keep the extension (such as ``.txt`` or ``.tar.gz``)
+    - cut the rest of the name only at grapheme cluster boundaries:
+      combining character sequences and emoji ZWJ sequences are never split
+    - optionally, append a short deterministic hash tag of the name to the cut part,
+      so that long names that only differ after the cut stay distinct
+
+    Pass an instance to ``truncator`` of :py:class:`~pathvalidate.FileNameSanitizer` or
+    :py:class:`~pathvalidate.FilePathSanitizer`.
+    Apart from the hash tag, a truncation reads only the first ``max_len`` characters and
+    the extension of a name, so long names cost no more than short ones.
+
+    Args:
+        keep_extension:
+            If |True|, keep the extension of a name.
+        max_extension_parts:
+            Maximum number of the parts of an extension, such as ``2`` for ``.tar.gz``.
+        max_extension_len:
+            Maximum number of characters of each part of an extension, excluding the period.
+            Longer parts are not regarded as a part of the extension.
+        hash_len:
+            Number of hexadecimal digits of the hash tag. ``0`` to not add hash tags.
+            The tag is made from the SHA-256 digest of the whole name.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import FileNameSanitizer, FileNameTruncator
+
+            sanitizer = FileNameSanitizer(max_len=20, truncator=FileNameTruncator(hash_len=6))
+            print(sanitizer.sanitize("a_very_long_report_name_2024.tar.gz"))
+
+        .. code-block:: console
+
+            a_very~fd600d.tar.gz
+    """
+
+    def __init__(
+        self,
+        keep_extension: bool = True,
+        max_extension_parts: int = 2,
+        max_extension_len: int = 16,
+        hash_len: int = 0,
+    ) -> None:
+        if max_extension_parts < 1 or max_extension_len < 1:
+            raise ValueError("max_extension_parts and max_extension_len must be greater than zero")
+        if not (0 <= hash_len <= hashlib.sha256().digest_size * 2):
+            raise ValueError("hash_len must be between 0 and 64")
+
+        self.__keep_extension = keep_extension
+        self.__max_extension_search_len = max_extension_parts * (max_extension_len + 1)
+        self.__re_extension = re.compile(
+            rf"(?:\.[^.\s]{{1,{max_extension_len:d}}}){{1,{max_extension_parts:d}}}\Z"
+        )
+        self.__hash_len = hash_len
+
+    def truncate(
+        self,
+        filename: str,
+        max_len: int,
+        fs_encoding: str = "utf-8",
+        length_unit: Optional[LengthUnit] = None,
+    ) -> str:
+        """Truncate the ``filename`` to at most ``max_len`` in the ``length_unit``.
+
+        Args:
+            filename: File name to truncate.
+            max_len: Maximum length of the result.
+            fs_encoding: Encoding to measure the length in when the ``length_unit`` is bytes.
+            length_unit: Unit of the ``max_len``. Defaults to bytes.
+
+        Returns:
+            str: The ``filename`` as it is if it is not longer than the ``max_len``,
+            otherwise the truncated ``filename``.
+        """
+
+        if length_unit is None:
+            length_unit = LengthUnit.BYTES
+
+        if get_str_len(filename, fs_encoding, length_unit, limit=max_len) <= max_len:
+            return filename
+
+        extension = self.__extract_extension(filename)
+        tag = f"~{self.__make_hash(filename)}" if self.__hash_len > 0 else ""
+
+        # the cut part gets at least one unit: drop the extension, and then the tag, otherwise
+        candidates = (
+            (len(filename) - len(extension), tag + extension),
+            (len(filename), tag),
+            (len(filename), ""),
+        )
+        for stem_len, tail in candidates:
+            stem_max_len = max_len - get_str_len(tail, fs_encoding, length_unit)
+            if stem_max_len > 0:
+                break
+
+        # every character takes at least one unit: the cut is within the first stem_max_len
+        # characters, and the character that follows the cut tells the boundary
+        stem = filename[: min(stem_len, stem_max_len + 1)]
+        head = truncate_str_by_unit(stem, fs_encoding, length_unit, stem_max_len)
+        boundary = find_grapheme_boundary(stem, len(head))
+        if boundary > 0:
+            # a single grapheme cluster longer than the limit is cut as it is
+            head = head[:boundary]
+
+        return head + tail
+
+    def __extract_extension(self, filename: str) -> str:
+        if not self.__keep_extension:
+            return ""
+
+        match = self.__re_extension.search(filename[-self.__max_extension_search_len :])
+        if match is None or match.group() == filename:
+            return ""
+
+        return match.group()
+
+    def __make_hash(self, filename: str) -> str:
+        digest = hashlib.sha256(filename.encode("utf-8", "surrogatepass")).hexdigest()
+
+        return digest[: self.__hash_len]
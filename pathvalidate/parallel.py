@@ -0,0 +1,113 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import itertools
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Final, Optional
+
+from ._base import AbstractSanitizer
+from ._types import PathType
+
+
+DEFAULT_CHUNK_SIZE: Final = 10_000
+
+# sanitizer of a worker process: set once per process by the pool initializer
+_worker_sanitizer: Optional[AbstractSanitizer] = None
+
+
+def _init_worker(sanitizer: AbstractSanitizer) -> None:
+    global _worker_sanitizer
+
+    _worker_sanitizer = sanitizer
+
+
+def _sanitize_chunk(chunk: list[PathType], replacement_text: str) -> list[PathType]:
+    assert _worker_sanitizer is not None
+
+    sanitize = _worker_sanitizer.sanitize
+
+    return [sanitize(value, replacement_text) for value in chunk]
+
+
+def _iter_chunks(values: Iterable[PathType], chunk_size: int) -> Iterator[list[PathType]]:
+    iterator = iter(values)
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def sanitize_parallel(
+    values: Iterable[PathType],
+    sanitizer: AbstractSanitizer,
+    replacement_text: str = "",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[PathType]:
+    """Sanitize the ``values`` with a pool of worker processes.
+
+    The ``values`` are split into chunks that are sanitized by the worker processes.
+    The ``sanitizer`` is pickled once per worker process, not per value or per chunk.
+    The ``values`` are consumed lazily: only a bounded number of chunks are in flight at once.
+
+    Args:
+        values:
+            Filenames or file paths to sanitize.
+        sanitizer:
+            Sanitizer to apply, such as :py:class:`~pathvalidate.FilePathSanitizer`.
+            The sanitizer and its handlers must be picklable.
+        replacement_text:
+            Replacement text for invalid characters. Defaults to ``""``.
+        chunk_size:
+            Number of values that are sent to a worker process at once.
+        max_workers:
+            Number of worker processes.
+            If |None|, the number of processors of the machine.
+
+    Yields:
+        Sanitized values in the same order as the ``values``.
+
+    Raises:
+        ValueError:
+            If the ``chunk_size`` or the ``max_workers`` is lower than one.
+
+    Example:
+        .. code-block:: python
+
+            from pathvalidate import FilePathSanitizer
+            from pathvalidate.parallel import sanitize_parallel
+
+            with open("paths.txt") as f:
+                paths = (line.rstrip("\\n") for line in f)
+
+                for path in sanitize_parallel(paths, FilePathSanitizer(platform="windows")):
+                    print(path)
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater or equal to one")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(sanitizer,)
+    ) as executor:
+        max_in_flight = max_workers * 2
+        futures: deque[Future[list[PathType]]] = deque()
+
+        for chunk in _iter_chunks(values, chunk_size):
+            if len(futures) >= max_in_flight:
+                yield from futures.popleft().result()
+
+            futures.append(executor.submit(_sanitize_chunk, chunk, replacement_text))
+
+        while futures:
+            yield from futures.popleft().result()
@@ -51,7 +51,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/x-rst",
     include_package_data=True,
-    packages=setuptools.find_packages(exclude=["test*"]),
+    packages=setuptools.find_packages(exclude=["benchmarks*", "test*"]),
     package_data={MODULE_NAME: ["py.typed"]},
     project_urls={
         "Changelog": f"{REPOSITORY_URL:s}/blob/master/CHANGELOG.md",
@@ -0,0 +1,128 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+
+import pytest
+from tcolorpy import tcolor
+
+from pathvalidate import (
+    AnsiEscapeStrippedReader,
+    AnsiEscapeStripper,
+    replace_ansi_escape,
+    replace_unprintable_char,
+)
+
+
+def split_every(value, size):
+    return [value[i : i + size] for i in range(0, len(value), size)]
+
+
+LOG = "".join(
+    f"{tcolor(f'line {i:d}', color='red', styles=['bold'])} \x1b[2K\x9b1;2H\x1b7ok\x07 あ\n"
+    for i in range(50)
+)
+
+
+class Test_AnsiEscapeStripper:
+    @pytest.mark.parametrize(["size"], [[1], [2], [3], [7], [64], [len(LOG)]])
+    def test_normal(self, size):
+        expected = replace_ansi_escape(LOG)
+
+        assert "".join(AnsiEscapeStripper().iter_stripped(split_every(LOG, size))) == expected
+        assert (
+            "".join(AnsiEscapeStripper().iter_stripped(split_every(LOG.encode("utf-8"), size)))
+            == expected
+        )
+
+    def test_normal_hold_back(self):
+        stripper = AnsiEscapeStripper("_")
+
+        assert stripper.feed("abc\x1b[1") == "abc"
+        assert stripper.feed(";31") == ""
+        assert stripper.feed("mdef\x1b") == "_def"
+        assert stripper.feed("x") == "\x1bx"
+        assert stripper.feed("\x1b[12") == ""
+        assert stripper.flush() == "\x1b[12"
+
+    def test_normal_max_escape_len(self):
+        stripper = AnsiEscapeStripper(max_escape_len=10)
+        assert stripper.feed("a\x1b[1;2;3;4") == "a"
+        assert stripper.feed(";5;") == "\x1b[1;2;3;4;5;"
+        assert stripper.feed("6m") == "6m"
+        assert stripper.flush() == ""
+
+        # the held back text is bounded for an endless sequence
+        stripper = AnsiEscapeStripper()
+        input_len = output_len = 0
+        for chunk in ["\x1b["] + ["1;" * 100] * 1000:
+            input_len += len(chunk)
+            output_len += len(stripper.feed(chunk))
+            assert input_len - output_len <= 1024
+        assert output_len + len(stripper.flush()) == input_len
+
+    def test_normal_strip_unprintable(self):
+        expected = replace_unprintable_char(replace_ansi_escape(LOG, "_"), "_")
+        stripper = AnsiEscapeStripper("_", strip_unprintable=True)
+
+        assert "".join(stripper.iter_stripped(split_every(LOG, 5))) == expected
+
+    def test_normal_decode_errors(self):
+        stripper = AnsiEscapeStripper(errors="replace")
+
+        assert stripper.feed(b"a\xe3\x81") == "a"
+        assert stripper.flush() == "�"
+
+    def test_exception(self):
+        with pytest.raises(UnicodeDecodeError):
+            stripper = AnsiEscapeStripper()
+            stripper.feed(b"a\xe3\x81")
+            stripper.flush()
+
+        with pytest.raises(ValueError):
+            stripper = AnsiEscapeStripper()
+            stripper.feed(b"a\xe3\x81")
+            stripper.feed("a")
+
+        with pytest.raises(TypeError):
+            AnsiEscapeStripper().feed(1)
+
+
+class Test_AnsiEscapeStrippedReader:
+    @pytest.mark.parametrize(["chunk_size"], [[1], [5], [4096]])
+    def test_normal(self, chunk_size):
+        expected = replace_ansi_escape(LOG)
+
+        with AnsiEscapeStrippedReader(
+            io.BytesIO(LOG.encode("utf-8")), chunk_size=chunk_size
+        ) as reader:
+            assert list(reader) == expected.splitlines(keepends=True)
+
+        with AnsiEscapeStrippedReader(io.StringIO(LOG), chunk_size=chunk_size) as reader:
+            assert reader.read(3) == expected[:3]
+            assert reader.readline() == expected[3:].splitlines(keepends=True)[0]
+            assert reader.readline(2) == expected.splitlines(keepends=True)[1][:2]
+            assert reader.read() == "".join(expected.splitlines(keepends=True)[1:])[2:]
+            assert reader.read() == ""
+            assert reader.readline() == ""
+
+    def test_normal_close(self):
+        stream = io.BytesIO(b"a")
+        with AnsiEscapeStrippedReader(stream):
+            pass
+        assert stream.closed
+
+        stream = io.BytesIO(b"a")
+        with AnsiEscapeStrippedReader(stream, closefd=False):
+            pass
+        assert not stream.closed
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            AnsiEscapeStrippedReader(io.BytesIO(b"a"), chunk_size=0)
+
+        reader = AnsiEscapeStrippedReader(io.BytesIO(b"a"))
+        reader.close()
+        with pytest.raises(ValueError):
+            reader.read()
@@ -0,0 +1,154 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pathvalidate import (
+    ErrorReason,
+    PathBuilder,
+    ValidationError,
+    is_valid_filepath,
+    sanitize_filepath,
+    validate_filepath,
+)
+
+
+class Test_PathBuilder:
+    @pytest.mark.parametrize(
+        ["base", "components", "platform", "expected"],
+        [
+            ["", ["a", "b.txt"], "linux", "a/b.txt"],
+            ["/srv", ["a", "b.txt"], "linux", "/srv/a/b.txt"],
+            ["/", ["a"], "linux", "/a"],
+            ["C:\\", ["a", "b.txt"], "windows", "C:\\a\\b.txt"],
+            ["C:\\data", ["a"], "windows", "C:\\data\\a"],
+            ["data", ["a"], "universal", "data/a"],
+        ],
+    )
+    def test_normal(self, base, components, platform, expected):
+        path = PathBuilder(base, platform=platform).joinpath(*components)
+
+        assert str(path) == expected
+        assert os.fspath(path) == expected
+        assert path.to_path() == Path(expected)
+        assert path.byte_len == len(expected.encode("utf-8"))
+        assert path.name == components[-1]
+        assert is_valid_filepath(str(path), platform=platform)
+
+    def test_normal_shared_prefix(self):
+        directory = PathBuilder("root", platform="linux") / "dir"
+        a = directory / "a.txt"
+        b = directory / "b.txt"
+
+        assert a.parent is b.parent is directory
+        assert str(a) == "root/dir/a.txt"
+        assert str(b) == "root/dir/b.txt"
+        assert a == PathBuilder("root/dir/a.txt", platform="linux")
+        assert a != b
+
+    def test_normal_deep(self):
+        path = PathBuilder(platform="linux")
+        for i in range(500):
+            path = path / f"d{i}"
+
+        assert str(path) == "/".join(f"d{i}" for i in range(500))
+
+    @pytest.mark.parametrize(
+        ["base", "component", "platform", "expected"],
+        [
+            ["a", "b?", "windows", ErrorReason.INVALID_CHARACTER],
+            ["a", "b/c", "linux", ErrorReason.INVALID_CHARACTER],
+            ["a", "CON", "windows", ErrorReason.RESERVED_NAME],
+            ["C:\\", "$Mft", "windows", ErrorReason.RESERVED_NAME],
+            ["C:", "a", "linux", ErrorReason.MALFORMED_ABS_PATH],
+            ["a", "", "linux", ErrorReason.NULL_NAME],
+            ["a", "b" * 4095, "linux", ErrorReason.INVALID_LENGTH],
+        ],
+    )
+    def test_exception_component(self, base, component, platform, expected):
+        with pytest.raises(ValidationError) as e:
+            PathBuilder(base, platform=platform) / component
+        assert e.value.reason == expected
+
+    @pytest.mark.parametrize(
+        ["component", "platform"],
+        [
+            ["x\\:", "macos"],
+            [":\\x", "posix"],
+            ["x\\:", "universal"],
+        ],
+    )
+    def test_exception_component_deep(self, component, platform):
+        # past the first components, the component is checked without the whole path
+        path = PathBuilder("base", platform=platform) / "a" / "b" / "c"
+        assert not is_valid_filepath(f"{path}/{component}", platform=platform)
+
+        with pytest.raises(ValidationError):
+            path / component
+
+    def test_normal_component_deep_backslash(self):
+        path = PathBuilder("base", platform="linux") / "a" / "b" / "c" / "x\\y"
+
+        assert str(path) == "base/a/b/c/x\\y"
+        assert is_valid_filepath(str(path), platform="linux")
+
+    def test_exception_max_len(self):
+        path = PathBuilder("C:\\", platform="windows", max_len=10) / "abcd" / "efgh"
+        assert str(path) == "C:\\abcd\\efgh"
+
+        with pytest.raises(ValidationError) as e:
+            path / "i"
+        assert e.value.reason == ErrorReason.INVALID_LENGTH
+
+    @pytest.mark.parametrize(
+        ["base", "component", "platform"],
+        [
+            ["root", "a" * 300, "linux"],
+            ["root", "a" * 300 + "?", "linux"],
+            ["root", "a" * 4095, "linux"],
+            ["C:\\root", "a" * 250, "windows"],
+            ["C:\\root", "a" * 300, "windows"],
+            ["root", "a" * 300, "universal"],
+        ],
+    )
+    def test_normal_same_as_filepath(self, base, component, platform):
+        value = f"{base}/{component}"
+
+        try:
+            validate_filepath(value, platform=platform)
+        except ValidationError as e:
+            with pytest.raises(ValidationError) as e_builder:
+                PathBuilder(base, platform=platform) / component
+            assert e_builder.value.reason == e.reason
+        else:
+            path = PathBuilder(base, platform=platform) / component
+            assert is_valid_filepath(str(path), platform=platform)
+
+        expected = sanitize_filepath(value, platform=platform)
+        if is_valid_filepath(expected, platform=platform):
+            path = PathBuilder(base, platform=platform, sanitize=True) / component
+            assert str(path) == expected
+
+    def test_exception_base(self):
+        with pytest.raises(ValidationError):
+            PathBuilder("a/b?", platform="windows")
+
+    @pytest.mark.parametrize(
+        ["base", "components", "platform", "replacement_text", "expected"],
+        [
+            ["a?", ["b*c", "CON", "d "], "windows", "", "a\\bc\\CON_\\d"],
+            ["a", ["b:c", "", "d/e"], "universal", "_", "a/b_c/d/e"],
+            ["a", ["\0"], "linux", "", "a"],
+        ],
+    )
+    def test_normal_sanitize(self, base, components, platform, replacement_text, expected):
+        path = PathBuilder(
+            base, platform=platform, sanitize=True, replacement_text=replacement_text
+        ).joinpath(*components)
+
+        assert str(path) == expected
+        assert is_valid_filepath(str(path), platform=platform)
@@ -0,0 +1,89 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from pathvalidate import (
+    engine_cache,
+    is_valid_filename,
+    sanitize_filename,
+    sanitize_filepath,
+    validate_filepath,
+)
+from pathvalidate._cache import CacheInfo, LRUCache
+
+
+class Test_LRUCache:
+    def test_normal(self):
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get_or_create("a", lambda: 1) == 1
+        assert cache.get_or_create("a", lambda: 2) == 1
+        assert cache.cache_info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+        assert cache.cache_info().hit_ratio == 0.5
+
+    def test_normal_evict(self):
+        cache = LRUCache(maxsize=2)
+
+        cache.get_or_create("a", lambda: 1)
+        cache.get_or_create("b", lambda: 2)
+        cache.get_or_create("a", lambda: 1)
+        cache.get_or_create("c", lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.get_or_create("a", lambda: 10) == 1
+        assert cache.get_or_create("b", lambda: 20) == 20
+
+    def test_normal_unhashable_key(self):
+        cache = LRUCache(maxsize=2)
+
+        assert cache.get_or_create(["a"], lambda: 1) == 1
+        assert cache.get_or_create(["a"], lambda: 2) == 2
+        assert len(cache) == 0
+
+    def test_normal_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.get_or_create("a", lambda: 1)
+        cache.clear()
+
+        assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+        assert cache.cache_info().hit_ratio == 0
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class Test_engine_cache:
+    def setup_method(self):
+        engine_cache.clear()
+
+    def test_normal(self):
+        for _ in range(3):
+            assert sanitize_filename("a?b", platform="windows") == "ab"
+            assert sanitize_filepath("a/b?c", platform="windows") == "a\\bc"
+            validate_filepath("a/b", platform="linux")
+            assert is_valid_filename("a?b", platform="windows") is False
+
+        cache_info = engine_cache.cache_info()
+        assert cache_info.misses == 4
+        assert cache_info.hits == 8
+        assert cache_info.currsize == 4
+
+    def test_normal_platform_key(self):
+        assert sanitize_filename("a:b", platform="windows") == "ab"
+        assert sanitize_filename("a:b", platform="linux") == "a:b"
+        assert sanitize_filename("a:b", platform="Windows") == "ab"
+
+        assert engine_cache.cache_info().misses == 2
+
+    def test_normal_unhashable_handler(self):
+        class Handler:
+            __hash__ = None
+
+            def __call__(self, e):
+                return "null"
+
+        assert sanitize_filename("", null_value_handler=Handler()) == "null"
+        assert engine_cache.cache_info().currsize == 0
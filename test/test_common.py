@@ -3,16 +3,19 @@
 """
 
 import itertools
+import random
 
 import pytest
 from tcolorpy import tcolor
 
 from pathvalidate import (
+    LengthUnit,
     ascii_symbols,
     replace_ansi_escape,
     replace_unprintable_char,
     unprintable_ascii_chars,
 )
+from pathvalidate._common import get_byte_len, get_utf16_len, truncate_str, truncate_str_by_unit
 
 from ._common import alphanum_chars
 
@@ -57,3 +60,94 @@ class Test_replace_ansi_escape:
         value = "test"
         ansi_value = tcolor(value, color="ffffff", bg_color="111111", styles=["bold"])
         assert replace_ansi_escape(ansi_value) == value
+
+
+class Test_get_byte_len:
+    @pytest.mark.parametrize(
+        ["value", "encoding"],
+        [
+            ["", "utf-8"],
+            ["abc", "utf-8"],
+            ["abc", "UTF8"],
+            ["aé😀あ", "utf-8"],
+            ["aé😀あ" * 50_000, "utf-8"],
+            ["aé😀あ", "utf-16"],
+            ["aé", "latin-1"],
+        ],
+    )
+    def test_normal(self, value, encoding):
+        assert get_byte_len(value, encoding) == len(value.encode(encoding))
+
+    @pytest.mark.parametrize(
+        ["value", "limit", "expected"],
+        [
+            ["abc", 3, 3],
+            ["aé", 3, 3],
+            ["éé", 3, 4],
+            ["a" * 10, 3, 10],
+            ["é" * 10, 3, 10],
+        ],
+    )
+    def test_normal_limit(self, value, limit, expected):
+        assert get_byte_len(value, "utf-8", limit=limit) == expected
+
+    @pytest.mark.parametrize(["limit"], [[0], [1], [3], [4], [7], [255], [1000]])
+    def test_normal_limit_multibyte(self, limit):
+        rng = random.Random(limit)
+        chars = "aé€😀"
+
+        for _ in range(1000):
+            value = "".join(rng.choice(chars) for _ in range(rng.randint(0, limit + 2)))
+            byte_ct = len(value.encode("utf-8"))
+            result = get_byte_len(value, "utf-8", limit=limit)
+
+            if byte_ct <= limit:
+                assert result == byte_ct
+            else:
+                assert limit < result <= byte_ct
+
+
+class Test_truncate_str:
+    @pytest.mark.parametrize(
+        ["value", "encoding", "max_bytes", "expected"],
+        [
+            ["abcde", "utf-8", 3, "abc"],
+            ["abc", "utf-8", 3, "abc"],
+            ["aéb", "utf-8", 2, "a"],
+            ["aéb", "utf-8", 3, "aé"],
+            ["😀" * 10, "utf-8", 9, "😀😀"],
+            ["é" * 1_000_000, "utf-8", 5, "éé"],
+            ["aéb", "utf-16", 6, "aé"],
+        ],
+    )
+    def test_normal(self, value, encoding, max_bytes, expected):
+        assert truncate_str(value, encoding, max_bytes) == expected
+
+
+class Test_get_utf16_len:
+    @pytest.mark.parametrize(
+        ["value"],
+        [[""], ["abc"], ["aéあ"], ["a😀b😀"], ["😀" * 1000]],
+    )
+    def test_normal(self, value):
+        assert get_utf16_len(value) == len(value.encode("utf-16-le")) // 2
+
+    def test_normal_limit(self):
+        assert get_utf16_len("😀" * 10, limit=5) == 10
+
+
+class Test_truncate_str_by_unit:
+    @pytest.mark.parametrize(
+        ["value", "unit", "max_len", "expected"],
+        [
+            ["aéb", LengthUnit.BYTES, 2, "a"],
+            ["aéb", LengthUnit.CODE_POINTS, 2, "aé"],
+            ["a😀b", LengthUnit.CODE_POINTS, 2, "a😀"],
+            ["aéb", LengthUnit.UTF16_CODE_UNITS, 2, "aé"],
+            ["a😀b", LengthUnit.UTF16_CODE_UNITS, 2, "a"],
+            ["a😀b", LengthUnit.UTF16_CODE_UNITS, 3, "a😀"],
+            ["😀" * 10, LengthUnit.UTF16_CODE_UNITS, 5, "😀😀"],
+        ],
+    )
+    def test_normal(self, value, unit, max_len, expected):
+        assert truncate_str_by_unit(value, "utf-8", unit, max_len) == expected
@@ -4,10 +4,12 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import asyncio
 import platform as m_platform
 import random
 import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain, product
 from pathlib import Path, PurePosixPath, PureWindowsPath
 
@@ -15,12 +17,15 @@ import pytest
 from allpairspy import AllPairs
 
 from pathvalidate import (
+    AbstractValidator,
     ErrorReason,
+    LengthUnit,
     Platform,
     ValidationError,
     is_valid_filename,
     sanitize_filename,
     validate_filename,
+    validate_filenames,
 )
 from pathvalidate._common import unprintable_ascii_chars
 from pathvalidate._filename import FileNameSanitizer, FileNameValidator
@@ -136,6 +141,133 @@ class Test_FileNameValidator:
             sanitizer.reserved_keywords == FileNameValidator(platform="windows").reserved_keywords
         )
 
+    @pytest.mark.parametrize(
+        ["value", "platform", "expected_reason", "expected_span"],
+        [
+            ["abc.txt", "windows", None, None],
+            ["a?c.txt", "windows", ErrorReason.INVALID_CHARACTER, (1, 2)],
+            ["abc.txt ", "windows", ErrorReason.INVALID_CHARACTER, (7, 8)],
+            ["CON.txt", "windows", ErrorReason.RESERVED_NAME, (0, 3)],
+            ["a" * 256, "linux", ErrorReason.INVALID_LENGTH, (0, 256)],
+            ["/abc", "linux", ErrorReason.FOUND_ABS_PATH, (0, 4)],
+            ["", "linux", ErrorReason.NULL_NAME, (0, 0)],
+        ],
+    )
+    def test_normal_check(self, value, platform, expected_reason, expected_span):
+        validator = FileNameValidator(platform=platform)
+        result = validator.check(value)
+
+        if expected_reason is None:
+            assert result is None
+            return
+
+        assert result.reason == expected_reason
+        assert result.span == expected_span
+        with pytest.raises(ValidationError) as e:
+            validator.validate(value)
+        assert e.value.reason == expected_reason
+        assert str(result.make_error()) == str(e.value)
+
+    def test_normal_check_custom_validator(self):
+        class CustomValidator(AbstractValidator):
+            @property
+            def min_len(self) -> int:
+                return 1
+
+            def validate(self, value) -> None:
+                if value == "bad":
+                    raise ValidationError(reason=ErrorReason.INVALID_CHARACTER)
+
+        validator = CustomValidator(max_len=255, fs_encoding=None, check_reserved=True)
+        assert validator.check("good") is None
+        assert validator.check("bad").reason == ErrorReason.INVALID_CHARACTER
+        assert validator.check("bad").make_error().reason == ErrorReason.INVALID_CHARACTER
+        assert validator.is_valid("good")
+        assert not validator.is_valid("bad")
+
+    def test_exception_check_type(self):
+        with pytest.raises(TypeError):
+            FileNameValidator().check(1)
+        assert not FileNameValidator().is_valid(1)
+
+    @pytest.mark.parametrize(
+        ["value", "fs_encoding"],
+        [
+            ["a" * 5_000_000, "utf-8"],
+            ["あ" * 5_000_000, "utf-8"],
+            ["あ" * 200, "utf-16"],
+        ],
+    )
+    def test_normal_check_huge(self, value, fs_encoding):
+        validator = FileNameValidator(platform="linux", fs_encoding=fs_encoding)
+        result = validator.check(value)
+        byte_ct = len(value.encode(fs_encoding))
+
+        assert result.reason == ErrorReason.INVALID_LENGTH
+        assert result.make_error().byte_count == byte_ct
+        assert f"actual={byte_ct:d} bytes" in str(result.make_error())
+
+    @pytest.mark.parametrize(
+        ["value", "platform", "expected_fast"],
+        [
+            ["abc.txt", "windows", True],
+            [".gitignore", "universal", True],
+            ["a b", "linux", True],
+            ["a?c.txt", "windows", False],
+            ["abc.txt ", "windows", False],
+            [" abc.txt", "windows", False],
+            ["abc.", "windows", False],
+            ["CON.txt", "windows", False],
+            ["con", "universal", False],
+            ["..", "linux", False],
+            ["...a", "linux", False],
+            ["a" * 256, "linux", False],
+        ],
+    )
+    def test_normal_fast_path_info(self, value, platform, expected_fast):
+        assert FileNameValidator(platform=platform).fast_path_info() is None
+
+        validator = FileNameValidator(platform=platform, fast_path_stats=True)
+        assert validator.fast_path_info() == (0, 0)
+        assert validator.fast_path_info().fast_ratio == 0.0
+
+        validator.check(value)
+
+        if expected_fast:
+            assert validator.fast_path_info() == (1, 0)
+            assert validator.fast_path_info().fast_ratio == 1.0
+        else:
+            assert validator.fast_path_info() == (0, 1)
+
+    def test_normal_fast_path_info_threads(self):
+        validator = FileNameValidator(platform="windows", fast_path_stats=True)
+        values = ["abc.txt", "a?c.txt"] * 1000
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(validator.check, values))
+
+        assert validator.fast_path_info() == (1000, 1000)
+
+    @pytest.mark.parametrize(
+        ["value", "additional_reserved_names", "expected_reason"],
+        [
+            ["abc.txt", ["abc"], ErrorReason.RESERVED_NAME],
+            ["abc.txt", ["abc.txt"], ErrorReason.RESERVED_NAME],
+            [".a", ["", ".a"], ErrorReason.RESERVED_NAME],
+            ["abc.txt", ["txt"], None],
+        ],
+    )
+    def test_normal_fast_path_reserved(self, value, additional_reserved_names, expected_reason):
+        validator = FileNameValidator(
+            platform="linux", additional_reserved_names=additional_reserved_names
+        )
+        result = validator.check(value)
+
+        if expected_reason is None:
+            assert result is None
+        else:
+            assert result.reason == expected_reason
+
 
 class Test_validate_filename:
     VALID_CHARS = VALID_FILENAME_CHARS
@@ -486,6 +618,203 @@ class Test_validate_filename:
         assert not is_valid_filename(value)
 
 
+class Test_validate_filenames:
+    def test_normal(self):
+        values = ["a.txt", "a?.txt", Path("b.txt"), "CON", "", "c.txt"]
+
+        assert list(validate_filenames(values, platform="windows")) == [
+            (1, "a?.txt", ErrorReason.INVALID_CHARACTER),
+            (3, "CON", ErrorReason.RESERVED_NAME),
+            (4, "", ErrorReason.NULL_NAME),
+        ]
+        assert list(validate_filenames(iter(values), platform="linux")) == [
+            (4, "", ErrorReason.NULL_NAME),
+        ]
+
+    def test_normal_bitmap(self):
+        validator = FileNameValidator(platform="windows")
+        values = ["a", "b?", "c", "d", "e", "f", "g", "h", "i:", "j"]
+
+        assert validator.validity_bitmap(values) == bytearray([0b11111101, 0b10])
+        assert validator.validity_bitmap([]) == bytearray()
+
+    def test_normal_whitespaces(self):
+        assert list(validate_filenames(["  "], platform="linux")) == []
+        assert list(validate_filenames(["  "], platform="windows")) == [
+            (0, "  ", ErrorReason.NULL_NAME)
+        ]
+
+    def test_exception_type(self):
+        with pytest.raises(TypeError):
+            list(validate_filenames(["a", 1]))
+
+
+class Test_FileNameValidator_bounded_work:
+    def test_normal(self):
+        validator = FileNameValidator(platform="linux", bounded_work=True)
+        value = "a" * 10_000_000
+
+        result = validator.check(value)
+        assert result.reason == ErrorReason.INVALID_LENGTH
+        assert result.make_error().byte_count == 10_000_000
+        assert "actual>=10000000 bytes" in str(result.make_error())
+
+        assert validator.check("a" * 255) is None
+
+    def test_normal_precedes_other_rules(self):
+        validator = FileNameValidator(platform="linux", bounded_work=True)
+
+        assert validator.check("/" + "a" * 255).reason == ErrorReason.INVALID_LENGTH
+        assert validator.check("/" + "a" * 254).reason == ErrorReason.FOUND_ABS_PATH
+
+
+class Test_FileNameSanitizer_bounded_work:
+    @pytest.mark.parametrize(
+        ["value", "replacement_text"],
+        [
+            ["a" * 10_000_000, ""],
+            ["a:b" * 1_000_000, ""],
+            ["a:b" * 1_000_000, "_"],
+            ["あ" * 1_000_000, ""],
+            ["a" * 1_000 + "CON", ""],
+        ],
+    )
+    def test_normal_same_as_unbounded(self, value, replacement_text):
+        bounded_sanitizer = FileNameSanitizer(platform="windows", bounded_work=True)
+        sanitizer = FileNameSanitizer(platform="windows")
+
+        assert bounded_sanitizer.sanitize(value, replacement_text) == sanitizer.sanitize(
+            value, replacement_text
+        )
+
+    def test_normal_hostile(self):
+        value = "\0" * 10_000_000 + "a"
+
+        assert FileNameSanitizer(platform="linux").sanitize(value) == "a"
+        assert FileNameSanitizer(platform="linux", bounded_work=True).sanitize(value) == ""
+
+
+class Test_FileName_length_unit:
+    @pytest.mark.parametrize(
+        ["value", "length_unit", "expected"],
+        [
+            ["あ" * 255, LengthUnit.UTF16_CODE_UNITS, None],
+            ["あ" * 256, LengthUnit.UTF16_CODE_UNITS, ErrorReason.INVALID_LENGTH],
+            ["😀" * 127, LengthUnit.UTF16_CODE_UNITS, None],
+            ["😀" * 128, LengthUnit.UTF16_CODE_UNITS, ErrorReason.INVALID_LENGTH],
+            ["😀" * 255, LengthUnit.CODE_POINTS, None],
+            ["あ" * 255, LengthUnit.BYTES, ErrorReason.INVALID_LENGTH],
+        ],
+    )
+    def test_normal_validator(self, value, length_unit, expected):
+        validator = FileNameValidator(
+            platform="windows", fs_encoding="utf-8", length_unit=length_unit
+        )
+        result = validator.check(value)
+
+        if expected is None:
+            assert result is None
+        else:
+            assert result.reason == expected
+            assert length_unit.value in str(result.make_error())
+
+    def test_normal_sanitizer(self):
+        sanitizer = FileNameSanitizer(
+            platform="windows", fs_encoding="utf-8", length_unit=LengthUnit.UTF16_CODE_UNITS
+        )
+
+        assert sanitizer.sanitize("あ" * 300) == "あ" * 255
+        assert sanitizer.sanitize("a" + "😀" * 200) == "a" + "😀" * 127
+        assert sanitizer.length_unit == LengthUnit.UTF16_CODE_UNITS
+        assert FileNameSanitizer().length_unit == LengthUnit.BYTES
+
+
+class Test_FileNameSanitizer_sanitize_many:
+    def test_normal(self):
+        sanitizer = FileNameSanitizer(platform="windows")
+        clean_str = "".join(["a", "b.txt"])
+        clean_path = Path("c.txt")
+        values = [clean_str, "a?b.txt", clean_path, Path("d:e.txt"), "CON"]
+
+        results = list(sanitizer.sanitize_many(values))
+
+        assert results == [
+            (clean_str, False),
+            ("ab.txt", True),
+            (clean_path, False),
+            (Path("de.txt"), True),
+            ("CON_", True),
+        ]
+        assert results[0].value is clean_str
+        assert results[2].value is clean_path
+
+    def test_normal_replacement_text(self):
+        sanitizer = FileNameSanitizer(platform="linux")
+
+        assert list(sanitizer.sanitize_many(["a/b", "ab"], replacement_text="_")) == [
+            ("a_b", True),
+            ("ab", False),
+        ]
+
+    def test_normal_identity(self):
+        value = "abc.txt"
+
+        assert FileNameSanitizer().sanitize(value) is value
+        assert sanitize_filename(value) is value
+
+
+class Test_FileNameSanitizer_async:
+    def test_normal_sanitize_unique_async(self, tmp_path):
+        sanitizer = FileNameSanitizer(platform="windows")
+        (tmp_path / "ab.txt").touch()
+        (tmp_path / "ab (2).txt").touch()
+
+        assert asyncio.run(sanitizer.sanitize_unique_async("c?d.txt", tmp_path)) == "cd.txt"
+        assert asyncio.run(sanitizer.sanitize_unique_async("a:b.txt", tmp_path)) == "ab (3).txt"
+        assert asyncio.run(sanitizer.sanitize_unique_async("", str(tmp_path))) == ""
+
+    def test_normal_sanitize_unique_async_max_len(self, tmp_path):
+        sanitizer = FileNameSanitizer(max_len=10, platform="linux")
+        (tmp_path / "abcdef.txt").touch()
+
+        assert asyncio.run(sanitizer.sanitize_unique_async("abcdef.txt", tmp_path)) == "ab (2).txt"
+
+    def test_normal_sanitize_unique_async_long_extension(self, tmp_path):
+        sanitizer = FileNameSanitizer(platform="linux")
+        validator = FileNameValidator(platform="linux")
+        value = "a." + "y" * 252
+        (tmp_path / value).touch()
+
+        filename = asyncio.run(sanitizer.sanitize_unique_async(value, tmp_path))
+
+        assert filename == "a (2)." + "y" * 249
+        assert validator.check(filename) is None
+        (tmp_path / filename).touch()
+
+    def test_normal_sanitize_many_async(self):
+        sanitizer = FileNameSanitizer(platform="windows")
+
+        async def agen():
+            for value in ["a?b", "c"]:
+                yield value
+
+        async def collect(values):
+            return [result async for result in sanitizer.sanitize_many_async(values)]
+
+        expected = [("ab", True), ("c", False)]
+        assert asyncio.run(collect(["a?b", "c"])) == expected
+        assert asyncio.run(collect(agen())) == expected
+
+    def test_normal_validate_many_async(self):
+        validator = FileNameValidator(platform="windows")
+
+        async def collect(values):
+            return [result async for result in validator.validate_many_async(values)]
+
+        values = [f"a{i}" for i in range(1000)] + ["b?"]
+        assert asyncio.run(collect(values)) == [(1000, "b?", ErrorReason.INVALID_CHARACTER)]
+
+
 class Test_sanitize_filename:
     SANITIZE_CHARS = INVALID_WIN_FILENAME_CHARS + unprintable_ascii_chars
     NOT_SANITIZE_CHARS = VALID_FILENAME_CHARS
@@ -4,10 +4,12 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import pickle
 import platform as m_platform
 import random
 import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain, product
 from pathlib import Path
 
@@ -16,11 +18,13 @@ from allpairspy import AllPairs
 
 from pathvalidate import (
     ErrorReason,
+    LengthUnit,
     Platform,
     ValidationError,
     is_valid_filepath,
     sanitize_filepath,
     validate_filepath,
+    validate_filepaths,
 )
 from pathvalidate._common import unprintable_ascii_chars
 from pathvalidate._filepath import FilePathSanitizer, FilePathValidator
@@ -91,6 +95,148 @@ class Test_FilePathValidator:
         sanitizer = FilePathValidator(additional_reserved_names=["abc"])
         assert "ABC" in sanitizer.reserved_keywords
 
+    @pytest.mark.parametrize(
+        ["value", "platform", "expected_reason", "expected_span"],
+        [
+            ["a/b/c.txt", "windows", None, None],
+            ["a/b?/c.txt", "windows", ErrorReason.INVALID_CHARACTER, (3, 4)],
+            ["C:\\a\\CON\\c.txt", "windows", ErrorReason.RESERVED_NAME, (5, 8)],
+            ["a/b\0/c.txt", "linux", ErrorReason.INVALID_CHARACTER, (3, 4)],
+            ["/$Mft", "windows", ErrorReason.MALFORMED_ABS_PATH, (0, 5)],
+            ["a" * 4097, "linux", ErrorReason.INVALID_LENGTH, (0, 4097)],
+            ["", "linux", ErrorReason.NULL_NAME, (0, 0)],
+            ["a/ /c.txt", "windows", ErrorReason.NULL_NAME, (2, 2)],
+            ["a/b /c.txt", "windows", ErrorReason.INVALID_CHARACTER, (3, 4)],
+            ["C:\\a\\CON\\c?.txt", "windows", ErrorReason.RESERVED_NAME, (5, 8)],
+            ["C:\\$Mft", "windows", ErrorReason.RESERVED_NAME, (2, 7)],
+            ["a/" * 100 + "c.txt", "universal", None, None],
+        ],
+    )
+    def test_normal_check(self, value, platform, expected_reason, expected_span):
+        validator = FilePathValidator(platform=platform)
+        result = validator.check(value)
+
+        if expected_reason is None:
+            assert result is None
+            return
+
+        assert result.reason == expected_reason
+        assert result.span == expected_span
+        with pytest.raises(ValidationError) as e:
+            validator.validate(value)
+        assert e.value.reason == expected_reason
+        assert str(result.make_error()) == str(e.value)
+
+
+class Test_FilePathValidator_prefix_cache:
+    @pytest.mark.parametrize(
+        ["value", "platform"],
+        [
+            ["tenant/2024/10/CON/a.txt", "windows"],
+            ["tenant/2024/ 10/a.txt", "windows"],
+            ["tenant/2024/10/a.txt ", "windows"],
+            ["C:\\tenant\\2024\\COM1", "windows"],
+            ["/tenant/2024/10/a.txt", "linux"],
+            ["tenant/2024/10/a\0.txt", "linux"],
+        ],
+    )
+    def test_normal_same_result(self, value, platform):
+        expected = FilePathValidator(platform=platform).check(value)
+        validator = FilePathValidator(platform=platform, prefix_cache_size=8)
+
+        for _ in range(3):
+            result = validator.check(value)
+            if expected is None:
+                assert result is None
+                continue
+
+            assert result.reason == expected.reason
+            assert result.span == expected.span
+            assert str(result.make_error()) == str(expected.make_error())
+
+    def test_normal_cache_info(self):
+        validator = FilePathValidator(platform="universal", prefix_cache_size=8)
+        for day in ("17", "18"):
+            for i in range(5):
+                validator.validate(f"tenant/2024/10/{day}/{i}.txt")
+
+        cache_info = validator.prefix_cache_info()
+        # misses: tenant, 2024, 10, 17, 18 and the two prefixes
+        assert cache_info.misses == 7
+        assert cache_info.hits == 8 + 3
+        assert cache_info.currsize == 7
+        assert FilePathValidator().prefix_cache_info() is None
+
+    def test_normal_bounded(self):
+        validator = FilePathValidator(platform="linux", prefix_cache_size=4)
+        for i in range(100):
+            validator.validate(f"dir{i}/sub{i}/a.txt")
+
+        assert validator.prefix_cache_info().currsize == 4
+
+    def test_normal_pickle(self):
+        validator = FilePathValidator(platform="linux", prefix_cache_size=4)
+        validator.validate("a/b/c.txt")
+        copied = pickle.loads(pickle.dumps(validator))
+
+        assert copied.prefix_cache_info().currsize == 0
+        assert copied.is_valid("a/b/c.txt")
+
+
+class Test_FilePathValidator_length_unit:
+    def test_normal(self):
+        value = "C:\\Users\\" + "あ" * 200
+
+        assert FilePathValidator(platform="windows", fs_encoding="utf-8").check(value).reason == (
+            ErrorReason.INVALID_LENGTH
+        )
+        assert (
+            FilePathValidator(
+                platform="windows", fs_encoding="utf-8", length_unit=LengthUnit.UTF16_CODE_UNITS
+            ).check(value)
+            is None
+        )
+
+
+class Test_FilePath_bounded_work:
+    def test_normal_validator(self):
+        validator = FilePathValidator(platform="windows", max_len=10, bounded_work=True)
+
+        assert validator.check("a\\b\\c") is None
+        assert validator.check("a" * 11).reason == ErrorReason.INVALID_LENGTH
+        # the drive does not count toward the max_len
+        assert validator.check("C:\\" + "a" * 9) is None
+        assert validator.check("C:" + "a" * 10) is None
+        assert validator.check("\\\\server\\share\\" + "a" * 9) is None
+        assert validator.check("C:" + "a" * 11).reason == ErrorReason.INVALID_LENGTH
+
+    @pytest.mark.parametrize(["platform"], [["windows"], ["universal"], ["linux"]])
+    def test_normal_validator_same_as_default(self, platform):
+        # the bounded-work mode only changes the work for oversized values, not the verdicts.
+        # oversized values are reported as too long before any other check
+        max_len = 20
+        validator = FilePathValidator(platform=platform, max_len=max_len)
+        bounded_validator = FilePathValidator(platform=platform, max_len=max_len, bounded_work=True)
+        rng = random.Random(0)
+        drives = ["", "C:", "C:\\", "c:/", "\\\\server\\share", "//srv/share/", "\\\\?\\D:\\"]
+        chars = "ab.:/\\ ?"
+
+        for _ in range(5000):
+            tail_len = rng.randint(0, max_len + 3)
+            value = rng.choice(drives) + "".join(rng.choice(chars) for _ in range(tail_len))
+            result = validator.check(value)
+            bounded_result = bounded_validator.check(value)
+
+            assert (bounded_result is None) == (result is None), value
+            if len(value) <= max_len and result is not None:
+                assert bounded_result.reason == result.reason, value
+
+    def test_normal_sanitizer(self):
+        sanitizer = FilePathSanitizer(platform="linux", max_len=10, bounded_work=True)
+
+        assert sanitizer.sanitize("a/b:c") == "a/b:c"
+        assert sanitizer.sanitize("a/" * 1_000_000) == "a/a/a/a/a/a/a/a/a/a/a/a/a/a/a/a/a/a/a/a"
+
 
 class Test_validate_filepath:
     VALID_CHARS = VALID_PATH_CHARS
@@ -578,6 +724,74 @@ class Test_validate_win_file_path:
         assert not is_valid_filepath(value, platform=platform)
 
 
+class Test_validate_filepaths:
+    def test_normal(self):
+        values = ["a/b.txt", "a/b?.txt", Path("a/b.txt"), "a/CON/b", "", "/a/b"]
+
+        assert list(validate_filepaths(values, platform="windows")) == [
+            (1, "a/b?.txt", ErrorReason.INVALID_CHARACTER),
+            (3, "a/CON/b", ErrorReason.RESERVED_NAME),
+            (4, "", ErrorReason.NULL_NAME),
+            (5, "/a/b", ErrorReason.MALFORMED_ABS_PATH),
+        ]
+        assert list(validate_filepaths(iter(values), platform="linux")) == [
+            (4, "", ErrorReason.NULL_NAME),
+        ]
+
+    def test_normal_bitmap(self):
+        validator = FilePathValidator(platform="linux")
+
+        assert validator.validity_bitmap(["a/b", "a/\0", "", "c"]) == bytearray([0b1001])
+
+
+class Test_FilePathSanitizer_sanitize_many:
+    def test_normal(self):
+        sanitizer = FilePathSanitizer(platform="linux")
+        clean_str = "".join(["a/", "b.txt"])
+        clean_path = Path("a/c.txt")
+        values = [clean_str, "a/./b\0.txt", clean_path, Path("a/d\0.txt")]
+
+        results = list(sanitizer.sanitize_many(values))
+
+        assert results == [
+            (clean_str, False),
+            ("a/b.txt", True),
+            (clean_path, False),
+            (Path("a/d.txt"), True),
+        ]
+        assert results[0].value is clean_str
+        assert results[2].value is clean_path
+
+
+class Test_FilePathSanitizer_threading:
+    def test_normal_shared_sanitizer(self):
+        sanitizer = FilePathSanitizer(platform="windows")
+        values = [f"a/{i}/b?c:{i}/CON/d.txt " for i in range(200)]
+        expected = [sanitizer.sanitize(value) for value in values]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(5):
+                assert list(executor.map(sanitizer.sanitize, values)) == expected
+
+
+class Test_FilePathSanitizer_sanitize_components:
+    @pytest.mark.parametrize(
+        ["platform", "value", "replacement_text", "kwargs", "expected"],
+        [
+            ["universal", "dir/ sub. /file.txt", "", {}, "dir/sub/file.txt"],
+            ["linux", "a/b\\c/d", "/", {}, "a/b/c/d"],
+            # the replacement text makes a drive of the path
+            ["windows", ">>\u3000/a\t.NbN\\", ":", {}, ""],
+            ["windows", "a/CON/b", "", {"reserved_name_handler": lambda e: " "}, ""],
+            ["windows", "a/CON/b", "", {"reserved_name_handler": lambda e: "x:"}, "a\\x:\\b"],
+        ],
+    )
+    def test_normal(self, platform, value, replacement_text, kwargs, expected):
+        sanitizer = FilePathSanitizer(platform=platform, **kwargs)
+
+        assert sanitizer.sanitize(value, replacement_text) == expected
+
+
 class Test_sanitize_filepath:
     SANITIZE_CHARS = INVALID_WIN_PATH_CHARS + unprintable_ascii_chars
     NOT_SANITIZE_CHARS = VALID_PATH_CHARS
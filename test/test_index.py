@@ -0,0 +1,146 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pathvalidate import FileNameSanitizer, FileNameValidator, NameIndex
+
+
+class Test_NameIndex:
+    def test_normal(self):
+        index = NameIndex(names=["a.txt"])
+
+        assert "a.txt" in index
+        assert "A.txt" not in index
+        assert 1 not in index
+        assert len(index) == 1
+        assert index.add("b.txt")
+        assert not index.add("b.txt")
+        assert len(index) == 2
+
+    def test_normal_casefold(self):
+        index = NameIndex(casefold=True, names=["Straße.txt"])
+
+        assert "STRASSE.TXT" in index
+        assert not index.add("strasse.txt")
+
+    def test_normal_claim(self):
+        index = NameIndex()
+
+        def make_candidate(num: int) -> str:
+            return f"a ({num:d})"
+
+        assert [index.claim("a", make_candidate) for _ in range(4)] == [
+            "a",
+            "a (2)",
+            "a (3)",
+            "a (4)",
+        ]
+
+        index.add("b (2)")
+        assert index.claim("b", lambda num: f"b ({num:d})") == "b"
+        assert index.claim("b", lambda num: f"b ({num:d})") == "b (3)"
+
+    def test_normal_pickle(self):
+        index = NameIndex(casefold=True, names=["a", "B"])
+        restored = pickle.loads(pickle.dumps(index))
+
+        assert restored.casefold
+        assert "A" in restored
+        assert "b" in restored
+
+    def test_normal_threads(self):
+        index = NameIndex()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(
+                executor.map(lambda _: index.claim("a", lambda num: f"a ({num:d})"), range(1000))
+            )
+
+        assert len(set(names)) == 1000
+
+
+class Test_FileNameSanitizer_sanitize_unique:
+    @pytest.mark.parametrize(
+        ["values", "casefold", "expected"],
+        [
+            [
+                ["a:b.txt", "a?b.txt", "ab.txt", "c.txt"],
+                False,
+                ["ab.txt", "ab (2).txt", "ab (3).txt", "c.txt"],
+            ],
+            [["ab.txt", "AB.txt", "Ab.txt"], False, ["ab.txt", "AB.txt", "Ab.txt"]],
+            [["ab.txt", "AB.txt", "Ab.txt"], True, ["ab.txt", "AB (2).txt", "Ab (3).txt"]],
+            [["", "?", "a"], False, ["", "", "a"]],
+        ],
+    )
+    def test_normal(self, values, casefold, expected):
+        sanitizer = FileNameSanitizer(platform="windows")
+        index = NameIndex(casefold=casefold)
+        filenames = [sanitizer.sanitize_unique(value, index) for value in values]
+
+        assert filenames == expected
+        assert all(FileNameValidator(platform="windows").is_valid(f) for f in filenames if f)
+
+    def test_normal_hash(self):
+        sanitizer = FileNameSanitizer(platform="windows")
+        index = NameIndex()
+
+        first = sanitizer.sanitize_unique("a:b.txt", index, hash_len=6)
+        second = sanitizer.sanitize_unique("a?b.txt", index, hash_len=6)
+        third = sanitizer.sanitize_unique("a?b.txt", index, hash_len=6)
+
+        assert first == "ab.txt"
+        assert second.startswith("ab~") and second.endswith(".txt") and len(second) == 13
+        assert third == "ab (2).txt"
+
+        # tags depend only on the values
+        other_index = NameIndex(names=["ab.txt"])
+        assert sanitizer.sanitize_unique("a?b.txt", other_index, hash_len=6) == second
+
+    def test_normal_max_len(self):
+        sanitizer = FileNameSanitizer(max_len=10)
+        index = NameIndex()
+
+        assert sanitizer.sanitize_unique("abcdef.txt", index) == "abcdef.txt"
+        assert sanitizer.sanitize_unique("abcdef.txt", index) == "ab (2).txt"
+
+    @pytest.mark.parametrize(["platform"], [["linux"], ["windows"]])
+    @pytest.mark.parametrize(["hash_len"], [[0], [8]])
+    def test_normal_long_extension(self, platform, hash_len):
+        # the extension leaves no room for the tag: the extension is truncated
+        sanitizer = FileNameSanitizer(platform=platform)
+        validator = FileNameValidator(platform=platform)
+        index = NameIndex()
+        value = "a." + "y" * 252
+
+        filenames = [sanitizer.sanitize_unique(value, index, hash_len=hash_len) for _ in range(3)]
+
+        assert filenames[0] == value
+        assert len(set(filenames)) == 3
+        for filename in filenames:
+            assert filename.startswith("a")
+            assert validator.check(filename) is None, filename
+
+    def test_normal_max_len_tag(self):
+        sanitizer = FileNameSanitizer(max_len=6)
+        validator = FileNameValidator(max_len=6)
+        index = NameIndex()
+
+        # the hash tag does not fit: numbers are added, and the extension is dropped
+        filenames = [sanitizer.sanitize_unique("a:b.tar", index, hash_len=8) for _ in range(3)]
+
+        assert filenames == ["ab.tar", "a (2)", "a (3)"]
+        assert all(validator.check(filename) is None for filename in filenames)
+
+    def test_exception_max_len(self):
+        sanitizer = FileNameSanitizer(max_len=4)
+        index = NameIndex()
+
+        assert sanitizer.sanitize_unique("abcd", index) == "abcd"
+        with pytest.raises(ValueError):
+            sanitizer.sanitize_unique("abcd", index)
@@ -2,11 +2,19 @@
 .. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
 """
 
+import io
 import itertools
+import mmap
 
 import pytest
 
-from pathvalidate import sanitize_ltsv_label, validate_ltsv_label
+from pathvalidate import (
+    LTSVReader,
+    LTSVWriter,
+    is_valid_ltsv_label,
+    sanitize_ltsv_label,
+    validate_ltsv_label,
+)
 from pathvalidate.error import ErrorReason, ValidationError
 
 from ._common import INVALID_WIN_FILENAME_CHARS, alphanum_chars
@@ -64,6 +72,21 @@ class Test_validate_ltsv_label:
         assert e.value.reason == ErrorReason.INVALID_CHARACTER
 
 
+class Test_is_valid_ltsv_label:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["abc" + c + "hoge123", True] for c in VALID_LABEL_CHARS]
+        + [["abc" + c + "hoge123", False] for c in INVALID_LABEL_CHARS]
+        + [["あいうえお", False], ["", False], [None, False], ["  ", False]],
+    )
+    def test_normal(self, value, expected):
+        assert is_valid_ltsv_label(value) is expected
+
+    @pytest.mark.parametrize(["value"], [[1], [True], [b"abc"]])
+    def test_abnormal(self, value):
+        assert is_valid_ltsv_label(value) is False
+
+
 class Test_sanitize_ltsv_label:
     TARGET_CHARS = INVALID_LABEL_CHARS
     NOT_TARGET_CHARS = alphanum_chars
@@ -99,3 +122,104 @@ class Test_sanitize_ltsv_label:
     def test_abnormal(self, value, expected):
         with pytest.raises(expected):
             sanitize_ltsv_label(value)
+
+
+LTSV_DATA = "host:127.0.0.1\tst atus:200\tmsg:a:b\n\nhost:::1\tst atus:404\r\n"
+LTSV_RECORDS = [
+    {"host": "127.0.0.1", "status": "200", "msg": "a:b"},
+    {"host": "::1", "status": "404"},
+]
+
+
+class Test_LTSVReader:
+    def test_normal_text(self):
+        reader = LTSVReader(io.StringIO(LTSV_DATA))
+
+        assert list(reader) == LTSV_RECORDS
+        assert reader.line_num == 3
+
+    def test_normal_binary(self, tmp_path):
+        path = tmp_path / "access.log"
+        path.write_bytes(LTSV_DATA.encode("utf-8"))
+
+        assert list(LTSVReader(LTSV_DATA.encode("utf-8"))) == LTSV_RECORDS
+
+        with open(path, "rb") as f:
+            assert list(LTSVReader(f)) == LTSV_RECORDS
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert list(LTSVReader(m)) == LTSV_RECORDS
+            assert m.tell() == 0
+
+    def test_normal_replacement_text(self):
+        assert next(iter(LTSVReader(io.StringIO(LTSV_DATA), replacement_text="_"))) == {
+            "host": "127.0.0.1",
+            "st_atus": "200",
+            "msg": "a:b",
+        }
+
+    @pytest.mark.parametrize(["memo_size"], [[0], [1], [1024]])
+    def test_normal_memo_size(self, memo_size):
+        assert list(LTSVReader(io.StringIO(LTSV_DATA), memo_size=memo_size)) == LTSV_RECORDS
+
+    @pytest.mark.parametrize(
+        ["value", "kwargs", "expected"],
+        [
+            ["a:1\tb\n", {}, ValueError],
+            ["あ:1\n", {}, ValidationError],
+            [":1\n", {}, ValidationError],
+            ["a b:1\n", {"sanitize": False}, ValidationError],
+            ["a:1\n", {"memo_size": -1}, ValueError],
+            ["a:1\ta:2\n", {}, ValueError],
+            ["a b:1\tab:2\n", {}, ValueError],
+            ["a b:1\tab:2\n", {"memo_size": 0}, ValueError],
+        ],
+    )
+    def test_exception(self, value, kwargs, expected):
+        with pytest.raises(expected):
+            list(LTSVReader(io.StringIO(value), **kwargs))
+
+    def test_exception_duplicate_label(self):
+        with pytest.raises(ValueError) as e:
+            list(LTSVReader(io.StringIO("ab:0\nx:0\ta b:1\tab:2\n")))
+        assert str(e.value) == "duplicate label 'ab': from 'a b' and 'ab' at line 2"
+
+
+class Test_LTSVWriter:
+    def test_normal(self):
+        stream = io.StringIO()
+        writer = LTSVWriter(stream)
+
+        writer.write({"host": "127.0.0.1", "st atus": 200})
+        writer.write_many(LTSV_RECORDS)
+
+        assert stream.getvalue() == (
+            "host:127.0.0.1\tstatus:200\n"
+            "host:127.0.0.1\tstatus:200\tmsg:a:b\n"
+            "host:::1\tstatus:404\n"
+        )
+        assert (
+            list(LTSVReader(io.StringIO(stream.getvalue())))
+            == [{"host": "127.0.0.1", "status": "200"}] + LTSV_RECORDS
+        )
+
+    @pytest.mark.parametrize(
+        ["record", "kwargs"],
+        [
+            [{"a": "x\ty"}, {}],
+            [{"a": "x\ny"}, {}],
+            [{"あ": "x"}, {}],
+            [{"a b": "x"}, {"sanitize": False}],
+        ],
+    )
+    def test_exception(self, record, kwargs):
+        with pytest.raises(ValidationError):
+            LTSVWriter(io.StringIO(), **kwargs).write(record)
+
+    def test_exception_duplicate_label(self):
+        stream = io.StringIO()
+
+        with pytest.raises(ValueError) as e:
+            LTSVWriter(stream).write({"a b": 1, "ab": 2})
+        assert str(e.value) == "duplicate label 'ab': from 'a b' and 'ab'"
+        assert stream.getvalue() == ""
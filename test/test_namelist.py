@@ -0,0 +1,137 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import io
+import mmap
+
+import pytest
+
+from pathvalidate import (
+    FileNameSanitizer,
+    FileNameValidator,
+    FilePathSanitizer,
+    FilePathValidator,
+    NameListSanitizer,
+    NameListValidator,
+)
+
+
+NAMES = ["a.txt", "CON", "con.txt", "b?c", ".hidden", "ok_name-1", "", "x/y", "日本.txt", "last"]
+
+
+def make_list(names, delimiter="\n"):
+    return delimiter.join(names).encode("utf-8")
+
+
+def offset_of(data, name, delimiter=b"\n"):
+    return (delimiter + data).index(delimiter + name.encode("utf-8") + delimiter)
+
+
+class Test_NameListValidator:
+    @pytest.mark.parametrize(
+        ["validator", "expected"],
+        [
+            [FileNameValidator(platform="windows"), ["CON", "con.txt", "b?c", "x/y"]],
+            [FileNameValidator(platform="linux"), ["x/y"]],
+            [FilePathValidator(platform="windows"), ["CON", "con.txt", "b?c"]],
+        ],
+    )
+    def test_normal(self, validator, expected):
+        data = make_list(NAMES)
+        list_validator = NameListValidator(validator)
+
+        assert [entry for _, entry in list_validator.iter_invalid(data)] == [
+            name.encode("utf-8") for name in expected
+        ]
+        assert list(list_validator.find_invalid(data)) == [
+            offset_of(data, name) for name in expected
+        ]
+
+    def test_normal_file(self, tmp_path):
+        path = tmp_path / "manifest.bin"
+        path.write_bytes(make_list(NAMES, "\0") + b"\0" + b"\xff\xfe\0")
+        list_validator = NameListValidator(FileNameValidator(platform="windows"), delimiter="\0")
+
+        output = io.BytesIO()
+        assert list_validator.write_invalid(path, output) == 5
+        assert output.getvalue() == b"CON\0con.txt\0b?c\0x/y\0\xff\xfe\0"
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert len(list_validator.find_invalid(m)) == 5
+
+    def test_normal_empty(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert len(NameListValidator(FileNameValidator()).find_invalid(path)) == 0
+
+    def test_normal_fast_path_info(self):
+        list_validator = NameListValidator(FilePathValidator(platform="windows"))
+        list_validator.find_invalid(b"ab/cd/e.f\n" * 10_000 + b"CON\n")
+
+        fast_path_info = list_validator.fast_path_info()
+        assert fast_path_info.fast == 10_000
+        assert fast_path_info.slow == 1
+
+        # the counts of the scans are added up
+        list_validator.find_invalid(b"CON\n")
+        assert list_validator.fast_path_info() == (10_000, 2)
+
+    @pytest.mark.parametrize(
+        ["kwargs"], [[{"delimiter": "\r\n"}], [{"delimiter": ""}], [{"encoding": "utf-16"}]]
+    )
+    def test_exception(self, kwargs):
+        with pytest.raises(ValueError):
+            NameListValidator(FileNameValidator(), **kwargs)
+
+
+class Test_NameListSanitizer:
+    @pytest.mark.parametrize(
+        ["sanitizer", "expected"],
+        [
+            [
+                FileNameSanitizer(platform="windows"),
+                [
+                    "a.txt",
+                    "CON_",
+                    "con_.txt",
+                    "b_c",
+                    ".hidden",
+                    "ok_name-1",
+                    "x_y",
+                    "日本.txt",
+                    "last",
+                ],
+            ],
+            [
+                FilePathSanitizer(platform="windows"),
+                [
+                    "a.txt",
+                    "CON_",
+                    "con_.txt",
+                    "b_c",
+                    ".hidden",
+                    "ok_name-1",
+                    "x\\y",
+                    "日本.txt",
+                    "last",
+                ],
+            ],
+        ],
+    )
+    def test_normal(self, sanitizer, expected):
+        output = io.BytesIO()
+        list_sanitizer = NameListSanitizer(sanitizer, replacement_text="_")
+
+        assert list_sanitizer.sanitize_to(make_list(NAMES), output) == 4
+        assert output.getvalue() == make_list(expected) + b"\n"
+
+    def test_normal_copy(self):
+        data = make_list(["ab", "cd.txt"] * 1000) + b"\n"
+        output = io.BytesIO()
+        list_sanitizer = NameListSanitizer(FilePathSanitizer(platform="linux"))
+
+        assert list_sanitizer.sanitize_to(data, output) == 0
+        assert output.getvalue() == data
+        assert list_sanitizer.fast_path_info().slow == 0
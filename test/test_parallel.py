@@ -0,0 +1,55 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+from pathlib import Path
+
+import pytest
+
+from pathvalidate import FileNameSanitizer, FilePathSanitizer, sanitize_filepath
+from pathvalidate.parallel import sanitize_parallel
+
+
+class Test_sanitize_parallel:
+    @pytest.mark.parametrize(
+        ["chunk_size", "max_workers"],
+        [
+            [1, 1],
+            [3, 2],
+            [100, 2],
+        ],
+    )
+    def test_normal(self, chunk_size, max_workers):
+        values = [f"dir{i % 3}/fi?le:{i}.txt" for i in range(50)] + [Path("a/b*c")]
+        sanitizer = FilePathSanitizer(platform="windows")
+
+        assert list(
+            sanitize_parallel(
+                iter(values), sanitizer, chunk_size=chunk_size, max_workers=max_workers
+            )
+        ) == [sanitize_filepath(value, platform="windows") for value in values]
+
+    def test_normal_replacement_text(self):
+        sanitizer = FileNameSanitizer(platform="linux")
+
+        assert list(
+            sanitize_parallel(["a/b", "c"], sanitizer, replacement_text="_", max_workers=1)
+        ) == ["a_b", "c"]
+
+    def test_normal_empty(self):
+        assert list(sanitize_parallel([], FileNameSanitizer(), max_workers=1)) == []
+
+    @pytest.mark.parametrize(
+        ["chunk_size", "max_workers"],
+        [
+            [0, 1],
+            [1, 0],
+        ],
+    )
+    def test_exception(self, chunk_size, max_workers):
+        with pytest.raises(ValueError):
+            list(
+                sanitize_parallel(
+                    ["a"], FileNameSanitizer(), chunk_size=chunk_size, max_workers=max_workers
+                )
+            )
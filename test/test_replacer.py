@@ -0,0 +1,57 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import re
+
+import pytest
+
+from pathvalidate._base import BaseFile
+from pathvalidate._replacer import CharReplacer
+
+
+class Test_CharReplacer:
+    @pytest.mark.parametrize(
+        ["value", "replacement_text"],
+        [
+            [value, replacement_text]
+            for value in [
+                "",
+                "report.txt",
+                're:po?rt<>|"*.txt',
+                "a\0b\tc\x7f",
+                "a" * 300 + ":",
+                "新しい:フォルダー?.txt",
+                "\\/",
+            ]
+            for replacement_text in ["", "_", ":", "-_", "　", r"\g<0>"]
+        ],
+    )
+    def test_normal(self, value, replacement_text):
+        replacer = CharReplacer(BaseFile._INVALID_WIN_FILENAME_CHARS)
+
+        assert replacer.sub(replacement_text, value) == replacer.regexp.sub(replacement_text, value)
+
+    def test_normal_many_replacement_texts(self):
+        # more replacement texts than the cached translation tables
+        replacer = CharReplacer(BaseFile._INVALID_WIN_FILENAME_CHARS)
+        value = "a:b?c"
+
+        for _ in range(2):
+            for replacement_text in [chr(c) for c in range(0x20, 0x7F) if chr(c) != "\\"]:
+                assert replacer.sub(replacement_text, value) == replacer.regexp.sub(
+                    replacement_text, value
+                )
+
+    def test_normal_regexp(self):
+        chars = BaseFile._INVALID_WIN_PATH_CHARS
+
+        assert CharReplacer(chars).regexp.pattern == f"[{re.escape(chars)}]"
+
+    def test_exception(self):
+        with pytest.raises(ValueError):
+            CharReplacer("　")
+
+        # same as re.sub: a single backslash is a bad escape
+        with pytest.raises(re.error):
+            CharReplacer(":").sub("\\", "a:b")
@@ -0,0 +1,113 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from pathvalidate import FileNameSanitizer, SQLiteNameIndex
+
+
+def make_candidate(num: int) -> str:
+    return f"a ({num:d})"
+
+
+def claim_many(index: SQLiteNameIndex, count: int) -> list[str]:
+    with index:
+        return [index.claim("a", make_candidate) for _ in range(count)]
+
+
+class Test_SQLiteNameIndex:
+    def test_normal(self, tmp_path):
+        with SQLiteNameIndex(tmp_path / "names.sqlite3") as index:
+            assert index.add("a.txt")
+            assert not index.add("a.txt")
+            assert "a.txt" in index
+            assert "A.txt" not in index
+            assert 1 not in index
+            assert index.add_many(["b.txt", "a.txt", "c.txt", "b.txt"]) == 2
+            assert len(index) == 3
+
+    def test_normal_persistent(self, tmp_path):
+        database = tmp_path / "names.sqlite3"
+
+        with SQLiteNameIndex(database) as index:
+            assert [index.claim("a", make_candidate) for _ in range(3)] == ["a", "a (2)", "a (3)"]
+
+        with SQLiteNameIndex(database) as index:
+            assert index.claim("a", make_candidate) == "a (4)"
+
+    def test_normal_namespace(self, tmp_path):
+        database = tmp_path / "names.sqlite3"
+
+        with (
+            SQLiteNameIndex(database, namespace="x") as x_index,
+            SQLiteNameIndex(database, casefold=True, namespace="y") as y_index,
+        ):
+            assert x_index.add("a")
+            assert y_index.add("a")
+            assert not y_index.add("A")
+            assert len(x_index) == 1
+
+    def test_normal_casefold(self):
+        with SQLiteNameIndex(":memory:", casefold=True) as index:
+            assert index.add("Straße.txt")
+            assert "STRASSE.TXT" in index
+            assert index.claim("strasse.txt", lambda num: f"strasse ({num:d}).txt") == (
+                "strasse (2).txt"
+            )
+
+    def test_normal_batch(self):
+        with SQLiteNameIndex(":memory:") as index:
+            with index.batch():
+                with index.batch():
+                    assert index.claim("a", make_candidate) == "a"
+                assert index.claim("a", make_candidate) == "a (2)"
+
+            with pytest.raises(RuntimeError), index.batch():
+                index.add("b")
+                raise RuntimeError()
+
+            assert "b" not in index
+            assert len(index) == 2
+
+    def test_normal_threads(self):
+        with SQLiteNameIndex(":memory:") as index, ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(executor.map(lambda _: index.claim("a", make_candidate), range(500)))
+
+        assert len(set(names)) == 500
+
+    def test_normal_processes(self, tmp_path):
+        index = SQLiteNameIndex(tmp_path / "names.sqlite3")
+
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(claim_many, [pickle.loads(pickle.dumps(index))] * 4, [50] * 4)
+            )
+
+        names = [name for result in results for name in result]
+        assert len(set(names)) == 200
+        assert len(index) == 200
+        index.close()
+
+    def test_exception_casefold(self, tmp_path):
+        database = tmp_path / "names.sqlite3"
+        SQLiteNameIndex(database, casefold=True).close()
+
+        with pytest.raises(ValueError):
+            SQLiteNameIndex(database, casefold=False)
+
+    def test_normal_sanitize_unique(self, tmp_path):
+        sanitizer = FileNameSanitizer(platform="windows")
+        database = tmp_path / "names.sqlite3"
+
+        with SQLiteNameIndex(database, casefold=True) as index, index.batch():
+            assert [
+                sanitizer.sanitize_unique(value, index)
+                for value in ["a:b.txt", "a?b.txt", "A*B.txt"]
+            ] == ["ab.txt", "ab (2).txt", "AB (3).txt"]
+
+        with SQLiteNameIndex(database, casefold=True) as index:
+            assert sanitizer.sanitize_unique("ab.txt", index) == "ab (4).txt"
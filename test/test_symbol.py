@@ -7,7 +7,11 @@ import itertools
 import pytest
 
 from pathvalidate import (
+    SymbolReplacer,
     ascii_symbols,
+    engine_cache,
+    has_symbol,
+    has_unprintable_char,
     replace_symbol,
     unprintable_ascii_chars,
     validate_symbol,
@@ -47,6 +51,22 @@ class Test_validate_symbol:
         assert e.value.reason == ErrorReason.INVALID_CHARACTER
 
 
+class Test_has_symbol:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["abc" + c + "hoge123", False] for c in alphanum_chars]
+        + [["abc" + c + "hoge123", True] for c in ascii_symbols + unprintable_ascii_chars]
+        + [["あいうえお", False], ["", False], ["a!" * 1000, True]],
+    )
+    def test_normal(self, value, expected):
+        assert has_symbol(value) is expected
+
+    @pytest.mark.parametrize(["value"], [[None], [1]])
+    def test_abnormal(self, value):
+        with pytest.raises(TypeError):
+            has_symbol(value)
+
+
 class Test_replace_symbol:
     TARGET_CHARS = ascii_symbols
     NOT_TARGET_CHARS = alphanum_chars
@@ -113,6 +133,70 @@ class Test_replace_symbol:
             replace_symbol(value)
 
 
+class Test_SymbolReplacer:
+    @pytest.mark.parametrize(
+        ["value", "kwargs", "expected"],
+        [
+            ["!a##b$$$c((((d]]]])", {"replacement_text": "_"}, "_a__b___c____d_____"],
+            [
+                "!a##b__$c((((d]]]])",
+                {"replacement_text": "_", "is_replace_consecutive_chars": True},
+                "_a_b_c_d_",
+            ],
+            [
+                "!a##b$$$c((((d]]]])",
+                {"replacement_text": "-", "is_replace_consecutive_chars": True, "is_strip": True},
+                "a-b-c-d",
+            ],
+            [
+                "a!b!!c",
+                {"replacement_text": "xy", "is_replace_consecutive_chars": True},
+                "axybxyxyc",
+            ],
+            ["/tmp/h!o|g$e.txt", {"exclude_symbols": ["/", "."]}, "/tmp/hoge.txt"],
+            ["/tmp/h!o|g$e.txt", {"exclude_symbols": ascii_symbols}, "/tmp/h!o|g$e.txt"],
+            ["あ!い\tう", {"replacement_text": "_"}, "あ_い_う"],
+            ["", {"replacement_text": "_", "is_strip": True}, ""],
+        ],
+    )
+    def test_normal(self, value, kwargs, expected):
+        replacer = SymbolReplacer(**kwargs)
+
+        assert replacer.replace(value) == expected
+        assert replace_symbol(value, **kwargs) == expected
+
+    def test_normal_cache(self):
+        engine_cache.clear()
+
+        for _ in range(3):
+            replace_symbol("a!b", "_", exclude_symbols=["."], is_replace_consecutive_chars=True)
+
+        cache_info = engine_cache.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
+    @pytest.mark.parametrize(["value"], [[None], [1], [b"a"]])
+    def test_abnormal(self, value):
+        with pytest.raises(TypeError):
+            SymbolReplacer("_").replace(value)
+
+
+class Test_has_unprintable_char:
+    @pytest.mark.parametrize(
+        ["value", "expected"],
+        [["abc" + c + "hoge123", False] for c in alphanum_chars + ascii_symbols]
+        + [["abc" + c + "hoge123", True] for c in unprintable_ascii_chars]
+        + [["あいうえお", False], ["", False]],
+    )
+    def test_normal(self, value, expected):
+        assert has_unprintable_char(value) is expected
+
+    @pytest.mark.parametrize(["value"], [[None], [1]])
+    def test_abnormal(self, value):
+        with pytest.raises(TypeError):
+            has_unprintable_char(value)
+
+
 class Test_validate_unprintable_char:
     VALID_CHARS = alphanum_chars
     INVALID_CHARS = unprintable_ascii_chars
@@ -0,0 +1,100 @@
+"""
+.. codeauthor:: Tsuyoshi Hombashi <tsuyoshi.hombashi@gmail.com>
+"""
+
+import pytest
+
+from pathvalidate import FileNameSanitizer, FileNameTruncator, FilePathSanitizer, LengthUnit
+from pathvalidate._truncator import find_grapheme_boundary
+
+
+FAMILY = "\U0001f468‍\U0001f469‍\U0001f467"
+E_ACUTE = "é"
+FLAG_JP = "\U0001f1ef\U0001f1f5"
+
+
+class Test_find_grapheme_boundary:
+    @pytest.mark.parametrize(
+        ["text", "index", "expected"],
+        [
+            ["abc", 2, 2],
+            [f"a{E_ACUTE}b", 2, 1],
+            [f"a{E_ACUTE}b", 3, 3],
+            [f"a{FAMILY}", 2, 1],
+            [f"a{FAMILY}", 4, 1],
+            [f"a{FAMILY}b", 6, 6],
+            ["a\U0001f44d\U0001f3fd", 2, 1],
+            [FLAG_JP * 2, 1, 0],
+            [FLAG_JP * 2, 2, 2],
+            [FLAG_JP * 2, 3, 2],
+            ["각", 2, 0],
+        ],
+    )
+    def test_normal(self, text, index, expected):
+        assert find_grapheme_boundary(text, index) == expected
+
+
+class Test_FileNameTruncator:
+    @pytest.mark.parametrize(
+        ["value", "max_len", "expected"],
+        [
+            ["abcdefgh.txt", 12, "abcdefgh.txt"],
+            ["abcdefghij.txt", 12, "abcdefgh.txt"],
+            ["abcdefghij.tar.gz", 12, "abcde.tar.gz"],
+            ["abcdefghij.a.b.c", 12, "abcdefgh.b.c"],
+            ["abcdefghij.verylongextension", 12, "abcdefghij.v"],
+            ["abcdefghijklmn", 12, "abcdefghijkl"],
+            [f"abcd{E_ACUTE}fghij.txt", 9, "abcd.txt"],
+            [f"ab{FAMILY}cdefg.txt", 10, "ab.txt"],
+            ["abcdefghij.txt", 4, "abcd"],
+        ],
+    )
+    def test_normal(self, value, max_len, expected):
+        truncated = FileNameTruncator().truncate(value, max_len, length_unit=LengthUnit.CODE_POINTS)
+
+        assert truncated == expected
+        assert len(truncated) <= max_len
+
+    def test_normal_bytes(self):
+        truncated = FileNameTruncator().truncate("あいうえお.txt", 12, fs_encoding="utf-8")
+
+        assert truncated == "あい.txt"
+
+    def test_normal_hash(self):
+        truncator = FileNameTruncator(hash_len=8)
+        a = truncator.truncate("a" * 300 + "1.txt", 20, length_unit=LengthUnit.CODE_POINTS)
+        b = truncator.truncate("a" * 300 + "2.txt", 20, length_unit=LengthUnit.CODE_POINTS)
+
+        assert a != b
+        assert len(a) == len(b) == 20
+        assert a.startswith("aaaaaaa~") and a.endswith(".txt")
+        assert a == truncator.truncate("a" * 300 + "1.txt", 20, length_unit=LengthUnit.CODE_POINTS)
+        assert truncator.truncate("short.txt", 20) == "short.txt"
+
+    def test_normal_no_extension(self):
+        truncator = FileNameTruncator(keep_extension=False)
+
+        assert truncator.truncate("abcdefghij.txt", 12, length_unit=LengthUnit.CODE_POINTS) == (
+            "abcdefghij.t"
+        )
+
+    @pytest.mark.parametrize(
+        ["kwargs"],
+        [[{"max_extension_parts": 0}], [{"max_extension_len": 0}], [{"hash_len": 65}]],
+    )
+    def test_exception(self, kwargs):
+        with pytest.raises(ValueError):
+            FileNameTruncator(**kwargs)
+
+
+class Test_sanitizer_truncator:
+    def test_normal_filename(self):
+        sanitizer = FileNameSanitizer(max_len=16, truncator=FileNameTruncator())
+
+        assert sanitizer.sanitize("report:" + "x" * 100 + ".tar.gz") == "reportxxx.tar.gz"
+        assert sanitizer.sanitize("a" * 15) == "a" * 15
+
+    def test_normal_filepath(self):
+        sanitizer = FilePathSanitizer(platform="linux", max_len=20, truncator=FileNameTruncator())
+
+        assert sanitizer.sanitize("dir/" + "a" * 300 + ".txt") == "dir/" + "a" * 16 + ".txt"